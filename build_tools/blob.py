@@ -23,20 +23,49 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-import array
-import functools
+# Blobs at least this large are written as a string literal, see below
+LITERAL_THRESHOLD = 4096
+
+# How each byte is written in a string literal. Printable characters are
+# written as they are, except for those with a special meaning in a literal
+# or to the preprocessor (trigraphs and line splices). Octal escapes are
+# always three digits long, so a following digit can't extend them.
+_literal_chars = [
+    chr(b) if 0x20 <= b < 0x7F and chr(b) not in '"\\?' else "\\%03o" % b
+    for b in range(256)
+]
 
 
 def bytesToCppArray(code, symbol, data):
     """
     Output an array of bytes to a code formatter as a c++ array declaration.
+
+    Small arrays are written as a list of hex values. Large arrays are
+    written as a string literal instead, which compilers parse many times
+    faster. The array then has an additional null terminator, so its size
+    should not be used as the size of the data.
     """
-    code("const std::uint8_t ${symbol}[] = {")
+    if len(data) < LITERAL_THRESHOLD:
+        code("const std::uint8_t ${symbol}[] = {")
+        step = 16
+        lines = [
+            "".join("0x%02x," % b for b in data[i : i + step])
+            for i in range(0, len(data), step)
+        ]
+        end = "};"
+    else:
+        code("const std::uint8_t ${symbol}[] =")
+        step = 64
+        lines = [
+            '"%s"' % "".join(_literal_chars[b] for b in data[i : i + step])
+            for i in range(0, len(data), step)
+        ]
+        lines[-1] += ";"
+        end = None
+    # Append the lines directly rather than formatting them, as a literal
+    # may contain $ characters.
     code.indent()
-    step = 16
-    for i in range(0, len(data), step):
-        x = array.array("B", data[i : i + step])
-        strs = map(lambda i: f"{i},", x)
-        code(functools.reduce(lambda x, y: x + y, strs))
+    code.append("\n".join(lines))
     code.dedent()
-    code("};")
+    if end:
+        code(end)
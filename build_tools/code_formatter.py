@@ -46,6 +46,27 @@ import os
 import re
 
 
+def write_if_changed(filename, data):
+    """Write data to filename, unless the file already has exactly that
+    content. Leaving unchanged files untouched keeps their timestamps, so
+    neither SCons nor timestamp based tools (e.g., ccache) see a change. The
+    file is replaced atomically so a partially written file is never
+    visible.
+    """
+    try:
+        with open(filename) as f:
+            if f.read() == data:
+                return False
+    except (OSError, UnicodeDecodeError):
+        pass
+
+    tmp = f"{filename}.tmp{os.getpid()}"
+    with open(tmp, "w") as f:
+        f.write(data)
+    os.replace(tmp, filename)
+    return True
+
+
 class lookup:
     def __init__(self, formatter, frame, *args, **kwargs):
         self.frame = frame
@@ -123,6 +144,12 @@ class code_formatter_meta(type):
                 "rdb": re.escape(rb2 + rb1),
             }
         cls.pattern = re.compile(pat, re.VERBOSE | re.DOTALL | re.MULTILINE)
+        # Format strings parsed with this pattern, see _compile()
+        cls._templates = {}
+
+
+# Kinds of substitution in a compiled format string
+_LONE, _IDENT, _POS, _EVAL = range(4)
 
 
 class code_formatter(metaclass=code_formatter_meta):
@@ -171,14 +198,15 @@ class code_formatter(metaclass=code_formatter_meta):
         self._data = []
 
     def write(self, *args):
-        f = open(os.path.join(*args), "w")
-        name, extension = os.path.splitext(f.name)
+        filename = os.path.join(*args)
+        name, extension = os.path.splitext(filename)
+        data = []
 
         # Add a comment to inform which file generated the generated file
         # to make it easier to backtrack and modify generated code
         frame = inspect.currentframe().f_back
         if re.match(r"^\.(cc|hh|c|h)$", extension) is not None:
-            f.write(
+            data.append(
                 f"""/**
  * DO NOT EDIT THIS FILE!
  * File automatically generated by
@@ -188,7 +216,7 @@ class code_formatter(metaclass=code_formatter_meta):
 """
             )
         elif re.match(r"^\.py$", extension) is not None:
-            f.write(
+            data.append(
                 f"""#
 # DO NOT EDIT THIS FILE!
 # File automatically generated by
@@ -198,7 +226,7 @@ class code_formatter(metaclass=code_formatter_meta):
 """
             )
         elif re.match(r"^\.html$", extension) is not None:
-            f.write(
+            data.append(
                 f"""<!--
  DO NOT EDIT THIS FILE!
  File automatically generated by
@@ -208,9 +236,8 @@ class code_formatter(metaclass=code_formatter_meta):
 """
             )
 
-        for data in self._data:
-            f.write(data)
-        f.close()
+        data.extend(self._data)
+        write_if_changed(filename, "".join(data))
 
     def __str__(self):
         data = "".join(self._data)
@@ -255,6 +282,65 @@ class code_formatter(metaclass=code_formatter_meta):
 
             initial_newline = False
 
+    # The number of compiled format strings kept per class
+    max_templates = 4096
+
+    @classmethod
+    def _compile(cls, format):
+        """Parse a format string into a list of literal strings and
+        substitutions. Expressions are compiled to code objects. The result
+        is cached, as generators typically use the same format strings many
+        times. Returns None for format strings with ill-formed delimiters,
+        which are left to the uncompiled path to report."""
+        try:
+            return cls._templates[format]
+        except KeyError:
+            pass
+
+        segments = []
+        literal = []
+        end = 0
+        for match in cls.pattern.finditer(format):
+            literal.append(format[end : match.start()])
+            end = match.end()
+
+            ident = match.group("lone")
+            if ident:
+                segment = (_LONE, ident, match.group("indent"))
+            elif (match.group("ident") or match.group("b_ident")) is not None:
+                segment = (
+                    _IDENT,
+                    match.group("ident") or match.group("b_ident"),
+                )
+            elif (match.group("pos") or match.group("b_pos")) is not None:
+                segment = (
+                    _POS,
+                    int(match.group("pos") or match.group("b_pos")),
+                )
+            elif match.group("eval") is not None:
+                # eval() ignores leading whitespace in a string, but
+                # compile() does not
+                expr = match.group("eval").lstrip(" \t")
+                segment = (_EVAL, compile(expr, "<string>", "eval"))
+            elif match.group("escaped") is not None:
+                literal.append("$")
+                continue
+            else:
+                return None
+
+            if any(literal):
+                segments.append("".join(literal))
+            literal = []
+            segments.append(segment)
+        literal.append(format[end:])
+        if any(literal):
+            segments.append("".join(literal))
+
+        if len(cls._templates) >= cls.max_templates:
+            cls._templates.clear()
+        cls._templates[format] = segments
+        return segments
+
     def __call__(self, *args, **kwargs):
         if not args:
             self._data.append("\n")
@@ -263,10 +349,20 @@ class code_formatter(metaclass=code_formatter_meta):
         format = args[0]
         args = args[1:]
 
+        segments = self._compile(format)
+        if segments is not None and all(type(s) is str for s in segments):
+            # Nothing to substitute, no need to look at the caller
+            self._append("".join(segments))
+            return
+
         frame = inspect.currentframe().f_back
 
         l = lookup(self, frame, *args, **kwargs)
 
+        if segments is not None:
+            self._append(self._render(segments, l, args))
+            return
+
         def convert(match):
             ident = match.group("lone")
             # check for a lone identifier
@@ -293,7 +389,7 @@ class code_formatter(metaclass=code_formatter_meta):
                 if pos > len(args):
                     raise ValueError(
                         "Positional parameter #%d not found in pattern" % pos,
-                        code_formatter.pattern,
+                        self.pattern,
                     )
                 return f"{args[int(pos)]}"
 
@@ -312,7 +408,7 @@ class code_formatter(metaclass=code_formatter_meta):
                 # didn't match invalid!
                 raise ValueError(
                     "Unrecognized named group in pattern",
-                    code_formatter.pattern,
+                    self.pattern,
                 )
 
             i = match.start("invalid")
@@ -328,9 +424,37 @@ class code_formatter(metaclass=code_formatter_meta):
                     "Invalid format string: line %d, col %d" % (lineno, colno)
                 )
 
-        d = code_formatter.pattern.sub(convert, format)
+        d = self.pattern.sub(convert, format)
         self._append(d)
 
+    def _render(self, segments, l, args):
+        """Substitute into a compiled format string. This must match the
+        conversions done by __call__."""
+        result = []
+        for segment in segments:
+            if type(segment) is str:
+                result.append(segment)
+                continue
+
+            kind = segment[0]
+            if kind == _IDENT:
+                result.append(f"{l[segment[1]]}")
+            elif kind == _LONE:
+                indent = segment[2]
+                lone = f"{l[segment[1]]}"
+                result.extend(indent + line for line in lone.splitlines(True))
+            elif kind == _POS:
+                pos = segment[1]
+                if pos > len(args):
+                    raise ValueError(
+                        "Positional parameter #%d not found in pattern" % pos,
+                        self.pattern,
+                    )
+                result.append(f"{args[pos]}")
+            else:
+                result.append(f"{eval(segment[1], {}, l)}")
+        return "".join(result)
+
 
 __all__ = ["code_formatter"]
 
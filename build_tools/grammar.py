@@ -24,6 +24,7 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import hashlib
 import os
 
 import ply.lex
@@ -37,6 +38,11 @@ class ParseError(Exception):
 
 
 class Grammar:
+    # The environment variable naming the directory in which parse tables
+    # are cached. Tables are named after a hash of their grammar, so all
+    # grammars, and all versions of a grammar, can share the directory.
+    table_dir_env = "GEM5_GRAMMAR_TABLE_DIR"
+
     def setupLexerFactory(self, **kwargs):
         if "module" in kwargs:
             raise AttributeError("module is an illegal attribute")
@@ -53,6 +59,9 @@ class Grammar:
             kwargs["outputdir"] = dir
             kwargs["tabmodule"] = tab[:-3]
 
+        # Don't write parser.out next to the grammar's source
+        kwargs.setdefault("debug", False)
+
         self.yacc_kwargs = kwargs
 
     def __getattr__(self, attr):
@@ -70,10 +79,13 @@ class Grammar:
 
         if attr == "lex":
             self.lex = ply.lex.lex(module=self, **self.lex_kwargs)
+            # The rules have been validated while building the lexer, so
+            # skip checking the type of every token returned by a rule.
+            self.lex.lexoptimize = True
             return self.lex
 
         if attr == "yacc":
-            self.yacc = ply.yacc.yacc(module=self, **self.yacc_kwargs)
+            self.yacc = self.buildParser()
             return self.yacc
 
         if attr == "current_lexer":
@@ -95,6 +107,47 @@ class Grammar:
             f"'{type(self)}' object has no attribute '{attr}'"
         )
 
+    def grammarDigest(self):
+        """A hash of everything the parse tables are generated from."""
+        pdict = {k: getattr(self, k) for k in dir(self)}
+        if "start" in self.yacc_kwargs:
+            pdict["start"] = self.yacc_kwargs["start"]
+        pinfo = ply.yacc.ParserReflect(pdict, log=ply.yacc.NullLogger())
+        pinfo.get_all()
+        h = hashlib.sha256()
+        h.update(ply.yacc.__tabversion__.encode())
+        h.update(self.yacc_kwargs.get("method", "LALR").encode())
+        h.update(pinfo.signature().encode())
+        return h.hexdigest()
+
+    def buildParser(self):
+        kwargs = dict(self.yacc_kwargs)
+        table_dir = os.environ.get(self.table_dir_env)
+        if not table_dir or "picklefile" in kwargs or "tabmodule" in kwargs:
+            # Without a cache, generate the tables rather than writing them
+            # (and possibly picking up stale ones) next to the source.
+            if "tabmodule" not in kwargs:
+                kwargs.setdefault("write_tables", False)
+            return ply.yacc.yacc(module=self, **kwargs)
+
+        name = f"{type(self).__name__}-{self.grammarDigest()[:16]}.pickle"
+        path = os.path.join(table_dir, name)
+        if os.path.exists(path):
+            try:
+                return ply.yacc.yacc(module=self, picklefile=path, **kwargs)
+            except Exception:
+                # A damaged table file, generate it again
+                pass
+
+        # Write the tables to a temporary file first so other processes
+        # never see a partially written file.
+        os.makedirs(table_dir, exist_ok=True)
+        tmp = f"{path}.tmp{os.getpid()}"
+        parser = ply.yacc.yacc(module=self, picklefile=tmp, **kwargs)
+        if os.path.exists(tmp):
+            os.replace(tmp, path)
+        return parser
+
     def parse_string(self, data, source="<string>", debug=None, tracking=0):
         if not isinstance(data, str):
             raise AttributeError(
@@ -62,9 +62,17 @@ from code_formatter import code_formatter
 # library.  To do that, we compile the file to byte code, marshal the
 # byte code, compress it, and then generate a c++ file that
 # inserts the result into an array.
-
-if len(sys.argv) < 4:
-    print(f"Usage: {sys.argv[0]} CPP PY MODPATH ABSPATH", file=sys.stderr)
+#
+# If a zlib dictionary is given, it is used to compress the module. The
+# same dictionary must be embedded into gem5 to decompress it. Sharing a
+# dictionary of common names between the modules makes each of them
+# smaller.
+
+if len(sys.argv) not in (5, 6):
+    print(
+        f"Usage: {sys.argv[0]} CPP PY MODPATH ABSPATH [ZDICT]",
+        file=sys.stderr,
+    )
     sys.exit(1)
 
 # Set the Python's locale settings manually based on the `LC_CTYPE`
@@ -72,7 +80,12 @@ if len(sys.argv) < 4:
 if "LC_CTYPE" in os.environ:
     locale.setlocale(locale.LC_CTYPE, os.environ["LC_CTYPE"])
 
-_, cpp, python, modpath, abspath = sys.argv
+cpp, python, modpath, abspath = sys.argv[1:5]
+
+zdict = None
+if len(sys.argv) > 5:
+    with open(sys.argv[5], "rb") as f:
+        zdict = f.read()
 
 with open(python) as f:
     src = f.read()
@@ -80,7 +93,11 @@ with open(python) as f:
 compiled = compile(src, python, "exec")
 marshalled = marshal.dumps(compiled)
 
-compressed = zlib.compress(marshalled)
+if zdict:
+    compressor = zlib.compressobj(zdict=zdict)
+else:
+    compressor = zlib.compressobj()
+compressed = compressor.compress(marshalled) + compressor.flush()
 
 code = code_formatter()
 code(
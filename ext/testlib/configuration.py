@@ -226,6 +226,7 @@ def define_defaults(defaults):
         os.path.join(absdirpath(__file__), os.pardir, os.pardir)
     )
     defaults.result_path = os.path.join(os.getcwd(), "testing-results")
+    defaults.result_cache_path = os.path.join(os.getcwd(), "testing-cache")
     defaults.resource_url = "http://dist.gem5.org/dist/develop"
     defaults.resource_path = os.path.abspath(
         os.path.join(defaults.base_dir, "tests", "gem5", "resources")
@@ -333,6 +334,7 @@ def define_constants(constants):
     constants.gem5_binary_fixture_name = "gem5"
     constants.xml_filename = "results.xml"
     constants.pickle_filename = "results.pickle"
+    constants.timing_db_filename = "timing.json"
     constants.pickle_protocol = highest_pickle_protocol
 
     # The root directory which all test names will be based off of.
@@ -364,6 +366,18 @@ def define_post_processors(config):
             build_dir = (os.path.join(base_dir, "build"),)
         return build_dir
 
+    def set_default_timing_db(timing_db):
+        """
+        Post-processor to store the timing database with the results by
+        default.
+        """
+        if not timing_db or timing_db[0] is None:
+            result_path = config._lookup_val("result_path")[0]
+            timing_db = (
+                os.path.join(result_path, constants.timing_db_filename),
+            )
+        return timing_db
+
     def fix_verbosity_hack(verbose):
         return (verbose[0].val,)
 
@@ -428,6 +442,7 @@ def define_post_processors(config):
             return (new_positional_tags_list,)
 
     config._add_post_processor("build_dir", set_default_build_dir)
+    config._add_post_processor("timing_db", set_default_timing_db)
     config._add_post_processor("verbose", fix_verbosity_hack)
     config._add_post_processor("isa", default_isa)
     config._add_post_processor("variant", default_variant)
@@ -522,6 +537,23 @@ class StorePositionalTagsAction(StorePositionAction):
     position_kword = "tag_filters"
 
 
+def parse_shard(shard):
+    """
+    Parse a shard given as ``i/N``, returning the tuple ``(i, N)``.
+    """
+    try:
+        index, count = (int(val) for val in shard.split("/"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"Invalid shard '{shard}', expected i/N."
+        )
+    if count < 1 or not 1 <= index <= count:
+        raise argparse.ArgumentTypeError(
+            f"Invalid shard '{shard}', expected 1 <= i <= N."
+        )
+    return (index, count)
+
+
 def define_common_args(config):
     """
     Common args are arguments which are likely to be simular between different
@@ -607,7 +639,24 @@ def define_common_args(config):
             "--test-threads",
             action="store",
             default=1,
-            help="Number of threads to spawn to run concurrent tests with.",
+            help="Number of processes to spawn to run concurrent test suites "
+            "with.",
+        ),
+        Argument(
+            "--shard",
+            action="store",
+            default=None,
+            type=parse_shard,
+            help="Only run shard i of N (i/N, e.g., 1/4). Suites are split "
+            "between the shards by a hash of their UID.",
+        ),
+        Argument(
+            "--timing-db",
+            action="store",
+            default=None,
+            help="Path of the database of suite durations used to run the "
+            "longest suites first. It's updated after each run. Defaults to "
+            "timing.json in the results directory.",
         ),
         Argument(
             "-v",
@@ -633,6 +682,20 @@ def define_common_args(config):
             action="store",
             help="The path to store results in.",
         ),
+        Argument(
+            "--no-cache",
+            action="store_true",
+            default=False,
+            help="Always run gem5, rather than reusing the outputs of an "
+            "earlier run with identical inputs.",
+        ),
+        Argument(
+            "--result-cache-path",
+            action="store",
+            default=config._defaults.result_cache_path,
+            help="Directory in which the outputs of gem5 runs are cached. It "
+            "can be shared between machines.",
+        ),
         Argument(
             "--bin-path",
             action="store",
@@ -707,6 +770,10 @@ class RunParser(ArgParser):
         common_args.bin_path.add_to(parser)
         common_args.threads.add_to(parser)
         common_args.test_threads.add_to(parser)
+        common_args.shard.add_to(parser)
+        common_args.timing_db.add_to(parser)
+        common_args.no_cache.add_to(parser)
+        common_args.result_cache_path.add_to(parser)
         common_args.isa.add_to(parser)
         common_args.variant.add_to(parser)
         common_args.length.add_to(parser)
@@ -792,6 +859,10 @@ class RerunParser(ArgParser):
         common_args.bin_path.add_to(parser)
         common_args.threads.add_to(parser)
         common_args.test_threads.add_to(parser)
+        common_args.shard.add_to(parser)
+        common_args.timing_db.add_to(parser)
+        common_args.no_cache.add_to(parser)
+        common_args.result_cache_path.add_to(parser)
         common_args.isa.add_to(parser)
         common_args.variant.add_to(parser)
         common_args.length.add_to(parser)
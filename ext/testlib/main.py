@@ -37,6 +37,7 @@ import testlib.query as query
 import testlib.result as result
 import testlib.runner as runner
 import testlib.terminal as terminal
+import testlib.timing as timing
 import testlib.uid as uid
 
 
@@ -301,7 +302,20 @@ def run_schedule(test_schedule, log_handler):
           * Test Fixture Teardown
        * Suite Fixture Teardown
     * Global Fixture Teardown
+
+    Suites are run longest first, based on their durations in the timing
+    database. If a shard is given only the suites in that shard are run.
     """
+    timing_db = timing.TimingDatabase(configuration.config.timing_db)
+    suites = test_schedule.suites
+    if configuration.config.shard is not None:
+        index, count = configuration.config.shard
+        suites = timing.shard(suites, index, count)
+        log.test_log.message(
+            f"Running shard {index}/{count}: {len(suites)} of "
+            f"{len(test_schedule.suites)} suites"
+        )
+    test_schedule.suites = timing.schedule(suites, timing_db)
 
     log_handler.schedule_finalized(test_schedule)
 
@@ -323,6 +337,10 @@ def run_schedule(test_schedule, log_handler):
         library_runner = runner.LibraryRunner(test_schedule)
     library_runner.run()
 
+    for suite_uid, duration in library_runner.durations.items():
+        timing_db.update(suite_uid, duration)
+    timing_db.save()
+
     failed = log_handler.unsuccessful()
 
     log_handler.finish_testing()
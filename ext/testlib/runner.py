@@ -38,7 +38,7 @@
 #
 # Authors: Sean Wilson
 
-import multiprocessing.dummy
+import multiprocessing
 import traceback
 
 import testlib.helper as helper
@@ -168,18 +168,91 @@ class SuiteRunner(RunnerPattern):
 
 
 class LibraryRunner(SuiteRunner):
-    pass
+    def __init__(self, loaded_testable):
+        super().__init__(loaded_testable)
+        # The wall clock time each suite took to run, keyed by suite UID.
+        self.durations = {}
+
+    def test(self):
+        for suite in self.testable:
+            timer = helper.Timer()
+            suite.runner(suite).run()
+            self.durations[suite.uid] = timer.stop()
+        self.testable.result = compute_aggregate_result(iter(self.testable))
 
 
-class LibraryParallelRunner(RunnerPattern):
+# The library being run by a LibraryParallelRunner. Worker processes are
+# forked, so they inherit it rather than having it pickled.
+_parallel_library = None
+
+
+def _run_parallel_suite(index):
+    suite = _parallel_library.suites[index]
+    timer = helper.Timer()
+    try:
+        suite.runner(suite).run()
+    except Exception:
+        suite.result = Result(Result.Errored, traceback.format_exc())
+    duration = timer.stop()
+    tests = [
+        (
+            test.metadata.status,
+            test.metadata.result,
+            getattr(test.metadata, "time", None),
+        )
+        for test in suite
+    ]
+    return (
+        index,
+        suite.metadata.status,
+        suite.metadata.result,
+        tests,
+        duration,
+    )
+
+
+class LibraryParallelRunner(LibraryRunner):
+    """
+    Runs each suite in a separate worker process. The suites are started in
+    the order they appear in the library, so it should be ordered by
+    expected duration (longest first) to keep all workers busy until the
+    end of the run.
+
+    Global fixtures are set up in this process before the workers are
+    forked. Results and output are reported through the log, which forwards
+    them from the workers to this process.
+    """
+
     def set_threads(self, threads):
         self.threads = threads
 
     def test(self):
-        pool = multiprocessing.dummy.Pool(self.threads)
-        pool.map(lambda suite: suite.runner(suite).run(), self.testable)
+        global _parallel_library
+        _parallel_library = self.testable
+        ctx = multiprocessing.get_context("fork")
+        try:
+            with ctx.Pool(self.threads) as pool:
+                for result in pool.imap_unordered(
+                    _run_parallel_suite, range(len(self.testable.suites))
+                ):
+                    self._update_suite(*result)
+        finally:
+            _parallel_library = None
         self.testable.result = compute_aggregate_result(iter(self.testable))
 
+    def _update_suite(self, index, status, result, tests, duration):
+        # The workers already logged these results, so update the metadata
+        # directly rather than logging them again.
+        suite = self.testable.suites[index]
+        suite.metadata.status = status
+        suite.metadata.result = result
+        for test, (status, result, time) in zip(suite, tests):
+            test.metadata.status = status
+            test.metadata.result = result
+            if time is not None:
+                test.time = time
+        self.durations[suite.uid] = duration
+
 
 class BrokenFixtureException(Exception):
     def __init__(self, fixture, testitem, trace):
@@ -0,0 +1,122 @@
+# Copyright (c) 2026 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+A persistent database of how long each test suite took to run.
+
+The durations are used to schedule the longest suites first, so that a
+parallel run doesn't finish with a few slow suites running on otherwise idle
+workers.
+"""
+
+import hashlib
+import json
+import os
+
+
+class TimingDatabase:
+    """A mapping from suite UIDs to their last run duration in seconds."""
+
+    def __init__(self, path):
+        self.path = path
+        self.durations = {}
+        self._updated = {}
+        if path and os.path.isfile(path):
+            self.durations = self._read()
+
+    def _read(self):
+        try:
+            with open(self.path) as f:
+                durations = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(durations, dict):
+            return {}
+        return durations
+
+    def get(self, uid, default=None):
+        return self.durations.get(str(uid), default)
+
+    def estimate(self, uid):
+        """
+        Returns the expected duration of the suite. Suites which have not
+        been run before are assumed to take the mean duration of the known
+        suites.
+        """
+        duration = self.get(uid)
+        if duration is not None:
+            return duration
+        if not self.durations:
+            return 1.0
+        return sum(self.durations.values()) / len(self.durations)
+
+    def update(self, uid, duration):
+        self.durations[str(uid)] = duration
+        self._updated[str(uid)] = duration
+
+    def save(self):
+        """
+        Write the database. Entries written by other runs since this database
+        was loaded are kept, unless this run updated them.
+        """
+        if not self.path or not self._updated:
+            return
+        durations = self._read()
+        durations.update(self._updated)
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(durations, f, indent=2, sort_keys=True)
+        os.replace(tmp, self.path)
+
+
+def schedule(suites, database):
+    """
+    Returns the suites ordered from the longest to the shortest expected
+    duration. Suites with equal durations are ordered by UID.
+    """
+    return sorted(
+        suites,
+        key=lambda suite: (-database.estimate(suite.uid), str(suite.uid)),
+    )
+
+
+def shard(suites, index, count):
+    """
+    Returns the suites in shard ``index`` of ``count`` (1-based).
+
+    Suites are assigned to shards by a hash of their UID, so every suite is
+    run by exactly one shard regardless of the machine or the timing database
+    each shard is run with.
+    """
+
+    def shard_of(suite):
+        digest = hashlib.sha256(str(suite.uid).encode()).digest()
+        return int.from_bytes(digest[:8], "big") % count
+
+    return [suite for suite in suites if shard_of(suite) == index - 1]
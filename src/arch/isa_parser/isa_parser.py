@@ -37,6 +37,7 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import io
 import os
 import re
 import sys
@@ -45,6 +46,7 @@ import traceback
 # get type names
 from types import *
 
+from code_formatter import write_if_changed
 from grammar import Grammar
 
 from .operand_list import *
@@ -62,54 +64,65 @@ debug = False
 labelRE = re.compile(r"(?<!%)%\(([^\)]+)\)[sd]")
 
 
+class SubstDict:
+    """A read-only, layered view of the dictionaries used for a template
+    substitution. Earlier dictionaries take precedence over later ones, and
+    hidden keys are never found. This avoids copying the (large) template
+    namespace for every substitution."""
+
+    def __init__(self, *dicts, hidden=()):
+        self.dicts = dicts
+        self.hidden = hidden
+
+    def __getitem__(self, key):
+        if key not in self.hidden:
+            for d in self.dicts:
+                if key in d:
+                    return d[key]
+        raise KeyError(key)
+
+
 class Template:
     def __init__(self, parser, t):
         self.parser = parser
         self.template = t
+        self._compiled = None
+
+    def compile(self):
+        """Do the parts of the substitution which only depend on the
+        template text once. Returns the template with its non-substitution
+        percents protected and the labels it references."""
+        if self._compiled is None or self._compiled[0] is not self.template:
+            # Protect non-Python-dict substitutions (e.g. if there's a
+            # printf in the templated C++ code)
+            template = protectNonSubstPercents(self.template)
+            labels = list(dict.fromkeys(labelRE.findall(template)))
+            self._compiled = (self.template, template, labels)
+        return self._compiled[1:]
 
     def subst(self, d):
-        myDict = None
-
-        # Protect non-Python-dict substitutions (e.g. if there's a printf
-        # in the templated C++ code)
-        template = protectNonSubstPercents(self.template)
-
-        # Build a dict ('myDict') to use for the template substitution.
-        # Start with the template namespace.  Make a copy since we're
-        # going to modify it.
-        myDict = self.parser.templateMap.copy()
+        template, labels = self.compile()
 
         if isinstance(d, InstObjParams):
             # If we're dealing with an InstObjParams object, we need
             # to be a little more sophisticated.  The instruction-wide
             # parameters are already formed, but the parameters which
             # are only function wide still need to be generated.
-            compositeCode = ""
-
-            myDict.update(d.__dict__)
-            # The "operands" and "snippets" attributes of the InstObjParams
-            # objects are for internal use and not substitution.
-            del myDict["operands"]
-            del myDict["snippets"]
-
-            snippetLabels = [
-                l for l in labelRE.findall(template) if l in d.snippets
-            ]
+            myDict = {}
 
             snippets = {
                 s: self.parser.mungeSnippet(d.snippets[s])
-                for s in snippetLabels
+                for s in labels
+                if s in d.snippets
             }
 
             myDict.update(snippets)
 
-            compositeCode = " ".join(list(map(str, snippets.values())))
-
             # Add in template itself in case it references any
             # operands explicitly (like Mem)
-            compositeCode += " " + template
+            code = [str(s) for s in snippets.values()] + [template]
 
-            operands = SubOperandList(self.parser, compositeCode, d.operands)
+            operands = SubOperandList(self.parser, code, d.operands)
 
             myDict["reg_idx_arr_decl"] = (
                 "RegId srcRegIdxArr[%d]; RegId destRegIdxArr[%d]"
@@ -176,12 +189,20 @@ class Template:
                     op_wb_str = op_desc.op_wb + op_wb_str
             myDict["op_wb"] = op_wb_str
 
+            # The "operands" and "snippets" attributes of the InstObjParams
+            # objects are for internal use and not substitution.
+            myDict = SubstDict(
+                myDict,
+                d.__dict__,
+                self.parser.templateMap,
+                hidden=("operands", "snippets"),
+            )
         elif isinstance(d, dict):
             # if the argument is a dictionary, we just use it.
-            myDict.update(d)
+            myDict = SubstDict(d, self.parser.templateMap)
         elif hasattr(d, "__dict__"):
             # if the argument is an object, we use its attribute map.
-            myDict.update(d.__dict__)
+            myDict = SubstDict(d.__dict__, self.parser.templateMap)
         else:
             raise TypeError("Template.subst() arg must be or have dictionary")
         return template % myDict
@@ -512,6 +533,20 @@ class InstObjParams:
 #
 
 
+class OutputFile(io.StringIO):
+    """An output file which is staged in memory. When it is closed, the file
+    on disk is replaced atomically, and only if its contents have changed."""
+
+    def __init__(self, name):
+        super().__init__()
+        self.name = name
+
+    def close(self):
+        if not self.closed:
+            write_if_changed(self.name, self.getvalue())
+        super().close()
+
+
 class ISAParser(Grammar):
     def __init__(self, output_dir, decoder_name="Decoder"):
         super().__init__()
@@ -530,6 +565,10 @@ class ISAParser(Grammar):
         self._operandsRE = None
         self._operandsWithExtRE = None
 
+        # Caches of results which depend on the operand regular expressions
+        self._mungedSnippets = {}
+        self._operandRefs = {}
+
         # This dictionary maps format name strings to Format objects.
         self.formatMap = {}
 
@@ -640,6 +679,37 @@ class ISAParser(Grammar):
 
         return f
 
+    splitRE = re.compile(r"\n#endif\n#if __SPLIT == \d+\n")
+
+    def split_file_name(self, filename, i):
+        """The name of the i'th chunk of a split file, e.g.
+        decoder-ns.cc.inc -> decoder-ns-1.cc.inc."""
+        return re.sub(r"-ns\.cc\.inc$", "-ns-%d.cc.inc" % i, filename)
+
+    # Write each chunk of a split file to a file of its own, and replace the
+    # split file with one which #include's the chunks. Each top-level file
+    # only includes its own chunk, so a change which is confined to one
+    # chunk only requires that chunk to be recompiled.
+    def write_split_files(self, filename, f):
+        header = ISAParser.scaremonger_template % self
+        first = "#if !defined(__SPLIT) || (__SPLIT == 1)\n"
+        contents = f.getvalue()
+        assert contents.startswith(header + first)
+        assert contents.endswith("\n#endif\n")
+        body = contents[len(header + first) : -len("\n#endif\n")]
+        chunks = self.splitRE.split(body)
+        assert len(chunks) == self.splits[f]
+
+        f.seek(0)
+        f.truncate()
+        f.write(header)
+        for i, chunk in enumerate(chunks, 1):
+            fn = self.split_file_name(filename, i)
+            with self.open(fn) as chunk_f:
+                chunk_f.write(chunk)
+            f.write(first if i == 1 else "#if __SPLIT == %u\n" % i)
+            f.write('#include "%s"\n#endif\n' % fn)
+
     # Weave together the parts of the different output sections by
     # #include'ing them into some very short top-level .cc/.hh files.
     # These small files make it much clearer how this tool works, since
@@ -710,6 +780,7 @@ class ISAParser(Grammar):
                 print("namespace %s {" % self.namespace, file=f)
                 if splits > 1:
                     print("#define __SPLIT %u" % i, file=f)
+                    fn = self.split_file_name(fn, i)
                 print(f'#include "{fn}"', file=f)
                 print("} // namespace %s" % self.namespace, file=f)
                 print("} // namespace gem5", file=f)
@@ -733,6 +804,7 @@ class ISAParser(Grammar):
                 print("namespace %s {" % self.namespace, file=f)
                 if splits > 1:
                     print("#define __SPLIT %u" % i, file=f)
+                    fn = self.split_file_name(fn, i)
                 # TODO: enable warning for all ISAs
                 if self.namespace == "ArmISAInst":
                     print(f"#ifdef __clang__", file=f)
@@ -910,9 +982,9 @@ class ISAParser(Grammar):
         r"\n+"
         t.lexer.lineno += t.value.count("\n")
 
-    # Comments
-    def t_comment(self, t):
-        r"//[^\n]*\n"
+    # Comments. A plain rule rather than a function so no Python code runs
+    # per comment.
+    t_ignore_comment = r"//[^\n]*\n"
 
     # Completely ignored characters
     t_ignore = " \t\x0c"
@@ -951,6 +1023,10 @@ class ISAParser(Grammar):
         for f in self.splits.keys():
             f.write("\n#endif\n")
 
+        for filename, f in self.files.items():
+            if self.splits.get(f, 1) > 1:
+                self.write_split_files(filename, f)
+
         for f in self.files.values():  # close ALL the files;
             f.close()  # not doing so can cause compilation to fail
 
@@ -1577,6 +1653,9 @@ StaticInstPtr
         self.elemToVector = elem_to_vec
         extensions = self.operandTypeMap.keys()
 
+        self._mungedSnippets = {}
+        self._operandRefs = {}
+
         operandsREString = r"""
         (?<!\w|:)     # neg. lookbehind assertion: prevent partial matches
         (({})(?:_({}))?)   # match: operand with optional '_' then suffix
@@ -1611,22 +1690,44 @@ StaticInstPtr
     def mungeSnippet(self, s):
         """Fix up code snippets for final substitution in templates."""
         if isinstance(s, str):
-            return self.substMungedOpNames(substBitOps(s))
+            munged = self._mungedSnippets.get(s)
+            if munged is None:
+                munged = self.substMungedOpNames(substBitOps(s))
+                self._mungedSnippets[s] = munged
+            return munged
         else:
             return s
 
+    def operandRefs(self, code):
+        """Return the base names of the operands referenced in a code
+        string, excluding those in strings and comments, in order of first
+        appearance. Snippets and templates are used many times, so the
+        results are cached."""
+        refs = self._operandRefs.get(code)
+        if refs is None:
+            stripped = code
+            for regEx in (stringRE, commentRE):
+                stripped = regEx.sub("", stripped)
+            refs = tuple(
+                dict.fromkeys(
+                    m.group(2) for m in self.operandsRE().finditer(stripped)
+                )
+            )
+            self._operandRefs[code] = refs
+        return refs
+
     def open(self, name, bare=False):
-        """Open the output file for writing and include scary warning."""
-        filename = os.path.join(self.output_dir, name)
-        f = open(filename, "w")
-        if f:
-            if not bare:
-                f.write(ISAParser.scaremonger_template % self)
+        """Open the output file for writing and include scary warning.
+        The file is only written when it is closed, and only if its
+        contents have changed."""
+        f = OutputFile(os.path.join(self.output_dir, name))
+        if not bare:
+            f.write(ISAParser.scaremonger_template % self)
         return f
 
     def update(self, file, contents):
-        """Update the output file only.  Scons should handle the case when
-        the new contents are unchanged using its built-in hash feature."""
+        """Update the output file, leaving it untouched if the contents are
+        unchanged."""
         f = self.open(file)
         f.write(contents)
         f.close()
@@ -185,21 +185,20 @@ class OperandList:
 
 
 class SubOperandList(OperandList):
-    """Find all the operands in the given code block.  Returns an operand
-    descriptor list (instance of class OperandList)."""
+    """Find all the operands in the given code block, or list of code
+    blocks.  Returns an operand descriptor list (instance of class
+    OperandList)."""
 
     def __init__(self, parser, code, requestor_list):
         self.items = []
         self.bases = {}
-        # delete strings and comments so we don't match on operands inside
-        for regEx in (stringRE, commentRE):
-            code = regEx.sub("", code)
+        if isinstance(code, str):
+            code = [code]
 
         # search for operands
-        for match in parser.operandsRE().finditer(code):
-            op = match.groups()
-            # regexp groups are operand full name, base, and extension
-            (op_full, op_base, op_ext) = op
+        for op_base in (
+            op_base for block in code for op_base in parser.operandRefs(block)
+        ):
             # If is a elem operand, define or update the corresponding
             # vector operand
             if op_base in parser.elemToVector:
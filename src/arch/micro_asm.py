@@ -575,7 +575,7 @@ def p_error(t):
 class MicroAssembler:
     def __init__(self, macro_type, microops, rom=None, rom_macroop_type=None):
         self.lexer = lex.lex()
-        self.parser = yacc.yacc(write_tables=False)
+        self.parser = yacc.yacc(write_tables=False, debug=False)
         self.parser.macro_type = macro_type
         self.parser.macroops = {}
         self.parser.microops = microops
@@ -44,17 +44,21 @@
 #include <unistd.h>
 #include <zlib.h>
 
+#include <algorithm>
 #include <cerrno>
 #include <climits>
 #include <cstdio>
+#include <cstring>
 #include <iostream>
 #include <string>
+#include <vector>
 
 #include "base/intmath.hh"
 #include "base/trace.hh"
 #include "debug/AddrRanges.hh"
 #include "debug/Checkpoint.hh"
 #include "mem/abstract_mem.hh"
+#include "sim/byteswap.hh"
 #include "sim/serialize.hh"
 #include "sim/sim_exit.hh"
 
@@ -73,6 +77,101 @@
 namespace gem5
 {
 
+namespace
+{
+
+/*
+ * Sparse memory images. All fields are little endian:
+ *
+ *   magic       8 bytes, "GEM5SPM\0"
+ *   version     uint32
+ *   page_size   uint32
+ *   num_pages   uint64, the pages in the backing store
+ *   count       uint64, the pages in the image
+ *   store_len   uint32, the length of the page store path
+ *   store       store_len bytes, the path of the page store relative to
+ *               the image, or empty if the pages follow the index
+ *   (padding to a multiple of 8 bytes)
+ *   pages       uint64[count], the ascending page numbers
+ *   slots       uint64[count], the slot of each page's contents
+ *   (padding to a multiple of page_size bytes)
+ *   data        the contents of each slot
+ *
+ * Pages which are not in the image are all zero. Images written here
+ * hold their contents after the index, with one slot per page. The
+ * contents of images converted by util/checkpoint_pmem.py may instead be
+ * deduplicated into a page store (<store>/pages.bin) shared between
+ * checkpoints.
+ */
+const char sparseMagic[8] = {'G', 'E', 'M', '5', 'S', 'P', 'M', '\0'};
+const uint32_t sparseVersion = 1;
+const uint64_t sparsePageSize = 4096;
+// The size of the fields before the page store path.
+const uint64_t sparseHeaderSize = 36;
+
+bool
+isZero(const uint8_t *data, uint64_t size)
+{
+    return size == 0 ||
+        (data[0] == 0 && std::memcmp(data, data + 1, size - 1) == 0);
+}
+
+uint64_t
+alignUp(uint64_t value, uint64_t align)
+{
+    return (value + align - 1) / align * align;
+}
+
+void
+writeOrFatal(int fd, const void *data, uint64_t size,
+             const std::string &filepath)
+{
+    auto *bytes = static_cast<const uint8_t *>(data);
+    while (size > 0) {
+        ssize_t written = ::write(fd, bytes, std::min<uint64_t>(size,
+                                                               INT_MAX));
+        if (written < 0 && errno == EINTR)
+            continue;
+        fatal_if(written <= 0,
+                 "Write failed on physical memory checkpoint file '%s'\n",
+                 filepath);
+        bytes += written;
+        size -= written;
+    }
+}
+
+void
+preadOrFatal(int fd, void *data, uint64_t size, uint64_t offset,
+             const std::string &filepath)
+{
+    auto *bytes = static_cast<uint8_t *>(data);
+    while (size > 0) {
+        ssize_t bytes_read = ::pread(fd, bytes,
+                                     std::min<uint64_t>(size, INT_MAX),
+                                     offset);
+        if (bytes_read < 0 && errno == EINTR)
+            continue;
+        fatal_if(bytes_read <= 0,
+                 "Read failed on physical memory checkpoint file '%s'\n",
+                 filepath);
+        bytes += bytes_read;
+        size -= bytes_read;
+        offset += bytes_read;
+    }
+}
+
+template <typename T>
+T
+readField(const uint8_t *&ptr)
+{
+    T value;
+    std::memcpy(&value, ptr, sizeof(T));
+    ptr += sizeof(T);
+    return letoh(value);
+}
+
+} // anonymous namespace
+
 namespace memory
 {
 
@@ -378,7 +477,13 @@ PhysicalMemory::serializeStore(CheckpointOut &cp, unsigned int store_id,
 
     // write memory file
     std::string filepath = CheckpointIn::dir() + "/" + filename.c_str();
-    gzFile compressed_mem = gzopen(filepath.c_str(), "wb");
+    if (CheckpointIn::sparseMemory()) {
+        serializeSparseStore(filepath, range_size, pmem);
+        return;
+    }
+
+    gzFile compressed_mem = gzopen(filepath.c_str(),
+        CheckpointIn::compressedWriteMode().c_str());
     if (compressed_mem == NULL)
         fatal("Can't open physical memory checkpoint file '%s'\n",
               filename);
@@ -406,6 +511,184 @@ PhysicalMemory::serializeStore(CheckpointOut &cp, unsigned int store_id,
 
 }
 
+void
+PhysicalMemory::serializeSparseStore(const std::string &filepath,
+                                     uint64_t size, const uint8_t *pmem) const
+{
+    const uint64_t num_pages = divCeil(size, sparsePageSize);
+
+    std::vector<uint64_t> pages;
+    for (uint64_t page = 0; page < num_pages; ++page) {
+        const uint64_t offset = page * sparsePageSize;
+        if (!isZero(pmem + offset,
+                    std::min(sparsePageSize, size - offset))) {
+            pages.push_back(page);
+        }
+    }
+
+    DPRINTF(Checkpoint, "Writing %d of %d pages to sparse image %s\n",
+            pages.size(), num_pages, filepath);
+
+    std::vector<uint8_t> header(alignUp(sparseHeaderSize, 8));
+    uint8_t *ptr = header.data();
+    auto put = [&ptr](auto value) {
+        value = htole(value);
+        std::memcpy(ptr, &value, sizeof(value));
+        ptr += sizeof(value);
+    };
+    std::memcpy(ptr, sparseMagic, sizeof(sparseMagic));
+    ptr += sizeof(sparseMagic);
+    put(sparseVersion);
+    put(static_cast<uint32_t>(sparsePageSize));
+    put(num_pages);
+    put(static_cast<uint64_t>(pages.size()));
+    put(static_cast<uint32_t>(0));
+
+    // The pages are followed by their slots, which are in order.
+    std::vector<uint64_t> index(2 * pages.size());
+    for (size_t i = 0; i < pages.size(); ++i) {
+        index[i] = htole(pages[i]);
+        index[pages.size() + i] = htole(static_cast<uint64_t>(i));
+    }
+
+    int fd = ::open(filepath.c_str(), O_WRONLY | O_CREAT | O_TRUNC, 0664);
+    fatal_if(fd < 0, "Can't open physical memory checkpoint file '%s'\n",
+             filepath);
+
+    writeOrFatal(fd, header.data(), header.size(), filepath);
+    writeOrFatal(fd, index.data(), index.size() * sizeof(uint64_t),
+                 filepath);
+    const uint64_t index_end = header.size() +
+        index.size() * sizeof(uint64_t);
+    const std::vector<uint8_t> padding(
+        alignUp(index_end, sparsePageSize) - index_end);
+    writeOrFatal(fd, padding.data(), padding.size(), filepath);
+
+    // Write runs of consecutive pages at once.
+    for (size_t i = 0; i < pages.size();) {
+        size_t j = i + 1;
+        while (j < pages.size() && pages[j] == pages[j - 1] + 1)
+            ++j;
+        const uint64_t offset = pages[i] * sparsePageSize;
+        const uint64_t end = std::min(size, pages[j - 1] * sparsePageSize +
+                                            sparsePageSize);
+        writeOrFatal(fd, pmem + offset, end - offset, filepath);
+        i = j;
+    }
+    // Pad a partial last page, so each slot is a whole page.
+    if (!pages.empty() && size % sparsePageSize &&
+        pages.back() == num_pages - 1) {
+        const std::vector<uint8_t> tail(
+            sparsePageSize - size % sparsePageSize);
+        writeOrFatal(fd, tail.data(), tail.size(), filepath);
+    }
+
+    fatal_if(::close(fd) != 0,
+             "Close failed on physical memory checkpoint file '%s'\n",
+             filepath);
+}
+
+bool
+PhysicalMemory::unserializeSparseStore(const std::string &filepath,
+                                       uint64_t size, uint8_t *pmem) const
+{
+    int fd = ::open(filepath.c_str(), O_RDONLY);
+    fatal_if(fd < 0, "Can't open physical memory checkpoint file '%s'",
+             filepath);
+
+    uint8_t fixed[sparseHeaderSize];
+    ssize_t fixed_read = ::pread(fd, fixed, sizeof(fixed), 0);
+    if (fixed_read != sizeof(fixed) ||
+        std::memcmp(fixed, sparseMagic, sizeof(sparseMagic)) != 0) {
+        ::close(fd);
+        return false;
+    }
+
+    const uint8_t *ptr = fixed + sizeof(sparseMagic);
+    const auto version = readField<uint32_t>(ptr);
+    const auto page_size = readField<uint32_t>(ptr);
+    const auto num_pages = readField<uint64_t>(ptr);
+    const auto count = readField<uint64_t>(ptr);
+    const auto store_len = readField<uint32_t>(ptr);
+
+    fatal_if(version != sparseVersion,
+             "Unsupported sparse memory image version %d in '%s'",
+             version, filepath);
+    fatal_if(page_size == 0 || num_pages != divCeil(size, page_size),
+             "Sparse memory image '%s' does not match the memory size",
+             filepath);
+
+    std::string store(store_len, '\0');
+    preadOrFatal(fd, store.data(), store_len, sizeof(fixed), filepath);
+    const uint64_t index_offset = alignUp(sizeof(fixed) + store_len, 8);
+
+    std::vector<uint64_t> index(2 * count);
+    preadOrFatal(fd, index.data(), index.size() * sizeof(uint64_t),
+                 index_offset, filepath);
+    for (auto &value : index)
+        value = letoh(value);
+    const uint64_t *pages = index.data();
+    const uint64_t *slots = index.data() + count;
+
+    // The contents are either after the index or in a shared page store.
+    int data_fd = fd;
+    std::string data_path = filepath;
+    uint64_t data_offset = alignUp(index_offset +
+                                   index.size() * sizeof(uint64_t),
+                                   page_size);
+    if (!store.empty()) {
+        const auto slash = filepath.rfind('/');
+        const std::string dir = slash == std::string::npos ?
+            "" : filepath.substr(0, slash + 1);
+        data_path = (store[0] == '/' ? "" : dir) + store + "/pages.bin";
+        data_fd = ::open(data_path.c_str(), O_RDONLY);
+        fatal_if(data_fd < 0, "Can't open memory page store '%s'",
+                 data_path);
+        data_offset = 0;
+    }
+
+    // Zero the pages which are not in the image. A freshly mapped backing
+    // store is already zero, so only write to pages which are not.
+    auto zero = [&](uint64_t from, uint64_t to) {
+        for (uint64_t page = from; page < to; ++page) {
+            const uint64_t offset = page * page_size;
+            const uint64_t len = std::min<uint64_t>(page_size,
+                                                    size - offset);
+            if (!isZero(pmem + offset, len))
+                std::memset(pmem + offset, 0, len);
+        }
+    };
+
+    uint64_t next_page = 0;
+    for (uint64_t i = 0; i < count;) {
+        fatal_if(pages[i] < next_page || pages[i] >= num_pages,
+                 "Corrupt page index in sparse memory image '%s'",
+                 filepath);
+        zero(next_page, pages[i]);
+
+        // Read runs of consecutive pages in consecutive slots at once.
+        uint64_t j = i + 1;
+        while (j < count && pages[j] == pages[j - 1] + 1 &&
+               slots[j] == slots[j - 1] + 1) {
+            ++j;
+        }
+        const uint64_t offset = pages[i] * page_size;
+        const uint64_t end = std::min<uint64_t>(
+            size, (pages[j - 1] + 1) * page_size);
+        preadOrFatal(data_fd, pmem + offset, end - offset,
+                     data_offset + slots[i] * page_size, data_path);
+
+        next_page = pages[j - 1] + 1;
+        i = j;
+    }
+    zero(next_page, num_pages);
+
+    if (data_fd != fd)
+        ::close(data_fd);
+    ::close(fd);
+    return true;
+}
+
 void
 PhysicalMemory::unserialize(CheckpointIn &cp)
 {
@@ -443,11 +726,6 @@ PhysicalMemory::unserializeStore(CheckpointIn &cp)
     UNSERIALIZE_SCALAR(filename);
     std::string filepath = cp.getCptDir() + "/" + filename;
 
-    // mmap memoryfile
-    gzFile compressed_mem = gzopen(filepath.c_str(), "rb");
-    if (compressed_mem == NULL)
-        fatal("Can't open physical memory checkpoint file '%s'", filename);
-
     // we've already got the actual backing store mapped
     uint8_t* pmem = backingStore[store_id].pmem;
     AddrRange range = backingStore[store_id].range;
@@ -462,6 +740,14 @@ PhysicalMemory::unserializeStore(CheckpointIn &cp)
         fatal("Memory range size has changed! Saw %lld, expected %lld\n",
               range_size, range.size());
 
+    if (unserializeSparseStore(filepath, range.size(), pmem))
+        return;
+
+    // mmap memoryfile
+    gzFile compressed_mem = gzopen(filepath.c_str(), "rb");
+    if (compressed_mem == NULL)
+        fatal("Can't open physical memory checkpoint file '%s'", filename);
+
     uint64_t curr_size = 0;
     uint32_t bytes_read;
     while (curr_size < range.size()) {
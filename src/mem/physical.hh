@@ -284,6 +284,18 @@ class PhysicalMemory : public Serializable
     void serializeStore(CheckpointOut &cp, unsigned int store_id,
                         AddrRange range, uint8_t* pmem) const;
 
+    /**
+     * Write a backing store as a sparse memory image, which holds an
+     * index of the pages which are not all zero followed by their
+     * contents. See physical.cc for the format.
+     *
+     * @param filepath The path of the image
+     * @param size The size of this backing store
+     * @param pmem The host pointer to this backing store
+     */
+    void serializeSparseStore(const std::string &filepath, uint64_t size,
+                              const uint8_t *pmem) const;
+
     /**
      * Unserialize the memories in the system. As with the
      * serialization, this action is independent of how the address
@@ -296,6 +308,17 @@ class PhysicalMemory : public Serializable
      */
     void unserializeStore(CheckpointIn &cp);
 
+    /**
+     * Read a sparse memory image into a backing store, if the file is one.
+     *
+     * @param filepath The path of the image
+     * @param size The size of this backing store
+     * @param pmem The host pointer to this backing store
+     * @return false if the file is not a sparse memory image
+     */
+    bool unserializeSparseStore(const std::string &filepath, uint64_t size,
+                                uint8_t *pmem) const;
+
 };
 
 } // namespace memory
@@ -0,0 +1,271 @@
+# Copyright (c) 2026 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""A persistent cache of SLICC results.
+
+Parsing and generating code for a protocol is slow, and the build needs the
+list of generated files before it can decide what to build. Each protocol's
+result (the list of generated files and the generated code itself) is
+therefore stored in an entry of a cache directory in the build directory.
+An entry is reused as long as every file parsed to produce it (the protocol,
+its includes and the shared ``.slicc`` files) and the SLICC sources are
+unchanged, so a no-op rebuild does not run SLICC at all.
+"""
+
+import filecmp
+import hashlib
+import json
+import multiprocessing
+import os
+import shutil
+import sys
+
+import code_formatter
+import grammar
+
+from slicc.parser import SLICC
+
+# Bump to invalidate all existing cache entries if the format changes
+CACHE_VERSION = 1
+
+
+def file_digest(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _copy_if_changed(src, dst):
+    if os.path.exists(dst) and filecmp.cmp(src, dst, shallow=False):
+        return
+    os.makedirs(os.path.dirname(dst), exist_ok=True)
+    shutil.copyfile(src, dst)
+
+
+class SliccCache:
+    def __init__(
+        self,
+        cache_dir,
+        shared_includes,
+        base_dir,
+        code_includes,
+        html_dir=None,
+        verbose=True,
+    ):
+        """
+        cache_dir: The directory in which the cache entries are stored
+        shared_includes: `.slicc` files shared between all protocols
+        base_dir: The directory used to resolve includes
+        code_includes: Headers included by the generated Types.hh
+        html_dir: If set, the HTML tables are written to this directory
+        """
+        self.cache_dir = cache_dir
+        self.shared_includes = list(shared_includes)
+        self.base_dir = base_dir
+        self.code_includes = list(code_includes)
+        self.html_dir = html_dir
+        self.verbose = verbose
+        self.tool_digest = self._tool_digest()
+        # Entries looked up or generated by this process
+        self._manifests = {}
+
+    def _tool_digest(self):
+        """Hash of everything other than the protocol sources which affects
+        the generated code: the SLICC and code generation sources and the
+        options.
+        """
+        h = hashlib.sha256()
+        h.update(str(CACHE_VERSION).encode())
+        tools = [code_formatter.__file__, grammar.__file__]
+        slicc_dir = os.path.dirname(os.path.abspath(__file__))
+        for root, dirs, files in os.walk(slicc_dir):
+            dirs.sort()
+            tools += [
+                os.path.join(root, f)
+                for f in sorted(files)
+                if f.endswith(".py")
+            ]
+        for path in tools:
+            h.update(os.path.abspath(path).encode())
+            h.update(file_digest(path).encode())
+        h.update(
+            json.dumps(
+                [
+                    self.shared_includes,
+                    self.base_dir,
+                    self.code_includes,
+                    self.html_dir,
+                ]
+            ).encode()
+        )
+        return h.hexdigest()
+
+    def entry_dir(self, protocol_file):
+        protocol_file = os.path.abspath(protocol_file)
+        name = os.path.splitext(os.path.basename(protocol_file))[0]
+        tag = hashlib.sha1(protocol_file.encode()).hexdigest()[:12]
+        return os.path.join(self.cache_dir, f"{name}-{tag}")
+
+    def lookup(self, protocol_file):
+        """Returns the manifest of the cache entry for the protocol if it is
+        up to date, or None.
+        """
+        protocol_file = os.path.abspath(protocol_file)
+        if protocol_file in self._manifests:
+            return self._manifests[protocol_file]
+
+        path = os.path.join(self.entry_dir(protocol_file), "manifest.json")
+        try:
+            with open(path) as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if manifest.get("tool_digest") != self.tool_digest:
+            return None
+        for source, digest in manifest["inputs"].items():
+            try:
+                if file_digest(source) != digest:
+                    return None
+            except OSError:
+                return None
+
+        self._manifests[protocol_file] = manifest
+        return manifest
+
+    def generate(self, protocol_file):
+        """Runs SLICC on the protocol and stores the result in the cache.
+        Returns the manifest of the new entry.
+        """
+        protocol_file = os.path.abspath(protocol_file)
+        entry = self.entry_dir(protocol_file)
+        tmp = f"{entry}.tmp{os.getpid()}"
+        shutil.rmtree(tmp, ignore_errors=True)
+        files_dir = os.path.join(tmp, "files")
+
+        slicc = SLICC(
+            protocol_file,
+            self.shared_includes,
+            self.base_dir,
+            verbose=self.verbose,
+        )
+        slicc.process()
+        slicc.writeCodeFiles(files_dir, self.code_includes)
+        # The HTML tables embed their path, so they are not cached but
+        # written in place. They are regenerated with the code.
+        if self.html_dir:
+            slicc.writeHTMLFiles(self.html_dir)
+
+        # ProtocolInfo.hh is not part of the declaration list
+        files = set(slicc.files())
+        files.add(f"{slicc.protocol}/{slicc.protocol}ProtocolInfo.hh")
+
+        outputs = []
+        for root, dirs, names in os.walk(files_dir):
+            for name in names:
+                path = os.path.join(root, name)
+                outputs.append(os.path.relpath(path, files_dir))
+
+        manifest = {
+            "tool_digest": self.tool_digest,
+            "protocol": slicc.protocol,
+            "inputs": {s: file_digest(s) for s in slicc.sources},
+            "files": sorted(files),
+            "outputs": sorted(outputs),
+        }
+        with open(os.path.join(tmp, "manifest.json"), "w") as f:
+            json.dump(manifest, f, indent=1)
+
+        shutil.rmtree(entry, ignore_errors=True)
+        os.rename(tmp, entry)
+
+        self._manifests[protocol_file] = manifest
+        return manifest
+
+    def get(self, protocol_file):
+        """Returns the manifest for the protocol, running SLICC if there is
+        no up to date cache entry.
+        """
+        manifest = self.lookup(protocol_file)
+        if manifest is None:
+            manifest = self.generate(protocol_file)
+        return manifest
+
+    def generate_all(self, protocol_files, jobs=1):
+        """Returns the manifests for all protocols. Protocols without an up
+        to date cache entry are generated, in parallel if jobs > 1.
+        """
+        protocol_files = [os.path.abspath(p) for p in protocol_files]
+        missing = [p for p in protocol_files if self.lookup(p) is None]
+
+        jobs = min(jobs, len(missing))
+        if jobs > 1:
+            # Use fork so the workers inherit sys.path and the modules
+            # imported by the build.
+            context = multiprocessing.get_context("fork")
+            with context.Pool(jobs) as pool:
+                results = pool.map(_generate, [(self, p) for p in missing])
+            for protocol_file, (manifest, error) in zip(missing, results):
+                if error is not None:
+                    sys.exit(error)
+                self._manifests[protocol_file] = manifest
+        else:
+            for protocol_file in missing:
+                self.generate(protocol_file)
+
+        return [self._manifests[p] for p in protocol_files]
+
+    def install(self, protocol_file, output_dir):
+        """Copies the generated code for the protocol to output_dir. Files
+        which are unchanged are not touched.
+        """
+        manifest = self.get(protocol_file)
+        files_dir = os.path.join(self.entry_dir(protocol_file), "files")
+        for output in manifest["outputs"]:
+            _copy_if_changed(
+                os.path.join(files_dir, output),
+                os.path.join(output_dir, output),
+            )
+        return manifest
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_manifests"] = {}
+        return state
+
+
+def _generate(args):
+    """Pool worker. SLICC reports errors with sys.exit(), which would kill
+    the worker, so errors are returned to the parent instead.
+    """
+    cache, protocol_file = args
+    try:
+        return cache.generate(protocol_file), None
+    except SystemExit as e:
+        return None, str(e.code)
+    except Exception as e:
+        return None, f"{os.path.basename(protocol_file)}: {e}"
@@ -71,6 +71,8 @@ class SLICC(Grammar):
         self.verbose = verbose
         self.symtab = SymbolTable(self)
         self.base_dir = base_dir
+        # Every file parsed, including the shared and included files
+        self.sources = []
 
         # Update slicc_interface/ProtocolInfo.cc/hh if updating this.
         self.options = {
@@ -95,6 +97,11 @@ class SLICC(Grammar):
                 sys.exit(str(e))
             raise
 
+    def parse_file(self, f, **kwargs):
+        if isinstance(f, str):
+            self.sources.append(os.path.abspath(f))
+        return super().parse_file(f, **kwargs)
+
     def currentLocation(self):
         return util.Location(
             self.current_source, self.current_line, no_warning=not self.verbose
@@ -128,8 +135,8 @@ class SLICC(Grammar):
         r"/\*(.|\n)*?\*/"
         t.lexer.lineno += t.value.count("\n")
 
-    def t_cpp_comment(self, t):
-        r"//.*"
+    # A plain rule rather than a function so no Python code runs per comment
+    t_ignore_cpp_comment = r"//.*"
 
     # Define a rule so we can track line numbers
     def t_newline(self, t):
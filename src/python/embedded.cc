@@ -43,10 +43,6 @@
 
 #include "python/embedded.hh"
 
-#include <zlib.h>
-
-#include <cstdlib>
-#include <iostream>
 #include <list>
 
 namespace py = pybind11;
@@ -68,31 +64,14 @@ EmbeddedPython::getList()
     return the_list;
 }
 
-/*
- * Uncompress and unmarshal the code object stored in the
- * EmbeddedPython
- */
-py::object
-EmbeddedPython::getCode() const
-{
-    Bytef marshalled[len];
-    uLongf unzlen = len;
-    int ret = uncompress(marshalled, &unzlen, (const Bytef *)code, zlen);
-    if (ret != Z_OK) {
-        std::cerr << "Could not uncompress code: " << zError(ret) << std::endl;
-        std::abort();
-    }
-    assert(unzlen == (uLongf)len);
-
-    auto marshal = py::module_::import("marshal");
-    return marshal.attr("loads")(py::bytes((char *)marshalled, len));
-}
-
 bool
 EmbeddedPython::addModule() const
 {
     auto importer = py::module_::import("importer");
-    importer.attr("add_module")(abspath, modpath, getCode());
+    // The code is passed as a view of the compressed data so that it is
+    // only decompressed if the module is actually imported.
+    importer.attr("add_module")(abspath, modpath,
+            py::memoryview::from_memory(code, zlen), len);
     return true;
 }
 
@@ -64,7 +64,6 @@ struct EmbeddedPython
     EmbeddedPython(const char *abspath, const char *modpath,
             const uint8_t *code, int zlen, int len);
 
-    pybind11::object getCode() const;
     bool addModule() const;
 
     static std::list<EmbeddedPython *> &getList();
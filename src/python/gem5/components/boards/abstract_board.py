@@ -442,7 +442,15 @@ class AbstractBoard:
         if self.get_cache_hierarchy():
             self.get_cache_hierarchy()._pre_instantiate(root)
 
-        # 4. Return the root object.
+        # 4. Place any disk image overlays in the output directory. This
+        # cannot be done when the workload is set as the output directory may
+        # be overridden afterwards.
+        from .kernel_disk_workload import KernelDiskWorkload
+
+        if isinstance(self, KernelDiskWorkload):
+            self._set_disk_overlay_files()
+
+        # 5. Return the root object.
         return root
 
     def _connect_things_check(self):
@@ -42,12 +42,10 @@ from m5.objects import (
     ArmSystem,
     BadAddr,
     Bridge,
-    CowDiskImage,
     GenericTimer,
     IOXBar,
     PciVirtIO,
     Port,
-    RawDiskImage,
     SimObject,
     SrcClockDomain,
     Terminal,
@@ -383,12 +381,7 @@ class ArmBoard(ArmSystem, AbstractBoard, KernelDiskWorkload):
 
     @overrides(KernelDiskWorkload)
     def _add_disk_to_board(self, disk_image: AbstractResource):
-        self._image = CowDiskImage(
-            child=RawDiskImage(
-                read_only=True, image_file=disk_image.get_local_path()
-            ),
-            read_only=False,
-        )
+        self._image = self._create_disk_image(disk_image)
 
         self._add_pci_device(PciVirtIO(vio=VirtIOBlock(image=self._image)))
 
@@ -32,7 +32,6 @@ from m5.objects import (
     AddrRange,
     Bridge,
     Clint,
-    CowDiskImage,
     Frequency,
     IOXBar,
     LupioBLK,
@@ -47,7 +46,6 @@ from m5.objects import (
     Plic,
     PMAChecker,
     Port,
-    RawDiskImage,
     RiscvLinux,
     RiscvRTC,
     Terminal,
@@ -562,11 +560,7 @@ class LupvBoard(AbstractSystemBoard, KernelDiskWorkload):
         # attribute named "disk" and connects
 
         # Set the disk image for the block device to use
-        image = CowDiskImage(
-            child=RawDiskImage(read_only=True), read_only=False
-        )
-        image.child.image_file = disk_image.get_local_path()
-        self.lupio_blk.image = image
+        self.lupio_blk.image = self._create_disk_image(disk_image)
 
         self._setup_io_devices()
         self._setup_pma()
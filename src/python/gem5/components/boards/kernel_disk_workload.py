@@ -34,6 +34,10 @@ from typing import (
 )
 
 import m5
+from m5.objects import (
+    CowDiskImage,
+    RawDiskImage,
+)
 from m5.util import warn
 
 from ...resources.resource import (
@@ -70,6 +74,13 @@ class KernelDiskWorkload:
             ...
 
 
+    The disk image is never written to by the simulation. Boards attach it
+    via ``_create_disk_image``, which opens the image read-only beneath a
+    copy-on-write overlay. Many simulations may therefore share one disk image
+    in parallel without copying it. By default the overlay is held in memory.
+    If ``disk_overlay`` is set in ``set_kernel_disk_workload`` the overlay is
+    saved to the simulation's output directory on exit.
+
     .. note::
 
         * This assumes only one disk is set.
@@ -140,6 +151,49 @@ class KernelDiskWorkload:
             self.get_disk_root_partition(disk_image) or ""
         )
 
+    def _create_disk_image(
+        self, disk_image: DiskImageResource
+    ) -> CowDiskImage:
+        """
+        Creates the disk image SimObject for a disk image resource. The
+        resource is opened read-only and all writes go to a copy-on-write
+        overlay. Boards should use this in ``_add_disk_to_board``.
+
+        :param disk_image: The disk image resource.
+
+        :returns: The copy-on-write disk image SimObject.
+        """
+        image = CowDiskImage(
+            child=RawDiskImage(
+                read_only=True, image_file=disk_image.get_local_path()
+            ),
+            read_only=False,
+        )
+        if getattr(self, "_disk_overlay", False):
+            self._disk_overlay_images.append(image)
+        return image
+
+    def _set_disk_overlay_files(self) -> None:
+        """
+        Sets the overlay file of each disk image created with
+        ``_create_disk_image`` to a file in the output directory. This is
+        called immediately before instantiation as the output directory may
+        be overridden (e.g., by MultiSim) after the workload is set.
+
+        Any overlay left in the output directory by a previous run is removed
+        so each simulation starts from the unmodified disk image.
+        """
+        for index, image in enumerate(
+            getattr(self, "_disk_overlay_images", [])
+        ):
+            overlay = os.path.join(
+                m5.options.outdir,
+                f"{Path(image.child.image_file).name}.{index}.cow",
+            )
+            if os.path.exists(overlay):
+                os.remove(overlay)
+            image.image_file = overlay
+
     def set_kernel_disk_workload(
         self,
         kernel: KernelResource,
@@ -151,6 +205,7 @@ class KernelDiskWorkload:
         kernel_args: Optional[List[str]] = None,
         exit_on_work_items: bool = True,
         checkpoint: Optional[Union[Path, CheckpointResource]] = None,
+        disk_overlay: bool = False,
     ) -> None:
         """
         This function allows the setting of a full-system run with a Kernel
@@ -176,6 +231,11 @@ class KernelDiskWorkload:
                                    items. ``True`` by default.
         :param checkpoint: The checkpoint directory. Used to restore the
                            simulation to that checkpoint.
+        :param disk_overlay: If ``True``, the copy-on-write overlay of the
+                             disk image is saved to the output directory when
+                             the simulation exits. The disk image itself is
+                             opened read-only regardless. ``False`` by
+                             default.
         """
 
         # We assume this this is in a multiple-inheritance setup with an
@@ -218,6 +278,8 @@ class KernelDiskWorkload:
         elif readfile_contents:
             self._set_readfile_contents(readfile_contents)
 
+        self._disk_overlay = disk_overlay
+        self._disk_overlay_images = []
         self._add_disk_to_board(disk_image=disk_image)
 
         # Set whether to exit on work items.
@@ -36,7 +36,6 @@ from m5.objects import (
     AddrRange,
     BadAddr,
     Bridge,
-    CowDiskImage,
     Frequency,
     GenericRiscvPciHost,
     HiFive,
@@ -44,7 +43,6 @@ from m5.objects import (
     IOXBar,
     PMAChecker,
     Port,
-    RawDiskImage,
     RiscvBootloaderKernelWorkload,
     RiscvMmioVirtIO,
     RiscvRTC,
@@ -545,11 +543,7 @@ class RiscvBoard(AbstractSystemBoard, KernelDiskWorkload, SEBinaryWorkload):
 
     @overrides(KernelDiskWorkload)
     def _add_disk_to_board(self, disk_image: AbstractResource):
-        image = CowDiskImage(
-            child=RawDiskImage(read_only=True), read_only=False
-        )
-        image.child.image_file = disk_image.get_local_path()
-        self.disk.vio.image = image
+        self.disk.vio.image = self._create_disk_image(disk_image)
 
         # Note: The below is a bit of a hack. We need to wait to generate the
         # device tree until after the disk is set up. Now that the disk and
@@ -35,12 +35,10 @@ from m5.objects import (
     AddrRange,
     BaseXBar,
     Bridge,
-    CowDiskImage,
     IdeDisk,
     IOXBar,
     Pc,
     Port,
-    RawDiskImage,
     X86ACPIMadt,
     X86ACPIMadtIntSourceOverride,
     X86ACPIMadtIOAPIC,
@@ -360,10 +358,7 @@ class X86Board(AbstractSystemBoard, KernelDiskWorkload, SEBinaryWorkload):
     def _add_disk_to_board(self, disk_image: AbstractResource):
         ide_disk = IdeDisk()
         ide_disk.driveID = "device0"
-        ide_disk.image = CowDiskImage(
-            child=RawDiskImage(read_only=True), read_only=False
-        )
-        ide_disk.image.child.image_file = disk_image.get_local_path()
+        ide_disk.image = self._create_disk_image(disk_image)
 
         # Attach the SimObject to the system.
         self.pc.south_bridge.ide.disks = [ide_disk]
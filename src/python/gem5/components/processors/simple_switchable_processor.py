@@ -70,7 +70,6 @@ class SimpleSwitchableProcessor(SwitchableProcessor):
 
         self._start_key = "start"
         self._switch_key = "switch"
-        self._current_is_start = True
 
         self._mem_mode = get_mem_mode(starting_core_type)
 
@@ -107,9 +106,9 @@ class SimpleSwitchableProcessor(SwitchableProcessor):
 
     def switch(self):
         """Switches to the "switched out" cores."""
-        if self._current_is_start:
+        # The current cores are looked up, rather than tracked here, as they
+        # may also be switched via `switch_to_processor`.
+        if self.get_current_cores_key() == self._start_key:
             self.switch_to_processor(self._switch_key)
         else:
             self.switch_to_processor(self._start_key)
-
-        self._current_is_start = not self._current_is_start
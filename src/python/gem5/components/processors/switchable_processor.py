@@ -114,6 +114,18 @@ class SwitchableProcessor(AbstractProcessor):
     def get_cores(self) -> List[AbstractCore]:
         return self._current_cores
 
+    def get_current_cores_key(self) -> str:
+        """Returns the key of the cores which are currently switched in."""
+        for key, core_list in self._switchable_cores.items():
+            if core_list is self._current_cores:
+                return key
+        raise AssertionError("The current cores have no key.")
+
+    def get_all_cores(self) -> List[AbstractCore]:
+        """Returns all the cores of the processor, including those which are
+        switched out."""
+        return list(self._all_cores())
+
     def _all_cores(self):
         for core_list in self._switchable_cores.values():
             yield from core_list
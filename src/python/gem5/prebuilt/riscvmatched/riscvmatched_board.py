@@ -37,14 +37,12 @@ from m5.objects import (
     AddrRange,
     BadAddr,
     Bridge,
-    CowDiskImage,
     Frequency,
     HiFive,
     IGbE_e1000,
     IOXBar,
     PMAChecker,
     Port,
-    RawDiskImage,
     RiscvBootloaderKernelWorkload,
     RiscvMmioVirtIO,
     RiscvRTC,
@@ -579,11 +577,7 @@ class RISCVMatchedBoard(
 
     @overrides(KernelDiskWorkload)
     def _add_disk_to_board(self, disk_image: AbstractResource):
-        image = CowDiskImage(
-            child=RawDiskImage(read_only=True), read_only=False
-        )
-        image.child.image_file = disk_image.get_local_path()
-        self.disk.vio.image = image
+        self.disk.vio.image = self._create_disk_image(disk_image)
 
         # Note: The below is a bit of a hack. We need to wait to generate the
         # device tree until after the disk is set up. Now that the disk and
@@ -618,6 +612,7 @@ class RISCVMatchedBoard(
         readfile_contents: Optional[str] = None,
         kernel_args: Optional[List[str]] = None,
         exit_on_work_items: bool = True,
+        disk_overlay: bool = False,
     ) -> None:
         self.workload = RiscvBootloaderKernelWorkload()
         KernelDiskWorkload.set_kernel_disk_workload(
@@ -629,4 +624,5 @@ class RISCVMatchedBoard(
             readfile_contents=readfile_contents,
             kernel_args=kernel_args,
             exit_on_work_items=exit_on_work_items,
+            disk_overlay=disk_overlay,
         )
@@ -287,9 +287,30 @@ def _get_resource_json_obj_from_client(
         resources_list[id] = _sort_resources(resources)
         resource_to_return.append(resources_list[id][0])
 
+    _log_resolved_resources(resource_to_return)
     return resource_to_return
 
 
+def _log_resolved_resources(resources: List[Dict]) -> None:
+    """
+    Appends the ID, version and md5 of each resolved resource, as a line of
+    JSON, to the file named by the ``GEM5_RESOURCE_LOG`` environment
+    variable, if it is set. The test framework uses this to find the runs
+    which depend on resources.
+    """
+    path = os.environ.get("GEM5_RESOURCE_LOG")
+    if not path:
+        return
+    with open(path, "a") as f:
+        for resource in resources:
+            record = {
+                "id": resource.get("id"),
+                "resource_version": resource.get("resource_version"),
+                "md5sum": resource.get("md5sum"),
+            }
+            f.write(json.dumps(record) + "\n")
+
+
 def _get_all_resources_by_id(
     client_queries: List[ClientQuery],
     clients: Optional[List[str]] = None,
@@ -55,6 +55,7 @@ from .md5_utils import (
     md5_dir,
     md5_file,
 )
+from .object_store import ResourceObjectStore
 
 """
 This Python module contains functions used to download, list, and obtain
@@ -199,6 +200,7 @@ def get_resource(
     clients: Optional[List] = None,
     gem5_version: Optional[str] = core.gem5Version,
     quiet: bool = False,
+    object_store_dir: Optional[str] = None,
 ) -> None:
     """
     Obtains a gem5 resource and stored it to a specified location. If the
@@ -236,6 +238,13 @@ def get_resource(
     :param quiet: If ``True``, no output will be printed to the console (baring
                   exceptions). ``False`` by default.
 
+    :param object_store_dir: If set, the resource is stored once in the
+                             content-addressed object store in this directory
+                             and ``to_path`` is created as a link to it. If
+                             the resource is already in the store, no
+                             download or copy takes place. ``None`` by
+                             default.
+
     :raises Exception: An exception is thrown if a file is already present at
                        ``to_path`` but it does not have the correct md5 sum. An
                        exception will also be thrown is a directory is present
@@ -255,6 +264,14 @@ def get_resource(
             gem5_version=gem5_version,
         )
 
+        store = None
+        if object_store_dir:
+            store = ResourceObjectStore(object_store_dir)
+            if store.is_linked(resource_json["md5sum"], to_path):
+                # The resource is already linked to the correct object. There
+                # is no need to compute its md5 sum.
+                return
+
         if os.path.exists(to_path):
             if os.path.isfile(to_path):
                 md5 = md5_file(Path(to_path))
@@ -264,6 +281,8 @@ def get_resource(
             if md5 == resource_json["md5sum"]:
                 # In this case, the file has already been download, no need to
                 # do so again.
+                if store:
+                    store.add(to_path, resource_json["md5sum"])
                 return
             elif download_md5_mismatch:
                 if os.path.isfile(to_path):
@@ -276,6 +295,15 @@ def get_resource(
                     "its md5 value is invalid.".format(to_path)
                 )
 
+        if store and store.contains(resource_json["md5sum"]):
+            if not quiet:
+                print(
+                    f"Resource '{resource_name}' found in the object store "
+                    f"'{store.get_directory()}'. Linking to '{to_path}'."
+                )
+            store.link(resource_json["md5sum"], to_path)
+            return
+
         download_dest = to_path
 
         # This if-statement is remain backwards compatable with the older,
@@ -388,6 +416,9 @@ def get_resource(
                 safe_extract(f, unpack_to)
             os.remove(download_dest)
 
+        if store:
+            store.add(to_path, resource_json["md5sum"])
+
 
 def _file_uri_to_path(uri: str) -> Optional[Path]:
     """
@@ -24,7 +24,6 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-import csv
 import json
 import os
 from pathlib import Path
@@ -313,7 +312,13 @@ class Looppoint:
 
         :param processor: The processor used in the simulation configuration.
         """
-        for core in processor.get_cores():
+        # The switched-out cores of a `SwitchableProcessor` are tracked too,
+        # so that the tracking continues after the cores are switched.
+        if hasattr(processor, "get_all_cores"):
+            cores = processor.get_all_cores()
+        else:
+            cores = processor.get_cores()
+        for core in cores:
             core.add_pc_tracker_probe(self.get_targets(), self.get_manager())
 
     def update_relatives_counts(self) -> None:
@@ -415,53 +420,55 @@ class LooppointCsvLoader(Looppoint):
         )
 
         # This section is hard-coded to parse the data in the csv file.
-        # The csv file is assumed to have a constant format.
-        with open(_path, newline="") as csvfile:
-            reader = csv.reader(csvfile, delimiter=" ", quotechar="|")
-            for row in reader:
-                if len(row) > 1:
-                    if row[0] == "cluster":
-                        # if it is a simulation region
-                        line = row[4].split(",")
-
-                        rid = int(line[2])
-
-                        region_start = LooppointRegionPC(
-                            pc=int(line[3], 16),
-                            globl=int(line[6]),
-                            # From the CSV's I've observed, the start relative
-                            # value is never set, while the end is always set.
-                            # Given limited information, I can only determine
-                            # this is a rule of how the CSV is setup.
-                            relative=None,
-                        )
-
-                        region_end = LooppointRegionPC(
-                            pc=int(line[7], 16),
-                            globl=int(line[10]),
-                            relative=int(line[11]),
-                        )
-
-                        simulation = LooppointSimulation(
-                            start=region_start, end=region_end
-                        )
-
-                        multiplier = float(line[14])
-
-                        region = LooppointRegion(
-                            simulation=simulation, multiplier=multiplier
-                        )
-
-                        regions[rid] = region
-
-                    elif row[0] == "Warmup":
-                        line = row[3].split(",")
-                        rid = int(line[0])
-                        start = PcCountPair(int(line[3], 16), int(line[6]))
-                        end = PcCountPair(int(line[7], 16), int(line[10]))
-
-                        warmup = LooppointRegionWarmup(start=start, end=end)
-                        warmups[rid] = warmup
+        # The csv file is assumed to have a constant format. The data of a
+        # region is a comma-separated list which follows a space-separated
+        # prefix. E.g., "cluster 0 from slice 27,global,1,0x4069d0,...". Only
+        # "cluster" (simulation region) and "Warmup" lines are of interest, so
+        # all other lines are skipped without being split.
+        with open(_path) as csvfile:
+            for row in csvfile:
+                if row.startswith("cluster "):
+                    # if it is a simulation region
+                    line = row.split(" ", 4)[4].rstrip().split(",")
+
+                    rid = int(line[2])
+
+                    region_start = LooppointRegionPC(
+                        pc=int(line[3], 16),
+                        globl=int(line[6]),
+                        # From the CSV's I've observed, the start relative
+                        # value is never set, while the end is always set.
+                        # Given limited information, I can only determine
+                        # this is a rule of how the CSV is setup.
+                        relative=None,
+                    )
+
+                    region_end = LooppointRegionPC(
+                        pc=int(line[7], 16),
+                        globl=int(line[10]),
+                        relative=int(line[11]),
+                    )
+
+                    simulation = LooppointSimulation(
+                        start=region_start, end=region_end
+                    )
+
+                    multiplier = float(line[14])
+
+                    region = LooppointRegion(
+                        simulation=simulation, multiplier=multiplier
+                    )
+
+                    regions[rid] = region
+
+                elif row.startswith("Warmup "):
+                    line = row.split(" ", 3)[3].rstrip().split(",")
+                    rid = int(line[0])
+                    start = PcCountPair(int(line[3], 16), int(line[6]))
+                    end = PcCountPair(int(line[7], 16), int(line[10]))
+
+                    warmup = LooppointRegionWarmup(start=start, end=end)
+                    warmups[rid] = warmup
 
         for rid in warmups:
             if rid not in regions:
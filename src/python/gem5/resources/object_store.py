@@ -0,0 +1,282 @@
+# Copyright (c) 2026 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+A content-addressed store for gem5 resources.
+
+When enabled, each obtained resource is stored exactly once under
+``<resource_directory>/objects/<md5>``. The path a resource is obtained to
+(``<resource_directory>/<id>``, ``<id>-<version>`` or a ``to_path``
+override) is then a hard link to that object or, where hard links are not
+possible (e.g., across file systems), a reflink or plain copy.
+
+Obtaining a resource which is already present in the store is therefore a
+matter of creating a link. Objects which are no longer linked from any
+resource path can be removed with the garbage collector:
+
+.. code-block:: sh
+
+    gem5 -m gem5.resources.object_store gc [--dry-run] <resource_directory>
+
+.. note::
+
+    Hard-linked resources share their data with the store. Resources should
+    therefore be treated as read-only. For example, disk images should be
+    used via a copy-on-write overlay rather than modified in place.
+"""
+
+import errno
+import os
+import shutil
+from pathlib import Path
+from typing import (
+    List,
+    Union,
+)
+
+from ..utils.filelock import FileLock
+from .md5_utils import md5
+
+# The Linux `FICLONE` ioctl request number. Used to create reflinks
+# (copy-on-write clones) on file systems which support them (btrfs, XFS).
+_FICLONE = 0x40049409
+
+
+def _clone_file(src: Path, dst: Path) -> None:
+    """Create ``dst`` as a copy of ``src``, preferring a reflink if the host
+    and file system support it.
+    """
+    try:
+        import fcntl
+
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+        shutil.copystat(src, dst)
+        return
+    except (ImportError, OSError):
+        # Either not on Linux or the file system does not support reflinks.
+        pass
+    shutil.copy2(src, dst)
+
+
+def _link_file(src: Path, dst: Path) -> None:
+    """Hard link ``dst`` to ``src``, falling back to a clone if a hard link
+    cannot be created (e.g., ``src`` and ``dst`` are on different devices).
+    """
+    try:
+        os.link(src, dst)
+    except OSError as e:
+        if e.errno not in (errno.EXDEV, errno.EPERM, errno.EMLINK):
+            raise
+        _clone_file(src, dst)
+
+
+class ResourceObjectStore:
+    """A store of resources, keyed by their md5 sum."""
+
+    def __init__(self, directory: Union[str, Path]):
+        """
+        :param directory: The directory in which objects are stored. This is
+                          typically ``<resource_directory>/objects``.
+        """
+        self._directory = Path(directory)
+
+    def get_directory(self) -> Path:
+        """Returns the directory in which the objects are stored."""
+        return self._directory
+
+    def get_object_path(self, md5sum: str) -> Path:
+        """Returns the path of the object with the given md5 sum. The object
+        need not exist.
+        """
+        return self._directory / md5sum
+
+    def contains(self, md5sum: str) -> bool:
+        """Returns ``True`` if an object with the given md5 sum is in the
+        store.
+        """
+        return self.get_object_path(md5sum).exists()
+
+    def is_linked(self, md5sum: str, path: Union[str, Path]) -> bool:
+        """Returns ``True`` if ``path`` is a hard link to the object with the
+        given md5 sum. This is a metadata-only check: the contents of
+        ``path`` are not hashed.
+        """
+        obj = self.get_object_path(md5sum)
+        path = Path(path)
+        if not obj.exists() or not path.exists():
+            return False
+        if obj.is_file():
+            return path.is_file() and os.path.samefile(obj, path)
+        if not path.is_dir():
+            return False
+        for root, dirs, files in os.walk(obj):
+            rel = Path(root).relative_to(obj)
+            if sorted(os.listdir(path / rel)) != sorted(dirs + files):
+                return False
+            for name in files:
+                if not os.path.samefile(Path(root) / name, path / rel / name):
+                    return False
+        return True
+
+    def link(self, md5sum: str, to_path: Union[str, Path]) -> None:
+        """Create ``to_path`` as a link to the object with the given md5 sum.
+        Directory objects are recreated at ``to_path`` with each file linked.
+
+        :raises Exception: If the object is not in the store or if
+                           ``to_path`` already exists.
+        """
+        obj = self.get_object_path(md5sum)
+        to_path = Path(to_path)
+        if not obj.exists():
+            raise Exception(f"Object '{md5sum}' is not in the store.")
+        if to_path.exists():
+            raise Exception(f"Cannot link object to '{to_path}': it exists.")
+
+        if obj.is_file():
+            _link_file(obj, to_path)
+        else:
+            shutil.copytree(obj, to_path, copy_function=_link_file)
+
+    def add(self, path: Union[str, Path], md5sum: str) -> None:
+        """Add the file or directory at ``path`` to the store under the given
+        md5 sum, then replace ``path`` with a link to the stored object.
+
+        If an object with this md5 sum is already present, ``path`` is
+        replaced with a link to the existing object.
+
+        :raises Exception: If the md5 sum of ``path`` is not ``md5sum``.
+        """
+        path = Path(path)
+        obj = self.get_object_path(md5sum)
+        self._directory.mkdir(parents=True, exist_ok=True)
+
+        with FileLock(f"{obj}.lock", timeout=900):
+            if self.is_linked(md5sum, path):
+                return
+
+            if not obj.exists():
+                actual = md5(path)
+                if actual != md5sum:
+                    raise Exception(
+                        f"Cannot add '{path}' to the resource object store: "
+                        f"its md5 sum is '{actual}', expected '{md5sum}'."
+                    )
+                # Moving into a temporary path first ensures a partially
+                # moved object (e.g., a cross-device move) is never visible
+                # under its final name.
+                tmp = obj.with_name(f"{md5sum}.tmp")
+                if tmp.is_dir():
+                    shutil.rmtree(tmp)
+                elif tmp.exists():
+                    os.remove(tmp)
+                shutil.move(str(path), str(tmp))
+                os.replace(tmp, obj)
+            elif path.is_dir():
+                shutil.rmtree(path)
+            else:
+                os.remove(path)
+
+            self.link(md5sum, path)
+
+    def _is_referenced(self, obj: Path) -> bool:
+        """An object is referenced if any of its files have a hard link
+        outside the store.
+        """
+        if obj.is_file():
+            return obj.stat().st_nlink > 1
+        for root, _, files in os.walk(obj):
+            for name in files:
+                if (Path(root) / name).stat().st_nlink > 1:
+                    return True
+        return False
+
+    def collect_garbage(self, dry_run: bool = False) -> List[Path]:
+        """Remove all objects which are not linked from any resource path.
+
+        Resources obtained via a reflink or copy (because a hard link was not
+        possible) do not reference the store and do not keep an object alive.
+
+        :param dry_run: If ``True`` the unreferenced objects are reported but
+                        not removed.
+
+        :returns: The paths of the unreferenced objects.
+        """
+        removed = []
+        if not self._directory.is_dir():
+            return removed
+
+        for obj in sorted(self._directory.iterdir()):
+            if obj.suffix in (".lock", ".tmp"):
+                continue
+            with FileLock(f"{obj}.lock", timeout=900):
+                if self._is_referenced(obj):
+                    continue
+                removed.append(obj)
+                if dry_run:
+                    continue
+                if obj.is_dir():
+                    shutil.rmtree(obj)
+                else:
+                    os.remove(obj)
+        return removed
+
+
+def get_object_store_directory(resource_directory: Union[str, Path]) -> Path:
+    """Returns the object store directory for a resource directory."""
+    return Path(resource_directory) / "objects"
+
+
+if __name__ == "__m5_main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Manage a gem5 resource object store."
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    gc_parser = subparsers.add_parser(
+        "gc", help="Remove objects not referenced by any resource path."
+    )
+    gc_parser.add_argument(
+        "resource_directory",
+        type=str,
+        help="The resource directory containing the object store.",
+    )
+    gc_parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="List the unreferenced objects without removing them.",
+    )
+
+    args = parser.parse_args()
+
+    if args.command == "gc":
+        store = ResourceObjectStore(
+            get_object_store_directory(args.resource_directory)
+        )
+        for obj in store.collect_garbage(dry_run=args.dry_run):
+            print(f"{'Unreferenced' if args.dry_run else 'Removed'}: {obj}")
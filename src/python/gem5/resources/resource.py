@@ -62,6 +62,11 @@ from .looppoint import (
     LooppointCsvLoader,
     LooppointJsonLoader,
 )
+from .object_store import get_object_store_directory
+from .simpoint_utils import (
+    compute_warmup,
+    load_simpoints_and_weights,
+)
 
 """
 Resources are items needed to run a simulation, such as a disk image, kernel,
@@ -486,6 +491,7 @@ class SimpointResource(AbstractResource):
         self._workload_name = workload_name
 
         self._simpoint_start_insts = None
+        self._warmup_list = None
 
     def _load_simpoints(self) -> None:
         """As we cache downloading of resources until we require it, we may
@@ -502,7 +508,7 @@ class SimpointResource(AbstractResource):
         if self.get_warmup_interval() != 0:
             self._warmup_list = self._set_warmup_list()
         else:
-            self._warmup_list = [0] * len(self.get_simpoint_start_insts)
+            self._warmup_list = [0] * len(self._simpoint_start_insts)
 
     def get_simpoint_list(self) -> List[int]:
         """Returns the a list containing all the SimPoints for the workload."""
@@ -569,17 +575,11 @@ class SimpointResource(AbstractResource):
         instruction length is the gap between the starting instruction of a
         SimPoint and the ending instruction of the last SimPoint.
         """
-        warmup_list = []
-        for index, start_inst in enumerate(self.get_simpoint_start_insts()):
-            warmup_inst = start_inst - self.get_warmup_interval()
-            if warmup_inst < 0:
-                warmup_inst = start_inst
-            else:
-                warmup_inst = self.get_warmup_interval()
-            warmup_list.append(warmup_inst)
-            # change the starting instruction of a SimPoint to include the
-            # warmup instruction length
-            self._simpoint_start_insts[index] = start_inst - warmup_inst
+        # The starting instruction of each SimPoint is changed to include the
+        # warmup instruction length.
+        self._simpoint_start_insts, warmup_list = compute_warmup(
+            self.get_simpoint_start_insts(), self.get_warmup_interval()
+        )
         return warmup_list
 
     def get_category_name(cls) -> str:
@@ -709,30 +709,19 @@ class SimpointDirectoryResource(SimpointResource):
     ) -> Tuple[List[int], List[int]]:
         """This is a helper function to extract the weights and SimPoints from
         the files.
+
+        The parsed files are cached in a binary form alongside the resource
+        directory (not inside it, as this would change its md5 sum) so later
+        loads do not need to re-parse them.
         """
-        simpoint_weight_pair = []
-        with open(self.get_simpoint_file()) as simpoint_file, open(
-            self.get_weight_file()
-        ) as weight_file:
-            while True:
-                line = simpoint_file.readline()
-                if not line:
-                    break
-                interval = int(line.split(" ", 1)[0])
-                line = weight_file.readline()
-                if not line:
-                    fatal("not engough weights")
-                weight = float(line.split(" ", 1)[0])
-                simpoint_weight_pair.append((interval, weight))
-        simpoint_weight_pair.sort(key=lambda obj: obj[0])
-        # use simpoint to sort
-
-        weight_list = []
-        simpoint_list = []
-        for simpoint, weight in simpoint_weight_pair:
-            simpoint_list.append(simpoint)
-            weight_list.append(weight)
-        return simpoint_list, weight_list
+        local_path = Path(self.get_local_path())
+        return load_simpoints_and_weights(
+            simpoint_path=self.get_simpoint_file(),
+            weight_path=self.get_weight_file(),
+            cache_path=local_path.with_name(
+                f".{local_path.name}.simpoints.cache"
+            ),
+        )
 
     def get_category_name(cls) -> str:
         return "SimpointDirectoryResource"
@@ -919,6 +908,7 @@ def obtain_resource(
     gem5_version=core.gem5Version,
     to_path: Optional[str] = None,
     quiet: bool = False,
+    use_object_store: Optional[bool] = None,
 ) -> AbstractResource:
     """
     This function primarily serves as a factory for resources. It will return
@@ -952,6 +942,14 @@ def obtain_resource(
                     **Note**: Usage of this parameter will override the
                     ``resource_directory`` parameter.
     :param quiet: If ``True``, suppress output. ``False`` by default.
+    :param use_object_store: If ``True``, the resource is stored once in the
+                             content-addressed object store under
+                             ``<resource_directory>/objects/<md5>`` and the
+                             resource path is a link to it. See
+                             ``gem5.resources.object_store``. If ``None``, it
+                             is enabled if the ``GEM5_RESOURCE_OBJECT_STORE``
+                             environment variable is set to a non-zero value.
+                             ``None`` by default.
     """
 
     # Obtain the resource object entry for this resource
@@ -970,6 +968,7 @@ def obtain_resource(
         clients=clients,
         gem5_version=gem5_version,
         quiet=quiet,
+        use_object_store=use_object_store,
     )
 
     # Obtain the type from the JSON. From this we will determine what subclass
@@ -1003,6 +1002,7 @@ def obtain_resource(
             clients,
             gem5_version,
             quiet,
+            use_object_store,
         )
     if resources_category == "workload":
         # This parses the "resources" and "additional_params" fields of the
@@ -1016,6 +1016,7 @@ def obtain_resource(
             clients,
             gem5_version,
             quiet,
+            use_object_store,
         )
     # Once we know what AbstractResource subclass we are using, we create it.
     # The fields in the JSON object are assumed to map like-for-like to the
@@ -1033,6 +1034,7 @@ def _get_suite(
     clients: List[str],
     gem5_version: str,
     quiet: bool,
+    use_object_store: Optional[bool] = None,
 ) -> SuiteResource:
     """
     :param suite: The suite JSON object.
@@ -1048,6 +1050,7 @@ def _get_suite(
                          resource versions. By default set to the current gem5
                          version.
     :param quiet: If ``True``, suppress output. ``False`` by default.
+    :param use_object_store: Whether to use the resource object store.
     """
     # Mapping input groups to workload IDs
     id_input_group_dict = {}
@@ -1078,6 +1081,7 @@ def _get_suite(
                 clients,
                 gem5_version,
                 quiet,
+                use_object_store,
             )
         ] = id_input_group_dict[workload["id"]]
 
@@ -1097,6 +1101,7 @@ def _get_workload(
     clients: List[str],
     gem5_version: str,
     quiet: bool,
+    use_object_store: Optional[bool] = None,
 ) -> WorkloadResource:
     """
     :param workload: The workload JSON object.
@@ -1112,6 +1117,7 @@ def _get_workload(
                          resource versions. By default set to the current gem5
                          version.
     :param quiet: If ``True``, suppress output. ``False`` by default.
+    :param use_object_store: Whether to use the resource object store.
     """
     params = {}
 
@@ -1152,6 +1158,7 @@ def _get_workload(
             clients=clients,
             gem5_version=gem5_version,
             quiet=quiet,
+            use_object_store=use_object_store,
         )
 
         resource_class = _get_resource_json_type_map[
@@ -1190,6 +1197,7 @@ def _get_to_path_and_downloader_partial(
     clients: List[str],
     gem5_version: str,
     quiet: bool,
+    use_object_store: Optional[bool] = None,
 ) -> Tuple[str, Optional[partial]]:
     resource_id = resource_json["id"]
     resource_version = resource_json["resource_version"]
@@ -1197,21 +1205,28 @@ def _get_to_path_and_downloader_partial(
     # the resource when the `get_local_path` function is called.
     downloader: Optional[partial] = None
 
+    if use_object_store is None:
+        use_object_store = os.getenv(
+            "GEM5_RESOURCE_OBJECT_STORE", "0"
+        ).lower() not in ("", "0", "false", "no")
+
     # If the "url" field is specified, the resoruce must be downloaded.
     if "url" in resource_json and resource_json["url"]:
+        # If the `resource_directory` parameter is not set via this
+        # function, we heck the "GEM5_RESOURCE_DIR" environment variable.
+        # If this too is not set we call `_get_default_resource_dir()` to
+        # determine where the resource directory is, or should be, located.
+        # The resource directory is needed, even if `to_path` is set, when
+        # using the object store.
+        if resource_directory == None and (not to_path or use_object_store):
+            resource_directory = os.getenv(
+                "GEM5_RESOURCE_DIR", _get_default_resource_dir()
+            )
+
         # If the `to_path` parameter is set, we use that as the path to which
         # the resource is to be downloaded. Otherwise, default to the
         # `resource_directory` parameter plus the resource ID.
         if not to_path:
-            # If the `resource_directory` parameter is not set via this
-            # function, we heck the "GEM5_RESOURCE_DIR" environment variable.
-            # If this too is not set we call `_get_default_resource_dir()` to
-            # determine where the resource directory is, or should be, located.
-            if resource_directory == None:
-                resource_directory = os.getenv(
-                    "GEM5_RESOURCE_DIR", _get_default_resource_dir()
-                )
-
             # Small checks here to ensure the resource directory is valid.
             if os.path.exists(resource_directory):
                 if not os.path.isdir(resource_directory):
@@ -1255,6 +1270,11 @@ def _get_to_path_and_downloader_partial(
             clients=clients,
             gem5_version=gem5_version,
             quiet=quiet,
+            object_store_dir=(
+                str(get_object_store_directory(resource_directory))
+                if use_object_store
+                else None
+            ),
         )
     return to_path, downloader
 
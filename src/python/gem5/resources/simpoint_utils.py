@@ -0,0 +1,229 @@
+# Copyright (c) 2026 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Helper functions for loading SimPoint data and computing SimPoint warmup
+intervals.
+
+If NumPy is installed, the SimPoint and weight files are parsed and sorted as
+arrays and the warmup arithmetic is vectorized. Otherwise an equivalent pure
+Python implementation is used. In both cases the parsed files are cached in a
+binary form alongside the SimPoint files so subsequent loads do not need to
+re-parse them.
+"""
+
+import json
+import os
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import (
+    List,
+    Optional,
+    Tuple,
+)
+
+try:
+    import numpy as np
+
+    _have_numpy = True
+except ImportError:
+    _have_numpy = False
+
+# Identifies a SimPoint cache file. The trailing byte is the format version.
+_CACHE_MAGIC = b"gem5spc\x01"
+
+
+def _read_first_column(path: Path, dtype: type) -> List:
+    """Reads the first whitespace-separated column of each non-empty line of
+    a file.
+    """
+    with open(path) as f:
+        return [dtype(line.split(None, 1)[0]) for line in f if line.strip()]
+
+
+def _cache_key(simpoint_path: Path, weight_path: Path) -> Tuple:
+    """Returns a key identifying the current contents of the SimPoint and
+    weight files. The cache is invalidated if either file changes.
+    """
+    key = []
+    for path in (simpoint_path, weight_path):
+        stat = os.stat(path)
+        key.extend([str(Path(path).resolve()), stat.st_size, stat.st_mtime_ns])
+    return tuple(key)
+
+
+def _load_cache(
+    cache_path: Path, key: Tuple
+) -> Optional[Tuple[List[int], List[float]]]:
+    """Loads the SimPoints and weights from a binary cache file. ``None`` is
+    returned if the cache does not exist or is not valid for ``key``.
+    """
+    try:
+        with open(cache_path, "rb") as f:
+            if f.read(len(_CACHE_MAGIC)) != _CACHE_MAGIC:
+                return None
+            (key_len,) = struct.unpack("<Q", f.read(8))
+            if tuple(json.loads(f.read(key_len))) != key:
+                return None
+            (count,) = struct.unpack("<Q", f.read(8))
+            simpoints = array("q")
+            simpoints.fromfile(f, count)
+            weights = array("d")
+            weights.fromfile(f, count)
+    except (OSError, EOFError, ValueError, struct.error):
+        # A missing, truncated or otherwise invalid cache is ignored.
+        return None
+    if sys.byteorder != "little":
+        simpoints.byteswap()
+        weights.byteswap()
+    return simpoints.tolist(), weights.tolist()
+
+
+def _save_cache(
+    cache_path: Path, key: Tuple, simpoints: List[int], weights: List[float]
+) -> None:
+    """Saves the SimPoints and weights to a binary cache file."""
+    simpoint_array = array("q", simpoints)
+    weight_array = array("d", weights)
+    if sys.byteorder != "little":
+        simpoint_array.byteswap()
+        weight_array.byteswap()
+    encoded_key = json.dumps(key).encode()
+
+    # The cache is written to a temporary file and atomically moved into place
+    # so concurrent loaders never see a partially written cache.
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(_CACHE_MAGIC)
+            f.write(struct.pack("<Q", len(encoded_key)))
+            f.write(encoded_key)
+            f.write(struct.pack("<Q", len(simpoints)))
+            simpoint_array.tofile(f)
+            weight_array.tofile(f)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # The cache is an optimization. If it cannot be written (e.g., the
+        # directory is read-only) the files are simply re-parsed next time.
+        if tmp_path.exists():
+            os.remove(tmp_path)
+
+
+def load_simpoints_and_weights(
+    simpoint_path: Path,
+    weight_path: Path,
+    cache_path: Optional[Path] = None,
+) -> Tuple[List[int], List[float]]:
+    """
+    Loads SimPoints and their weights from a SimPoint file and a weight file,
+    as generated by SimPoint 3.2 or gem5. Only the first column of each file
+    is used. The SimPoints are returned sorted in ascending order with the
+    weights in the corresponding order.
+
+    :param simpoint_path: The path to the SimPoint file.
+    :param weight_path: The path to the weight file.
+    :param cache_path: The path of the binary cache for these files. If
+                       ``None``, no cache is used.
+
+    :returns: A tuple of the sorted SimPoint list and the weight list.
+
+    :raises Exception: If there are fewer weights than SimPoints.
+    """
+    key = None
+    if cache_path:
+        key = _cache_key(simpoint_path, weight_path)
+        cached = _load_cache(cache_path, key)
+        if cached:
+            return cached
+
+    if _have_numpy:
+        simpoints = np.atleast_1d(
+            np.loadtxt(simpoint_path, dtype=np.int64, usecols=0, ndmin=1)
+        )
+        weights = np.atleast_1d(
+            np.loadtxt(weight_path, dtype=np.float64, usecols=0, ndmin=1)
+        )
+    else:
+        simpoints = _read_first_column(simpoint_path, int)
+        weights = _read_first_column(weight_path, float)
+
+    if len(weights) < len(simpoints):
+        raise Exception(
+            f"Not enough weights in '{weight_path}' for the SimPoints in "
+            f"'{simpoint_path}'."
+        )
+
+    if _have_numpy:
+        weights = weights[: len(simpoints)]
+        # A stable sort keeps the original relative order of any duplicate
+        # SimPoints, matching the sort on the (SimPoint, weight) pairs.
+        order = np.argsort(simpoints, kind="stable")
+        simpoint_list = simpoints[order].tolist()
+        weight_list = weights[order].tolist()
+    else:
+        pairs = sorted(zip(simpoints, weights), key=lambda pair: pair[0])
+        simpoint_list = [simpoint for simpoint, _ in pairs]
+        weight_list = [weight for _, weight in pairs]
+
+    if cache_path:
+        _save_cache(cache_path, key, simpoint_list, weight_list)
+
+    return simpoint_list, weight_list
+
+
+def compute_warmup(
+    start_insts: List[int], warmup_interval: int
+) -> Tuple[List[int], List[int]]:
+    """
+    Fits the ``warmup_interval`` in before each SimPoint starting instruction.
+
+    The warmup length of each SimPoint is the ``warmup_interval``, unless the
+    SimPoint starts less than ``warmup_interval`` instructions into the
+    workload, in which case it is the SimPoint's starting instruction (i.e.,
+    the warmup begins at instruction 0).
+
+    :param start_insts: The starting instruction of each SimPoint.
+    :param warmup_interval: The warmup interval length in instructions.
+
+    :returns: A tuple of the starting instructions adjusted to include the
+              warmup and the warmup length of each SimPoint.
+    """
+    if _have_numpy:
+        starts = np.asarray(start_insts, dtype=np.int64)
+        warmups = np.where(
+            starts - warmup_interval < 0, starts, warmup_interval
+        )
+        return (starts - warmups).tolist(), warmups.tolist()
+
+    warmups = [
+        start if start - warmup_interval < 0 else warmup_interval
+        for start in start_insts
+    ]
+    return [
+        start - warmup for start, warmup in zip(start_insts, warmups)
+    ], warmups
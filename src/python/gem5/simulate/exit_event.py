@@ -25,6 +25,7 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 from enum import Enum
+from typing import List
 
 
 class ExitEvent(Enum):
@@ -70,47 +71,10 @@ class ExitEvent(Enum):
             given an exit event.
         """
 
-        if exit_string == "m5_workbegin instruction encountered":
-            return ExitEvent.WORKBEGIN
-        elif exit_string == "workbegin":
-            return ExitEvent.WORKBEGIN
-        elif exit_string == "m5_workend instruction encountered":
-            return ExitEvent.WORKEND
-        elif exit_string == "workend":
-            return ExitEvent.WORKEND
-        elif exit_string == "m5_exit instruction encountered":
-            return ExitEvent.EXIT
-        elif exit_string == "exiting with last active thread context":
-            return ExitEvent.EXIT
-        elif exit_string == "simulate() limit reached":
-            return ExitEvent.MAX_TICK
-        elif exit_string == "Tick exit reached":
-            return ExitEvent.SCHEDULED_TICK
-        elif exit_string == "switchcpu":
-            return ExitEvent.SWITCHCPU
-        elif exit_string == "m5_fail instruction encountered":
-            return ExitEvent.FAIL
-        elif exit_string == "checkpoint":
-            return ExitEvent.CHECKPOINT
-        elif exit_string == "user interrupt received":
-            return ExitEvent.USER_INTERRUPT
-        elif exit_string == "simpoint starting point found":
-            return ExitEvent.SIMPOINT_BEGIN
-        elif exit_string == "a thread reached the max instruction count":
-            return ExitEvent.MAX_INSTS
-        elif exit_string == "performance counter enabled":
-            return ExitEvent.PERF_COUNTER_ENABLE
-        elif exit_string == "performance counter disabled":
-            return ExitEvent.PERF_COUNTER_DISABLE
-        elif exit_string == "performance counter reset":
-            return ExitEvent.PERF_COUNTER_RESET
-        elif exit_string == "performance counter interrupt":
-            return ExitEvent.PERF_COUNTER_INTERRUPT
-        elif exit_string == "Kernel panic in simulated system.":
-            return ExitEvent.KERNEL_PANIC
-        elif exit_string == "Kernel oops in simulated system.":
-            return ExitEvent.KERNEL_OOPS
-        elif exit_string.endswith("will terminate the simulation.\n"):
+        exit_event = _EXIT_STRINGS.get(exit_string)
+        if exit_event is not None:
+            return exit_event
+        if exit_string.endswith("will terminate the simulation.\n"):
             # This is for the traffic generator exit event
             return ExitEvent.EXIT
         elif exit_string.endswith("is finished updating the memory.\n"):
@@ -121,3 +85,40 @@ class ExitEvent(Enum):
         raise NotImplementedError(
             f"Exit event '{exit_string}' not implemented"
         )
+
+    @classmethod
+    def get_exit_strings(cls, exit_event: "ExitEvent") -> List[str]:
+        """Returns the exit strings which are translated to the given exit
+        event by ``translate_exit_status``. Exit strings which are matched by
+        their suffix (e.g., those of traffic generators) are not included.
+        """
+        return [
+            exit_string
+            for exit_string, event in _EXIT_STRINGS.items()
+            if event == exit_event
+        ]
+
+
+# The exit strings translated by ``ExitEvent.translate_exit_status``.
+_EXIT_STRINGS = {
+    "m5_workbegin instruction encountered": ExitEvent.WORKBEGIN,
+    "workbegin": ExitEvent.WORKBEGIN,
+    "m5_workend instruction encountered": ExitEvent.WORKEND,
+    "workend": ExitEvent.WORKEND,
+    "m5_exit instruction encountered": ExitEvent.EXIT,
+    "exiting with last active thread context": ExitEvent.EXIT,
+    "simulate() limit reached": ExitEvent.MAX_TICK,
+    "Tick exit reached": ExitEvent.SCHEDULED_TICK,
+    "switchcpu": ExitEvent.SWITCHCPU,
+    "m5_fail instruction encountered": ExitEvent.FAIL,
+    "checkpoint": ExitEvent.CHECKPOINT,
+    "user interrupt received": ExitEvent.USER_INTERRUPT,
+    "simpoint starting point found": ExitEvent.SIMPOINT_BEGIN,
+    "a thread reached the max instruction count": ExitEvent.MAX_INSTS,
+    "performance counter enabled": ExitEvent.PERF_COUNTER_ENABLE,
+    "performance counter disabled": ExitEvent.PERF_COUNTER_DISABLE,
+    "performance counter reset": ExitEvent.PERF_COUNTER_RESET,
+    "performance counter interrupt": ExitEvent.PERF_COUNTER_INTERRUPT,
+    "Kernel panic in simulated system.": ExitEvent.KERNEL_PANIC,
+    "Kernel oops in simulated system.": ExitEvent.KERNEL_OOPS,
+}
@@ -60,6 +60,30 @@ def warn_default_decorator(gen: Generator, type: str, effect: str):
     return wrapped_generator
 
 
+def _checkpoint(
+    checkpoint_dir: Path,
+    max_async_writers: int,
+    compression_level: int,
+    sparse_memory: bool,
+) -> None:
+    """Takes a checkpoint, written in a forked process if
+    ``max_async_writers`` is non-zero.
+    """
+    if max_async_writers:
+        m5.asyncCheckpoint(
+            checkpoint_dir.as_posix(),
+            max_writers=max_async_writers,
+            compression_level=compression_level,
+            sparse_memory=sparse_memory,
+        )
+    else:
+        m5.checkpoint(
+            checkpoint_dir.as_posix(),
+            compression_level=compression_level,
+            sparse_memory=sparse_memory,
+        )
+
+
 def exit_generator():
     """
     A default generator for an exit event. It will return ``True``, indicating that
@@ -97,20 +121,39 @@ def dump_reset_generator():
         yield False
 
 
-def save_checkpoint_generator(checkpoint_dir: Optional[Path] = None):
+def save_checkpoint_generator(
+    checkpoint_dir: Optional[Path] = None,
+    max_async_writers: int = 0,
+    compression_level: int = -1,
+    sparse_memory: bool = False,
+):
     """
     A generator for taking a checkpoint. It will take a checkpoint with the
     input path and the current simulation ``Ticks``.
 
     The Simulation run loop will continue after executing the behavior of the
     generator.
+
+    :param max_async_writers: If non-zero, each checkpoint is written by a
+                              forked process while the simulation continues,
+                              with at most this many written at once. See
+                              ``m5.asyncCheckpoint``.
+    :param compression_level: The zlib compression level (0-9) of the memory
+                              images. -1 uses zlib's default.
+    :param sparse_memory: Write the memory images as sparse images, which
+                          omit the pages which are all zero.
     """
     if not checkpoint_dir:
         from m5 import options
 
         checkpoint_dir = Path(options.outdir)
     while True:
-        m5.checkpoint((checkpoint_dir / f"cpt.{str(m5.curTick())}").as_posix())
+        _checkpoint(
+            checkpoint_dir / f"cpt.{str(m5.curTick())}",
+            max_async_writers,
+            compression_level,
+            sparse_memory,
+        )
         yield False
 
 
@@ -144,7 +187,11 @@ def skip_generator():
 
 
 def simpoints_save_checkpoint_generator(
-    checkpoint_dir: Path, simpoint: SimpointResource
+    checkpoint_dir: Path,
+    simpoint: SimpointResource,
+    max_async_writers: int = 0,
+    compression_level: int = -1,
+    sparse_memory: bool = False,
 ):
     """
     A generator for taking multiple checkpoints for SimPoints. It will save the
@@ -152,12 +199,21 @@ def simpoints_save_checkpoint_generator(
     The Simulation run loop will continue after executing the behavior of the
     generator until all the SimPoints in the ``simpoint_list`` has taken a
     checkpoint.
+
+    :param max_async_writers: See ``save_checkpoint_generator``.
+    :param compression_level: See ``save_checkpoint_generator``.
+    :param sparse_memory: See ``save_checkpoint_generator``.
     """
     simpoint_list = simpoint.get_simpoint_start_insts()
     count = 0
     last_start = -1
     while True:
-        m5.checkpoint((checkpoint_dir / f"cpt.SimPoint{count}").as_posix())
+        _checkpoint(
+            checkpoint_dir / f"cpt.SimPoint{count}",
+            max_async_writers,
+            compression_level,
+            sparse_memory,
+        )
         last_start = simpoint_list[count]
         count += 1
         # When the next SimPoint starting instruction is the same as the last
@@ -168,7 +224,12 @@ def simpoints_save_checkpoint_generator(
         while (
             count < len(simpoint_list) and last_start == simpoint_list[count]
         ):
-            m5.checkpoint((checkpoint_dir / f"cpt.SimPoint{count}").as_posix())
+            _checkpoint(
+                checkpoint_dir / f"cpt.SimPoint{count}",
+                max_async_writers,
+                compression_level,
+                sparse_memory,
+            )
             last_start = simpoint_list[count]
             count += 1
         # When there are remaining SimPoints in the list, let the Simulation
@@ -184,6 +245,9 @@ def looppoint_save_checkpoint_generator(
     looppoint: Looppoint,
     update_relatives: bool = True,
     exit_when_empty: bool = True,
+    max_async_writers: int = 0,
+    compression_level: int = -1,
+    sparse_memory: bool = False,
 ):
     """
     A generator for taking a checkpoint for LoopPoint. It will save the
@@ -201,6 +265,9 @@ def looppoint_save_checkpoint_generator(
     :param exit_when_empty: If the generator should exit the simulation loop if
                             all PC paris have been discovered, then it should be
                             ``True``. It is default as ``True``.
+    :param max_async_writers: See ``save_checkpoint_generator``.
+    :param compression_level: See ``save_checkpoint_generator``.
+    :param sparse_memory: See ``save_checkpoint_generator``.
     """
     if exit_when_empty:
         total_pairs = len(looppoint.get_targets())
@@ -217,7 +284,12 @@ def looppoint_save_checkpoint_generator(
         if region:
             if update_relatives:
                 looppoint.update_relatives_counts()
-            m5.checkpoint((checkpoint_dir / f"cpt.Region{region}").as_posix())
+            _checkpoint(
+                checkpoint_dir / f"cpt.Region{region}",
+                max_async_writers,
+                compression_level,
+                sparse_memory,
+            )
         total_pairs -= 1
         yield False
 
@@ -0,0 +1,218 @@
+# Copyright (c) 2026 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Host-throughput heartbeats for long running simulations.
+
+When enabled via ``Simulator.enable_heartbeat``, a JSON record is appended to
+``<outdir>/heartbeat.jsonl`` (by default) at a fixed host-time or simulated
+tick interval. Each record has the following fields:
+
+* ``host_time``: The host's wall-clock time (seconds since the epoch).
+* ``elapsed``: The host seconds since the simulation was first run.
+* ``tick``: The current simulated tick.
+* ``insts``: The instructions committed by each current core.
+* ``kips``: The thousands of instructions committed per host second since
+  the last record, or ``null`` if the cores were switched since the last
+  record.
+* ``ticks_per_second``: The simulated ticks per host second since the last
+  record.
+* ``cxx_seconds``: The host seconds spent in the C++ simulation loop.
+* ``python_seconds``: The host seconds spent in Python (e.g., exit event
+  handling) since the simulation was first run.
+* ``rss``: The resident set size of the gem5 process, in bytes.
+
+A job which has stopped making progress can be detected by its last record
+being too old, and a drop in simulation speed by its ``kips``.
+"""
+
+import json
+import os
+import resource
+import time
+from pathlib import Path
+from typing import (
+    List,
+    Optional,
+)
+
+import m5
+
+from ..components.processors.abstract_processor import AbstractProcessor
+
+# Bounds on how much the number of ticks simulated between host-time
+# heartbeat checks may change at once, and its minimum.
+_MAX_CHUNK_SCALE = 10
+_MIN_CHUNK_TICKS = 1000
+
+
+def _get_rss() -> int:
+    """Returns the resident set size of this process, in bytes. If the
+    current resident set size is not available, the peak is returned.
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        # `ru_maxrss` is in kilobytes on Linux and bytes on macOS.
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return rss if os.uname().sysname == "Darwin" else rss * 1024
+
+
+class Heartbeat:
+    """Records the host throughput of a simulation at regular intervals.
+    This is typically created via ``Simulator.enable_heartbeat``.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        host_interval: Optional[float] = None,
+        tick_interval: Optional[int] = None,
+    ) -> None:
+        """
+        :param path: The JSON-lines file the records are appended to.
+        :param host_interval: The host seconds between records.
+        :param tick_interval: The simulated ticks between records.
+        """
+        if (host_interval is None) == (tick_interval is None):
+            raise ValueError(
+                "Exactly one of the host and tick intervals must be set."
+            )
+        if (host_interval is not None and host_interval <= 0) or (
+            tick_interval is not None and tick_interval <= 0
+        ):
+            raise ValueError("The heartbeat interval must be positive.")
+
+        self._path = Path(path)
+        self._host_interval = host_interval
+        self._tick_interval = tick_interval
+
+        self._start_time = None
+        self._cxx_seconds = 0.0
+        self._chunk = _MIN_CHUNK_TICKS
+        self._last_time = None
+        self._last_tick = None
+        self._last_insts = 0
+        self._last_cores = None
+
+    def get_path(self) -> Path:
+        return self._path
+
+    def _start(self) -> None:
+        self._start_time = time.monotonic()
+        self._last_time = self._start_time
+        self._last_tick = m5.curTick()
+
+    def get_ticks_to_run(self, remaining: int) -> int:
+        """Returns the number of ticks to simulate before the simulation
+        loop should next return to check the heartbeat.
+
+        :param remaining: The ticks remaining before the simulation must
+                          exit anyway.
+        """
+        if self._start_time is None:
+            self._start()
+        if self._tick_interval is not None:
+            next_tick = self._last_tick + self._tick_interval
+            return max(min(remaining, next_tick - m5.curTick()), 1)
+        return max(min(remaining, self._chunk), 1)
+
+    def simulate(self, ticks: int):
+        """Simulates for ``ticks`` ticks, recording the host time spent in
+        the C++ simulation loop.
+
+        :returns: The exit event which ended the simulation.
+        """
+        start_tick = m5.curTick()
+        start = time.monotonic()
+        exit_event = m5.simulate(ticks)
+        seconds = time.monotonic() - start
+        self._cxx_seconds += seconds
+
+        if self._host_interval is not None:
+            # Aim to return from the simulation loop once per interval.
+            ticks_run = m5.curTick() - start_tick
+            if seconds > 0 and ticks_run > 0:
+                target = int(ticks_run / seconds * self._host_interval)
+                self._chunk = max(
+                    min(target, self._chunk * _MAX_CHUNK_SCALE),
+                    self._chunk // _MAX_CHUNK_SCALE,
+                    _MIN_CHUNK_TICKS,
+                )
+        return exit_event
+
+    def is_due(self) -> bool:
+        if self._start_time is None:
+            return False
+        if self._tick_interval is not None:
+            return m5.curTick() - self._last_tick >= self._tick_interval
+        return time.monotonic() - self._last_time >= self._host_interval
+
+    def beat(self, processor: AbstractProcessor) -> None:
+        """Appends a record to the heartbeat file."""
+        now = time.monotonic()
+        tick = m5.curTick()
+        cores = list(processor.get_cores())
+        insts: List[int] = [
+            int(core.get_simobject().totalInsts()) for core in cores
+        ]
+        total_insts = sum(insts)
+        seconds = now - self._last_time
+        elapsed = now - self._start_time
+        if seconds <= 0:
+            kips = 0.0
+        elif cores == self._last_cores:
+            kips = (total_insts - self._last_insts) / seconds / 1000
+        elif self._last_cores is None:
+            kips = total_insts / seconds / 1000
+        else:
+            # The cores were switched since the last record, so their
+            # instruction counts cannot be compared.
+            kips = None
+        record = {
+            "host_time": time.time(),
+            "elapsed": elapsed,
+            "tick": tick,
+            "insts": insts,
+            "kips": kips,
+            "ticks_per_second": (
+                (tick - self._last_tick) / seconds if seconds > 0 else 0.0
+            ),
+            "cxx_seconds": self._cxx_seconds,
+            "python_seconds": elapsed - self._cxx_seconds,
+            "rss": _get_rss(),
+        }
+
+        # Opened for each record, as records are infrequent and this leaves
+        # no file open between them.
+        with open(self._path, "a") as f:
+            f.write(json.dumps(record) + "\n")
+
+        self._last_time = now
+        self._last_tick = tick
+        self._last_insts = total_insts
+        self._last_cores = cores
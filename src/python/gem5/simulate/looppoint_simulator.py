@@ -0,0 +1,275 @@
+# Copyright (c) 2026 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import json
+import sys
+import traceback
+from pathlib import Path
+from typing import (
+    Dict,
+    Optional,
+    Union,
+)
+
+import m5
+from m5.util import warn
+
+from ..components.boards.abstract_board import AbstractBoard
+from ..components.processors.switchable_processor import SwitchableProcessor
+from ..resources.looppoint import LooppointRegion
+from .exit_event import ExitEvent
+from .sampled_simulator import (
+    _default_max_children,
+    _wait_for_child,
+)
+from .simulator import Simulator
+
+
+class PipelinedLooppointSimulator(Simulator):
+    """
+    A Simulator which simulates each LoopPoint region in its own forked
+    process, as soon as the start of the region is reached.
+
+    ``looppoint_save_checkpoint_generator`` takes a checkpoint at the start of
+    each region, and the regions can only be simulated, from those
+    checkpoints, once all have been taken. Instead, this simulator
+    fast-forwards through the workload on the board's starting cores and,
+    at the start of each region, forks with ``m5.fork``. The child switches to
+    the detailed cores and simulates the region: it resets the stats at the
+    end of the region's warmup (or immediately if it has none), and dumps the
+    stats and exits at the end of the region. Meanwhile, the parent continues
+    fast-forwarding to the start of the next region. No checkpoints are
+    written, and the first regions finish while the later ones are still
+    being reached.
+
+    Each region's output is written to ``<outdir>/region_<id>``. Once all the
+    regions have finished, the LoopPoint data, including the relative counts,
+    is written to ``<outdir>/looppoint.json`` and a summary of the regions to
+    ``<outdir>/looppoint_regions.json``.
+
+    .. code-block::
+
+        processor = SimpleSwitchableProcessor(
+            starting_core_type=CPUTypes.ATOMIC,
+            switch_core_type=CPUTypes.O3,
+            isa=ISA.X86,
+            num_cores=9,
+        )
+        ...
+        board.set_se_looppoint_workload(
+            binary=obtain_resource("x86-matrix-multiply-omp"),
+            looppoint=looppoint,
+        )
+        simulator = PipelinedLooppointSimulator(board=board, max_children=8)
+        simulator.run()
+
+    .. note::
+
+        Region starts are found by counting the PCs of retired instructions,
+        which KVM cores do not report. The starting cores must therefore not
+        be KVM cores.
+
+    .. note::
+
+        Forking requires all listeners (e.g., the GDB and terminal ports) to
+        be disabled. They are disabled when the simulator is run.
+    """
+
+    def __init__(
+        self,
+        board: AbstractBoard,
+        detailed_cores: Optional[str] = None,
+        max_children: Optional[int] = None,
+        **kwargs,
+    ) -> None:
+        """
+        :param board: The board to be simulated. It must have a LoopPoint
+                      workload (see ``set_se_looppoint_workload``) and its
+                      processor must be a ``SwitchableProcessor``.
+        :param detailed_cores: The key of the detailed cores in the
+                               ``SwitchableProcessor``. If not set, the
+                               processor's ``switch`` function is used (e.g.,
+                               for a ``SimpleSwitchableProcessor``).
+        :param max_children: The maximum number of regions to simulate at
+                             once. By default, the number of host cores.
+        :param kwargs: Passed to the ``Simulator`` constructor.
+        """
+        super().__init__(board=board, **kwargs)
+
+        processor = board.get_processor()
+        if not isinstance(processor, SwitchableProcessor):
+            raise Exception(
+                "The PipelinedLooppointSimulator requires a "
+                "SwitchableProcessor."
+            )
+        if detailed_cores is None and not hasattr(processor, "switch"):
+            raise Exception(
+                "The detailed cores must be specified for a "
+                "SwitchableProcessor without a `switch` function."
+            )
+        if any(core.is_kvm_core() for core in processor.get_cores()):
+            raise Exception(
+                "The PipelinedLooppointSimulator cannot fast-forward on KVM "
+                "cores, as they do not report the PCs of retired instructions."
+            )
+
+        self._looppoint = board.get_looppoint()
+        self._detailed_cores = detailed_cores
+        self._max_children = max_children or _default_max_children()
+        self._region_outdirs: Dict[Union[int, str], Path] = {}
+
+    def _region_generator(self, region: LooppointRegion):
+        """Handles the ``SIMPOINT_BEGIN`` exit events of a region's child.
+        Other regions' PC count pairs are still tracked, so their exit events
+        are ignored.
+        """
+        warmup_end = None
+        if region.get_warmup():
+            warmup_end = (
+                region.get_simulation().get_start().get_pc_count_pair()
+            )
+        end = region.get_simulation().get_end().get_pc_count_pair()
+        while True:
+            pair = self._looppoint.get_current_pair()
+            if pair == warmup_end:
+                m5.stats.reset()
+            if pair == end:
+                m5.stats.dump()
+                yield True
+            else:
+                yield False
+
+    def _run_region(self, region_id: Union[int, str]) -> None:
+        """Simulates a region in a forked child, then exits the child."""
+        code = 0
+        try:
+            processor = self._board.get_processor()
+            if self._detailed_cores is None:
+                processor.switch()
+            else:
+                processor.switch_to_processor(self._detailed_cores)
+
+            region = self._looppoint.get_regions()[region_id]
+            if not region.get_warmup():
+                m5.stats.reset()
+            self._on_exit_event[ExitEvent.SIMPOINT_BEGIN] = (
+                self._region_generator(region)
+            )
+            super().run()
+            exit_enum = ExitEvent.translate_exit_status(
+                self.get_last_exit_event_cause()
+            )
+            if exit_enum != ExitEvent.SIMPOINT_BEGIN:
+                raise Exception("The workload ended within the region.")
+        except Exception:
+            traceback.print_exc()
+            code = 1
+        # Exiting runs the exit handlers, which flush the stats output.
+        sys.exit(code)
+
+    def _wait_for_child(self, children: Dict[int, Union[int, str]]) -> None:
+        region_id, exit_code = _wait_for_child(children)
+        if exit_code != 0:
+            warn(f"LoopPoint region {region_id} failed.")
+            del self._region_outdirs[region_id]
+
+    def run(self, max_ticks: Optional[int] = None) -> None:
+        """
+        Fast-forwards through the workload, forking a child to simulate each
+        LoopPoint region, then waits for all the regions to finish.
+
+        :param max_ticks: See ``Simulator.run``.
+        """
+        if max_ticks:
+            self.set_max_ticks(max_ticks)
+
+        m5.disableAllListeners()
+
+        # Exit the simulation loop on each SIMPOINT_BEGIN exit event so the
+        # region starts can be handled here.
+        def region_start_generator():
+            while True:
+                yield True
+
+        self._on_exit_event = dict(self._on_exit_event)
+        self._on_exit_event[ExitEvent.SIMPOINT_BEGIN] = (
+            region_start_generator()
+        )
+
+        outdir = Path(m5.options.outdir)
+        children: Dict[int, Union[int, str]] = {}
+        remaining = set(self._looppoint.get_regions())
+        while remaining:
+            super().run()
+            exit_enum = ExitEvent.translate_exit_status(
+                self.get_last_exit_event_cause()
+            )
+            if exit_enum != ExitEvent.SIMPOINT_BEGIN:
+                warn(
+                    "The workload ended before the start of LoopPoint "
+                    f"regions {sorted(remaining, key=str)}."
+                )
+                break
+
+            # Other PC count pairs (e.g., the ends of regions) are skipped.
+            region_id = self._looppoint.get_current_region()
+            if region_id not in remaining:
+                continue
+            remaining.remove(region_id)
+            self._looppoint.update_relatives_counts()
+
+            while len(children) >= self._max_children:
+                self._wait_for_child(children)
+
+            region_outdir = outdir / f"region_{region_id}"
+            self._region_outdirs[region_id] = region_outdir
+            pid = m5.fork(str(region_outdir))
+            if pid == 0:
+                self._run_region(region_id)
+            children[pid] = region_id
+
+        while children:
+            self._wait_for_child(children)
+
+        self._looppoint.output_json_file(
+            filepath=str(outdir / "looppoint.json")
+        )
+        regions = self._looppoint.get_regions()
+        summary = {
+            str(region_id): {
+                "outdir": str(region_outdir),
+                "multiplier": regions[region_id].get_multiplier(),
+            }
+            for region_id, region_outdir in self._region_outdirs.items()
+        }
+        with open(outdir / "looppoint_regions.json", "w") as f:
+            json.dump(summary, f, indent=4)
+
+    def get_region_outdirs(self) -> Dict[Union[int, str], Path]:
+        """Returns the output directory of each region which was simulated
+        successfully, keyed by region id.
+        """
+        return dict(self._region_outdirs)
@@ -0,0 +1,325 @@
+# Copyright (c) 2026 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Periodic (SMARTS-style) statistical sampling.
+
+Rather than simulating a whole workload on detailed cores, the workload is
+split into periods of ``period`` instructions. Each period ends with a short
+sample:
+
+.. code-block:: text
+
+    |<------------------------------ period ------------------------------>|
+    | fast-forward | functional warming | detailed warmup | measurement |
+    |   (ff cores) |  (functional cores)|         (detailed cores)      |
+
+Each phase ends with a ``MAX_INSTS`` exit event. The stats are reset at the
+start of each measurement and dumped at its end, so ``stats.txt`` has one
+dump per sample. Only single-core processors are supported: a phase's
+``MAX_INSTS`` exit is scheduled on every core, and the cores which don't
+reach it first would end the following phase early. The CPI of each
+measurement is recorded and, if a target error is set, the simulation exits
+once the confidence interval of the mean CPI is within the target error of
+the mean.
+
+Periodic sampling is enabled via the ``Simulator``:
+
+.. code-block:: python
+
+    simulator = Simulator(board=board)
+    simulator.schedule_periodic_sampling(
+        period=1_000_000,
+        measure_insts=10_000,
+        detailed_warmup_insts=2_000,
+        target_error=0.03,
+    )
+    simulator.run()
+    print(simulator.get_periodic_sampler().get_estimator().get_mean())
+"""
+
+import math
+from statistics import NormalDist
+from typing import (
+    Generator,
+    List,
+    NamedTuple,
+    Optional,
+)
+
+import m5.stats
+
+from ..components.processors.switchable_processor import SwitchableProcessor
+
+
+class SamplingEstimator:
+    """Estimates the mean of a sampled metric (e.g., CPI) and the error of
+    that estimate.
+    """
+
+    def __init__(self) -> None:
+        self._samples: List[float] = []
+
+    def add_sample(self, value: float) -> None:
+        self._samples.append(value)
+
+    def get_samples(self) -> List[float]:
+        return self._samples
+
+    def get_count(self) -> int:
+        return len(self._samples)
+
+    def get_mean(self) -> float:
+        if not self._samples:
+            return math.nan
+        return math.fsum(self._samples) / len(self._samples)
+
+    def get_stdev(self) -> float:
+        """Returns the sample standard deviation."""
+        n = len(self._samples)
+        if n < 2:
+            return math.nan
+        mean = self.get_mean()
+        return math.sqrt(
+            math.fsum((x - mean) ** 2 for x in self._samples) / (n - 1)
+        )
+
+    def get_relative_error(self, confidence: float) -> float:
+        """Returns the half-width of the confidence interval of the mean,
+        relative to the mean. This is ``z * V / sqrt(n)``, where ``V`` is the
+        coefficient of variation of the samples.
+
+        :param confidence: The confidence level (e.g., 0.997).
+        """
+        mean = self.get_mean()
+        stdev = self.get_stdev()
+        if math.isnan(stdev) or mean == 0:
+            return math.inf
+        z = NormalDist().inv_cdf(0.5 + confidence / 2)
+        return z * stdev / (math.sqrt(len(self._samples)) * abs(mean))
+
+
+class _Phase(NamedTuple):
+    cores: str
+    insts: int
+    is_measurement: bool
+
+
+class PeriodicSampler:
+    """Drives a ``SwitchableProcessor`` through a periodic sampling
+    schedule. This is typically created via
+    ``Simulator.schedule_periodic_sampling``.
+    """
+
+    def __init__(
+        self,
+        processor: SwitchableProcessor,
+        period: int,
+        measure_insts: int,
+        detailed_warmup_insts: int = 0,
+        functional_warming_insts: Optional[int] = None,
+        detailed_cores: Optional[str] = None,
+        functional_cores: Optional[str] = None,
+        fast_forward_cores: Optional[str] = None,
+        target_error: Optional[float] = None,
+        confidence: float = 0.997,
+        min_samples: int = 30,
+        max_samples: Optional[int] = None,
+    ) -> None:
+        """
+        :param processor: The processor to sample. It must have one core.
+        :param period: The number of instructions in each period.
+        :param measure_insts: The number of instructions measured in each
+                              period.
+        :param detailed_warmup_insts: The number of instructions simulated on
+                                      the detailed cores before each
+                                      measurement.
+        :param functional_warming_insts: The number of instructions simulated
+                                         on the functional cores before each
+                                         detailed warmup. By default the
+                                         rest of the period. The remainder is
+                                         simulated on the fast-forward cores.
+        :param detailed_cores: The key of the detailed cores. By default, the
+                               key which is not the starting cores' key, if
+                               the processor has two.
+        :param functional_cores: The key of the functional warming cores
+                                 (e.g., atomic cores). By default the
+                                 starting cores.
+        :param fast_forward_cores: The key of the fast-forward cores (e.g.,
+                                   KVM cores). By default the functional
+                                   warming cores.
+        :param target_error: If set, the simulation exits once the
+                             confidence interval of the mean CPI is within
+                             this fraction of the mean (e.g., 0.03).
+        :param confidence: The confidence level of the target error.
+        :param min_samples: The minimum number of samples before the target
+                            error is checked.
+        :param max_samples: If set, the simulation exits after this many
+                            samples.
+        """
+        if processor.get_num_cores() != 1:
+            raise ValueError(
+                "Periodic sampling only supports processors with one core."
+            )
+        if measure_insts <= 0:
+            raise ValueError("The measurement must be at least 1 instruction.")
+        if detailed_warmup_insts < 0:
+            raise ValueError("The detailed warmup cannot be negative.")
+        remaining = period - measure_insts - detailed_warmup_insts
+        if remaining <= 0:
+            raise ValueError(
+                "The period must be longer than the detailed warmup and "
+                "measurement."
+            )
+        if functional_warming_insts is None:
+            functional_warming_insts = remaining
+        elif not 0 <= functional_warming_insts <= remaining:
+            raise ValueError(
+                "The functional warming must fit in the period before the "
+                "detailed warmup and measurement."
+            )
+        if target_error is not None and target_error <= 0:
+            raise ValueError("The target error must be positive.")
+
+        keys = list(processor._switchable_cores.keys())
+        start = processor.get_current_cores_key()
+        if detailed_cores is None:
+            if len(keys) != 2:
+                raise ValueError(
+                    "The detailed cores must be specified for a processor "
+                    "without exactly two sets of cores."
+                )
+            detailed_cores = next(key for key in keys if key != start)
+        functional_cores = functional_cores or start
+        fast_forward_cores = fast_forward_cores or functional_cores
+        for key in (detailed_cores, functional_cores, fast_forward_cores):
+            if key not in keys:
+                raise ValueError(f"'{key}' is not a key of the processor.")
+        if detailed_cores in (functional_cores, fast_forward_cores):
+            raise ValueError(
+                "The detailed cores cannot be used for fast-forwarding or "
+                "functional warming."
+            )
+
+        phases = []
+        fast_forward_insts = remaining - functional_warming_insts
+        if fast_forward_cores == functional_cores:
+            phases.append(_Phase(functional_cores, remaining, False))
+        else:
+            if fast_forward_insts:
+                phases.append(
+                    _Phase(fast_forward_cores, fast_forward_insts, False)
+                )
+            if functional_warming_insts:
+                phases.append(
+                    _Phase(functional_cores, functional_warming_insts, False)
+                )
+        if detailed_warmup_insts:
+            phases.append(_Phase(detailed_cores, detailed_warmup_insts, False))
+        phases.append(_Phase(detailed_cores, measure_insts, True))
+
+        self._processor = processor
+        self._phases = phases
+        self._target_error = target_error
+        self._confidence = confidence
+        self._min_samples = max(min_samples, 2)
+        self._max_samples = max_samples
+        self._estimator = SamplingEstimator()
+        self._phase_index = 0
+
+    def get_estimator(self) -> SamplingEstimator:
+        """Returns the estimator of the CPI of the measured samples."""
+        return self._estimator
+
+    def is_converged(self) -> bool:
+        """Returns ``True`` if the target error has been reached."""
+        return (
+            self._target_error is not None
+            and self._estimator.get_count() >= self._min_samples
+            and self._estimator.get_relative_error(self._confidence)
+            <= self._target_error
+        )
+
+    def start(self, schedule_max_insts, instantiated: bool) -> None:
+        """Starts the first phase.
+
+        :param schedule_max_insts: The function used to schedule the end of
+                                   a phase (i.e., the Simulator's
+                                   ``schedule_max_insts``).
+        :param instantiated: Whether the simulation has been instantiated.
+        """
+        self._schedule_max_insts = schedule_max_insts
+        self._phase_index = 0
+        if not instantiated:
+            # The cores cannot be switched before instantiation.
+            cores = self._phases[0].cores
+            if cores != self._processor.get_current_cores_key():
+                raise Exception(
+                    f"Periodic sampling starts on the '{cores}' cores, but "
+                    "the processor starts on the "
+                    f"'{self._processor.get_current_cores_key()}' cores."
+                )
+            self._schedule_max_insts(self._phases[0].insts)
+        else:
+            self._start_phase()
+
+    def _start_phase(self) -> None:
+        phase = self._phases[self._phase_index]
+        if phase.cores != self._processor.get_current_cores_key():
+            self._processor.switch_to_processor(phase.cores)
+        if phase.is_measurement:
+            m5.stats.reset()
+        self._schedule_max_insts(phase.insts)
+
+    def _measure(self) -> None:
+        cycles = 0
+        insts = 0
+        for core in self._processor.get_cores():
+            simobject = core.get_simobject()
+            cycles += simobject.resolveStat("numCycles").value
+            insts += simobject.resolveStat("numInsts").value
+        if insts:
+            self._estimator.add_sample(cycles / insts)
+        m5.stats.dump()
+
+    def generator(self) -> Generator[bool, None, None]:
+        """The ``MAX_INSTS`` exit event generator. Each exit ends the current
+        phase and starts the next. Yields ``True`` once the target error or
+        the maximum number of samples has been reached.
+        """
+        while True:
+            if self._phases[self._phase_index].is_measurement:
+                self._measure()
+                if self.is_converged() or (
+                    self._max_samples is not None
+                    and self._estimator.get_count() >= self._max_samples
+                ):
+                    break
+            self._phase_index = (self._phase_index + 1) % len(self._phases)
+            self._start_phase()
+            yield False
+        while True:
+            yield True
@@ -0,0 +1,315 @@
+# Copyright (c) 2026 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import json
+import os
+import sys
+import traceback
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
+
+import m5
+from m5.util import warn
+
+from ..components.boards.abstract_board import AbstractBoard
+from ..components.processors.switchable_processor import SwitchableProcessor
+from ..utils.simpoint_stats import (
+    AggregatedStat,
+    SimpointStatsAggregator,
+)
+from .exit_event import ExitEvent
+from .simulator import Simulator
+
+
+def _default_max_children() -> int:
+    """Returns the number of host cores available to this process."""
+    if hasattr(os, "sched_getaffinity"):
+        return max(len(os.sched_getaffinity(0)), 1)
+    return max(os.cpu_count() or 1, 1)
+
+
+def _wait_for_child(children: Dict[int, Any]) -> Tuple[Any, int]:
+    """Waits for one of the given children, mapping pids to any value, to
+    exit and removes it.
+
+    Only these children are waited for, as other children (e.g., asynchronous
+    checkpoint writers) are waited for elsewhere. A finished child is
+    preferred, otherwise the oldest is waited for.
+
+    :returns: The value of the child and its exit code.
+    """
+    for pid in children:
+        finished, status = os.waitpid(pid, os.WNOHANG)
+        if finished:
+            break
+    else:
+        pid = next(iter(children))
+        _, status = os.waitpid(pid, 0)
+    return children.pop(pid), os.waitstatus_to_exitcode(status)
+
+
+class SampledSimulator(Simulator):
+    """
+    A Simulator which measures a workload at a set of sample points, each in
+    its own forked process.
+
+    The simulation fast-forwards on the board's starting cores (e.g., KVM or
+    atomic cores of a ``SwitchableProcessor``). At each sample point the
+    simulator is forked with ``m5.fork``. The child switches to the detailed
+    cores, warms them up for ``warmup_insts`` instructions, resets the stats,
+    measures ``measure_insts`` instructions, dumps the stats and exits. The
+    parent continues fast-forwarding to the next sample point, so the samples
+    are simulated in parallel with each other and with the fast-forwarding.
+
+    Each sample's output is written to ``<outdir>/sample_<index>``. Once all
+    samples have finished, their stats are aggregated into the mean of each
+    statistic across the samples, with a confidence interval, and written to
+    ``<outdir>/sampled_stats.json``.
+
+    .. code-block::
+
+        processor = SimpleSwitchableProcessor(
+            starting_core_type=CPUTypes.KVM,
+            switch_core_type=CPUTypes.O3,
+            isa=ISA.X86,
+            num_cores=1,
+        )
+        ...
+        simulator = SampledSimulator(
+            board=board,
+            sample_points=[n * 100_000_000 for n in range(1, 100)],
+            warmup_insts=100_000,
+            measure_insts=10_000,
+        )
+        simulator.run()
+        ipc = simulator.get_sampled_stats()["system.processor.switch0.core.ipc"]
+
+    .. note::
+
+        Forking requires all listeners (e.g., the GDB and terminal ports) to
+        be disabled. They are disabled when the simulator is run.
+    """
+
+    def __init__(
+        self,
+        board: AbstractBoard,
+        sample_points: Iterable[int],
+        warmup_insts: int,
+        measure_insts: int,
+        detailed_cores: Optional[str] = None,
+        max_children: Optional[int] = None,
+        **kwargs,
+    ) -> None:
+        """
+        :param board: The board to be simulated. Its processor must be a
+                      ``SwitchableProcessor`` with one core.
+        :param sample_points: The instruction counts, from the start of the
+                              simulation, at which to take each sample. An
+                              instruction count is reached when any thread
+                              reaches it.
+        :param warmup_insts: The number of instructions to simulate on the
+                             detailed cores before the stats are reset.
+        :param measure_insts: The number of instructions to measure.
+        :param detailed_cores: The key of the detailed cores in the
+                               ``SwitchableProcessor``. If not set, the
+                               processor's ``switch`` function is used (e.g.,
+                               for a ``SimpleSwitchableProcessor``).
+        :param max_children: The maximum number of samples to simulate at
+                             once. By default, the number of host cores.
+        :param kwargs: Passed to the ``Simulator`` constructor.
+        """
+        processor = board.get_processor()
+        if not isinstance(processor, SwitchableProcessor):
+            raise Exception(
+                "The SampledSimulator requires a SwitchableProcessor."
+            )
+        if processor.get_num_cores() != 1:
+            # The MAX_INSTS exit of each phase is scheduled on every core.
+            # The cores which don't reach it first would end the next phase
+            # early.
+            raise ValueError(
+                "The SampledSimulator only supports processors with one core."
+            )
+        if detailed_cores is None and not hasattr(processor, "switch"):
+            raise Exception(
+                "The detailed cores must be specified for a "
+                "SwitchableProcessor without a `switch` function."
+            )
+
+        super().__init__(board=board, **kwargs)
+
+        self._sample_points = sorted(sample_points)
+        if self._sample_points and self._sample_points[0] <= 0:
+            raise ValueError("Sample points must be positive.")
+        if warmup_insts < 0 or measure_insts <= 0:
+            raise ValueError(
+                "The warmup must be non-negative and the measurement must be "
+                "positive."
+            )
+        self._warmup_insts = warmup_insts
+        self._measure_insts = measure_insts
+        self._detailed_cores = detailed_cores
+        self._max_children = max_children or _default_max_children()
+        self._sample_outdirs: Dict[int, Path] = {}
+        self._sampled_stats: Optional[Dict[str, AggregatedStat]] = None
+
+    def _run_to_max_insts(self, insts: int) -> bool:
+        """Runs until any thread has executed ``insts`` more instructions.
+
+        :returns: ``True`` if the instructions were executed, ``False`` if
+                  the simulation stopped for another reason (e.g., the
+                  workload exited).
+        """
+        self.schedule_max_insts(insts)
+        super().run()
+        exit_enum = ExitEvent.translate_exit_status(
+            self.get_last_exit_event_cause()
+        )
+        return exit_enum == ExitEvent.MAX_INSTS
+
+    def _run_sample(self) -> None:
+        """Simulates a sample in a forked child, then exits the child."""
+        code = 0
+        try:
+            processor = self._board.get_processor()
+            if self._detailed_cores is None:
+                processor.switch()
+            else:
+                processor.switch_to_processor(self._detailed_cores)
+
+            if self._warmup_insts and not self._run_to_max_insts(
+                self._warmup_insts
+            ):
+                raise Exception("The workload ended during the warmup.")
+            m5.stats.reset()
+            if not self._run_to_max_insts(self._measure_insts):
+                raise Exception("The workload ended during the measurement.")
+            m5.stats.dump()
+        except Exception:
+            traceback.print_exc()
+            code = 1
+        # Exiting runs the exit handlers, which flush the stats output.
+        sys.exit(code)
+
+    def _wait_for_child(self, children: Dict[int, int]) -> None:
+        index, exit_code = _wait_for_child(children)
+        if exit_code != 0:
+            warn(f"Sample {index} failed and will not be aggregated.")
+            del self._sample_outdirs[index]
+
+    def run(self, max_ticks: Optional[int] = None) -> None:
+        """
+        Fast-forwards through the workload, forking a child to simulate each
+        sample, then waits for all the samples to finish and aggregates their
+        stats.
+
+        :param max_ticks: See ``Simulator.run``.
+        """
+        if max_ticks:
+            self.set_max_ticks(max_ticks)
+
+        m5.disableAllListeners()
+
+        # Exit the simulation loop on each MAX_INSTS exit event so the sample
+        # points can be handled here.
+        def max_insts_generator():
+            while True:
+                yield True
+
+        self._on_exit_event = dict(self._on_exit_event)
+        self._on_exit_event[ExitEvent.MAX_INSTS] = max_insts_generator()
+
+        outdir = Path(m5.options.outdir)
+        children: Dict[int, int] = {}
+        executed = 0
+        for index, point in enumerate(self._sample_points):
+            if not self._run_to_max_insts(point - executed):
+                warn(
+                    f"The workload ended before sample point {point}. "
+                    f"Only {index} samples were taken."
+                )
+                break
+            executed = point
+
+            while len(children) >= self._max_children:
+                self._wait_for_child(children)
+
+            sample_outdir = outdir / f"sample_{index}"
+            self._sample_outdirs[index] = sample_outdir
+            pid = m5.fork(str(sample_outdir))
+            if pid == 0:
+                self._run_sample()
+            children[pid] = index
+
+        while children:
+            self._wait_for_child(children)
+
+        self._sampled_stats = self._aggregate()
+        with open(outdir / "sampled_stats.json", "w") as f:
+            json.dump(
+                {
+                    name: stat.to_json()
+                    for name, stat in self._sampled_stats.items()
+                },
+                f,
+                indent=4,
+            )
+
+    def _aggregate(self) -> Dict[str, AggregatedStat]:
+        aggregator = SimpointStatsAggregator()
+        for outdir in self._sample_outdirs.values():
+            aggregator.add_stats_file(outdir / "stats.txt", 1.0)
+        if not self._sample_outdirs:
+            warn("No samples were taken.")
+            return {}
+        return aggregator.get_results()
+
+    def get_sample_outdirs(self) -> List[Path]:
+        """Returns the output directories of the successful samples."""
+        return [
+            self._sample_outdirs[index]
+            for index in sorted(self._sample_outdirs)
+        ]
+
+    def get_sampled_stats(self) -> Dict[str, AggregatedStat]:
+        """
+        Returns the mean of each statistic across the samples, with its
+        standard deviation and confidence interval.
+
+        :raises Exception: If the simulator has not been run.
+        """
+        if self._sampled_stats is None:
+            raise Exception(
+                "The sampled stats are only available after `run()`."
+            )
+        return self._sampled_stats
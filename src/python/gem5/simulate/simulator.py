@@ -58,6 +58,8 @@ from .exit_event_generators import (
     switch_generator,
     warn_default_decorator,
 )
+from .heartbeat import Heartbeat
+from .periodic_sampling import PeriodicSampler
 
 
 class Simulator:
@@ -405,6 +407,8 @@ class Simulator:
 
         self._last_exit_event = None
         self._exit_event_count = 0
+        self._periodic_sampler = None
+        self._heartbeat = None
 
         if checkpoint_path:
             warn(
@@ -506,6 +510,175 @@ class Simulator:
         for core in self._board.get_processor().get_cores():
             core._set_inst_stop_any_thread(inst, self._instantiated)
 
+    def schedule_periodic_sampling(
+        self,
+        period: int,
+        measure_insts: int,
+        detailed_warmup_insts: int = 0,
+        **kwargs,
+    ) -> PeriodicSampler:
+        """
+        Simulate the workload with periodic (SMARTS-style) sampling. Every
+        ``period`` instructions the processor is switched to its detailed
+        cores, warmed up for ``detailed_warmup_insts`` instructions and
+        measured for ``measure_insts`` instructions. The stats are reset at
+        the start of each measurement and dumped at its end.
+
+        This handles the ``MAX_INSTS`` exit events. See
+        ``gem5.simulate.periodic_sampling`` for details.
+
+        **Note:** Periodic sampling only works with one core.
+
+        :param period: The number of instructions in each period.
+        :param measure_insts: The number of instructions measured in each
+                              period.
+        :param detailed_warmup_insts: The number of instructions simulated on
+                                      the detailed cores before each
+                                      measurement.
+        :param kwargs: Passed to ``PeriodicSampler`` (e.g., ``target_error``
+                       to exit once the CPI is known to within the target
+                       error).
+
+        :returns: The ``PeriodicSampler``, which holds the CPI estimate.
+        """
+        processor = self._board.get_processor()
+        if not isinstance(processor, SwitchableProcessor):
+            raise Exception(
+                "Periodic sampling requires a SwitchableProcessor."
+            )
+        if (
+            self._on_exit_event is not self._default_on_exit_dict
+            and ExitEvent.MAX_INSTS in self._on_exit_event
+        ):
+            warn(
+                "Periodic sampling overrides the MAX_INSTS exit event "
+                "behavior set by the user."
+            )
+
+        sampler = PeriodicSampler(
+            processor=processor,
+            period=period,
+            measure_insts=measure_insts,
+            detailed_warmup_insts=detailed_warmup_insts,
+            **kwargs,
+        )
+        sampler.start(self.schedule_max_insts, self._instantiated)
+
+        # `_on_exit_event` may be the default dictionary, which must not be
+        # modified.
+        self._on_exit_event = dict(self._on_exit_event)
+        self._on_exit_event[ExitEvent.MAX_INSTS] = sampler.generator()
+        self._periodic_sampler = sampler
+        return sampler
+
+    def get_periodic_sampler(self) -> Optional[PeriodicSampler]:
+        """
+        Returns the ``PeriodicSampler`` set via
+        ``schedule_periodic_sampling``, or ``None`` if periodic sampling is
+        not used.
+        """
+        return self._periodic_sampler
+
+    def enable_heartbeat(
+        self,
+        host_interval: Optional[float] = None,
+        tick_interval: Optional[int] = None,
+        path: Optional[Path] = None,
+    ) -> None:
+        """
+        Append a record of the simulation's host throughput (e.g., KIPS and
+        memory use) to a JSON-lines file at a regular host-time or simulated
+        tick interval. See ``gem5.simulate.heartbeat`` for the fields of each
+        record.
+
+        Exactly one of ``host_interval`` or ``tick_interval`` must be set.
+
+        :param host_interval: The host seconds between records.
+        :param tick_interval: The simulated ticks between records.
+        :param path: The file the records are appended to. By default
+                     ``heartbeat.jsonl`` in the output directory.
+        """
+        if path is None:
+            from m5 import options
+
+            path = Path(options.outdir) / "heartbeat.jsonl"
+        self._heartbeat = Heartbeat(
+            path=path,
+            host_interval=host_interval,
+            tick_interval=tick_interval,
+        )
+
+    def handle_exit_event_natively(
+        self,
+        exit_event: ExitEvent,
+        dump_stats: bool = False,
+        reset_stats: bool = False,
+        return_every: int = 0,
+    ) -> None:
+        """
+        Handle an exit event within the C++ event loop rather than returning
+        to Python. This is intended for exit events which occur at a high
+        frequency (e.g., ``WORKBEGIN``/``WORKEND`` or periodic ``MAX_INSTS``
+        exits) and which only need to dump or reset the stats.
+
+        On each such exit event the stats are optionally dumped and/or reset,
+        the exit event is counted (see ``get_native_exit_count``) and the
+        simulation continues. Exit events handled natively are not passed to
+        the ``on_exit_event`` generators, nor recorded in the tick stopwatch
+        or checked against the expected execution order.
+
+        .. note::
+
+            Checkpoints cannot be taken natively, as the simulation must first
+            be drained, which is driven from Python. The exit events which end
+            the simulation (``EXIT``, ``FAIL``, ``MAX_TICK`` and
+            ``USER_INTERRUPT``) cannot be handled natively either.
+
+        :param exit_event: The exit event to handle.
+        :param dump_stats: Dump the stats on each exit event.
+        :param reset_stats: Reset the stats on each exit event, after dumping
+                            them if ``dump_stats`` is also set.
+        :param return_every: If non-zero, every ``return_every``-th exit event
+                             is also returned to Python and handled as usual.
+
+        :raises ValueError: If the exit event ends the simulation.
+        """
+        if exit_event in (
+            ExitEvent.EXIT,
+            ExitEvent.FAIL,
+            ExitEvent.MAX_TICK,
+            ExitEvent.USER_INTERRUPT,
+        ):
+            raise ValueError(
+                f"The {exit_event.name} exit event cannot be handled "
+                "natively."
+            )
+        for exit_string in ExitEvent.get_exit_strings(exit_event):
+            m5.setNativeExitHandler(
+                exit_string,
+                dump_stats=dump_stats,
+                reset_stats=reset_stats,
+                return_every=return_every,
+            )
+
+    def clear_native_exit_handler(self, exit_event: ExitEvent) -> None:
+        """
+        Stop handling an exit event natively. See
+        ``handle_exit_event_natively``.
+        """
+        for exit_string in ExitEvent.get_exit_strings(exit_event):
+            m5.clearNativeExitHandler(exit_string)
+
+    def get_native_exit_count(self, exit_event: ExitEvent) -> int:
+        """
+        Returns the number of times an exit event has been handled natively.
+        See ``handle_exit_event_natively``.
+        """
+        return sum(
+            m5.getNativeExitCount(exit_string)
+            for exit_string in ExitEvent.get_exit_strings(exit_event)
+        )
+
     def get_stats(self) -> Dict:
         """
         Obtain the current simulation statistics as a Dictionary, conforming
@@ -715,9 +888,35 @@ class Simulator:
         # We instantiate the board if it has not already been instantiated.
         self._instantiate()
 
+        # The tick at which the current simulation run must exit. Only used
+        # when the heartbeat splits a run into shorter runs.
+        run_end = None
+
         # This while loop will continue until an a generator yields True.
         while True:
-            self._last_exit_event = m5.simulate(self.get_max_ticks())
+            if self._heartbeat:
+                if run_end is None:
+                    run_end = min(
+                        self.get_current_tick() + self.get_max_ticks(),
+                        m5.MaxTick,
+                    )
+                self._last_exit_event = self._heartbeat.simulate(
+                    self._heartbeat.get_ticks_to_run(
+                        run_end - self.get_current_tick()
+                    )
+                )
+                if self._heartbeat.is_due():
+                    self._heartbeat.beat(self._board.get_processor())
+                if (
+                    self.get_last_exit_event_cause()
+                    == "simulate() limit reached"
+                    and self.get_current_tick() < run_end
+                ):
+                    # The run was only cut short to check the heartbeat.
+                    continue
+                run_end = None
+            else:
+                self._last_exit_event = m5.simulate(self.get_max_ticks())
 
             # Translate the exit event cause to the exit event enum.
             exit_enum = ExitEvent.translate_exit_status(
@@ -0,0 +1,275 @@
+# Copyright (c) 2026 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+A driver which runs every region of a LoopPoint workload as its own
+simulation, in parallel, via MultiSim, then extrapolates whole-program
+statistics from the per-region statistics using each region's multiplier.
+
+In the configuration script, pass the LoopPoint data and a function which
+creates the simulator for a given region ID:
+
+.. code-block:: python
+
+    from gem5.resources.looppoint import LooppointJsonLoader
+    from gem5.utils.multisim.looppoint import add_looppoint_region_simulators
+
+    def create_simulator(region_id) -> Simulator:
+        # Create a board restoring from the checkpoint of `region_id`, taken
+        # with `looppoint_save_checkpoint_generator`, and return a Simulator
+        # which stops at the end of the region.
+        ...
+
+    add_looppoint_region_simulators(
+        looppoint=LooppointJsonLoader("looppoint.json"),
+        simulator_factory=create_simulator,
+    )
+
+Then run the configuration script with:
+
+.. code-block:: sh
+
+    gem5 -m gem5.utils.multisim.looppoint <config_script>
+
+Each region's output is written to ``<outdir>/region_<region_id>`` and the
+extrapolated statistics to ``<outdir>/looppoint_extrapolated_stats.json``.
+"""
+
+import json
+from numbers import Number
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Union,
+)
+
+from ...resources.looppoint import (
+    Looppoint,
+    LooppointRegion,
+)
+from . import multisim
+
+
+def _default_region_cost(region: LooppointRegion) -> float:
+    """The default estimate of the relative cost of simulating a region.
+
+    The LoopPoint data does not record the length of a region in
+    instructions. Regions are of a similar length, but those with a warmup
+    region must also simulate it. Regions with a warmup are therefore
+    estimated to take twice as long. Ties are broken in favor of the regions
+    with the largest multiplier as these contribute most to the results.
+    """
+    cost = 2 if region.get_warmup() else 1
+    return cost + region.get_multiplier() * 1e-6
+
+
+def get_region_simulator_id(region_id: Union[str, int]) -> str:
+    """Returns the MultiSim simulator ID used for a LoopPoint region."""
+    return f"region_{region_id}"
+
+
+def add_looppoint_region_simulators(
+    looppoint: Looppoint,
+    simulator_factory: Callable[[Union[str, int]], "Simulator"],
+    region_cost: Optional[Callable[[LooppointRegion], float]] = None,
+) -> None:
+    """
+    Adds a simulator for every region of a LoopPoint workload to MultiSim.
+
+    The simulators are scheduled by decreasing cost so the longest regions
+    start first. Once a region's simulator has finished, its statistics and
+    multiplier are returned to the parent process for extrapolation.
+
+    :param looppoint: The LoopPoint data. Typically a ``LooppointJsonLoader``
+                      or ``LooppointJsonResource``.
+    :param simulator_factory: A function which creates the simulator for the
+                              region with the region ID passed. The
+                              simulator's ID is set by this function.
+    :param region_cost: An optional function estimating the relative cost of
+                        simulating a region. Used to schedule the most costly
+                        regions first. If not set, regions with a warmup are
+                        considered the most costly.
+    """
+    cost = region_cost or _default_region_cost
+
+    for region_id, region in looppoint.get_regions().items():
+        simulator = simulator_factory(region_id)
+        simulator.set_id(get_region_simulator_id(region_id))
+        multiplier = region.get_multiplier()
+
+        def on_complete(sim, region_id=region_id, multiplier=multiplier):
+            return {
+                "region_id": region_id,
+                "multiplier": multiplier,
+                "stats": sim.get_stats(),
+            }
+
+        multisim.add_simulator(
+            simulator,
+            priority=cost(region),
+            on_complete=on_complete,
+        )
+
+
+def _is_rate(unit: Any) -> bool:
+    """Returns ``True`` if a stat's unit denotes a rate or ratio (e.g.,
+    "(Count/Cycle)" or "Ratio"). Such stats are averaged rather than summed.
+    """
+    return isinstance(unit, str) and ("/" in unit or unit == "Ratio")
+
+
+# Numeric fields which describe a statistic rather than count events (e.g.,
+# the bins of a Distribution). These are taken from the first region.
+_DESCRIPTIVE_FIELDS = frozenset(("num_bins", "bin_size", "scale_factor"))
+
+# Numeric fields which are the extrema of a statistic's samples (e.g., of a
+# Distribution), mapped to the function combining them across regions.
+_EXTREMA_FIELDS = {"min": min, "max": max}
+
+
+def _extrapolate(
+    nodes: List[Any], multipliers: List[float], field: Optional[str] = None
+) -> Any:
+    """Recursively extrapolate the same node of each region's statistics.
+
+    :param field: The name of the nodes in their parent, if any.
+    """
+    first = nodes[0]
+    if isinstance(first, dict):
+        if first.get("type") == "Scalar" and isinstance(
+            first.get("value"), Number
+        ):
+            to_return = dict(first)
+            weighted = sum(
+                node["value"] * multiplier
+                for node, multiplier in zip(nodes, multipliers)
+            )
+            if _is_rate(first.get("unit")):
+                weighted /= sum(multipliers)
+            to_return["value"] = weighted
+            return to_return
+        # Statistics absent from any region can't be extrapolated.
+        return {
+            key: _extrapolate(
+                [node[key] for node in nodes], multipliers, field=key
+            )
+            for key in first
+            if all(isinstance(node, dict) and key in node for node in nodes)
+        }
+    if not all(
+        isinstance(node, Number) and not isinstance(node, bool)
+        for node in nodes
+    ):
+        return first
+    if field in _DESCRIPTIVE_FIELDS:
+        return first
+    if field in _EXTREMA_FIELDS:
+        return _EXTREMA_FIELDS[field](nodes)
+    return sum(
+        node * multiplier for node, multiplier in zip(nodes, multipliers)
+    )
+
+
+def extrapolate_looppoint_stats(
+    region_results: Dict[str, Dict[str, Any]]
+) -> Dict[str, Any]:
+    """
+    Extrapolates whole-program statistics from per-region statistics.
+
+    Each scalar statistic is the sum of that statistic in each region
+    multiplied by the region's multiplier. Rates and ratios (e.g., IPC) are
+    instead the multiplier-weighted mean across the regions. Vector and
+    distribution bins are treated as scalars, as are the other counts of a
+    distribution (e.g., its sum, underflow and overflow). The minimum and
+    maximum of a distribution are the extrema across the regions, while its
+    number and size of bins are taken from the first region, as are
+    non-numeric values. Statistics which aren't present in every region
+    can't be extrapolated so are left out.
+
+    :param region_results: The per-region results returned by
+                           ``multisim.run`` for simulators added with
+                           ``add_looppoint_region_simulators``.
+
+    :returns: The extrapolated statistics, in the same JSON-style format as
+              ``Simulator.get_stats``.
+    """
+    results = [
+        result
+        for result in region_results.values()
+        if isinstance(result, dict) and "multiplier" in result
+    ]
+    if not results:
+        raise Exception("No LoopPoint region results to extrapolate from.")
+
+    return _extrapolate(
+        [result["stats"] for result in results],
+        [result["multiplier"] for result in results],
+    )
+
+
+def run(module_path: Path, processes: Optional[int] = None) -> Dict:
+    """Runs all the LoopPoint region simulators added in a configuration
+    script and returns the extrapolated whole-program statistics.
+
+    :param module_path: The path of the configuration script.
+    :param processes: The number of processes to run in parallel. If not
+                      specified, the number set in the configuration script
+                      or, failing that, the number of available threads is
+                      used.
+    """
+    return extrapolate_looppoint_stats(
+        multisim.run(module_path=module_path, processes=processes)
+    )
+
+
+if __name__ == "__m5_main__":
+    import argparse
+
+    import m5
+
+    parser = argparse.ArgumentParser(
+        description="Run every region of a LoopPoint workload in parallel "
+        "and extrapolate the whole-program statistics."
+    )
+    parser.add_argument(
+        "config",
+        type=str,
+        help="The path to the config script adding the region simulators "
+        "with `add_looppoint_region_simulators`.",
+    )
+    args = parser.parse_args()
+
+    multisim.module_run = True
+    stats = run(module_path=Path(args.config))
+
+    output = Path(m5.options.outdir) / "looppoint_extrapolated_stats.json"
+    with open(output, "w") as f:
+        json.dump(stats, f, indent=4)
+    print(f"Extrapolated LoopPoint statistics written to '{output}'.")
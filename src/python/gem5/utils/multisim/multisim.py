@@ -53,6 +53,11 @@ import importlib
 import multiprocessing
 from pathlib import Path
 from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
     Optional,
     Set,
 )
@@ -71,6 +76,24 @@ _num_processes = None
 
 _multi_sim: Set["Simulator"] = set()
 
+# The scheduling priority of each simulator, keyed by simulator id. Simulators
+# with a higher priority are started first. Simulators not in this dictionary
+# have a priority of 0.
+_priorities: Dict[str, float] = {}
+
+# Functions to run in the child process once a simulator has finished
+# running, keyed by simulator id. The value returned is passed back to the
+# parent process and returned by `run`.
+_on_complete: Dict[str, Callable[["Simulator"], Any]] = {}
+
+# The sweep parameters of each simulator, keyed by simulator id. These are
+# recorded with the simulator's statistics if result collection is enabled.
+_params: Dict[str, Dict[str, Any]] = {}
+
+# If set, the statistics of each simulator are recorded once it finishes and
+# merged into one dataset. See `set_result_collection`.
+_result_collection: Optional[Dict[str, Any]] = None
+
 
 def _load_module(module_path: Path) -> None:
     """Load the module at the given path."""
@@ -81,7 +104,9 @@ def _load_module(module_path: Path) -> None:
     spec.loader.exec_module(modulevar)
 
 
-def _get_simulator_ids_child_process(id_list, module_path: Path) -> None:
+def _get_simulator_ids_child_process(
+    id_list, module_path: Path, priority_dict=None
+) -> None:
     """Get the ids of the simulations to be run.
 
     This function is passed to the Python multiprocessing module and run with
@@ -92,6 +117,9 @@ def _get_simulator_ids_child_process(id_list, module_path: Path) -> None:
     Note: We run this as child process as we cannot load the config script as
     a module in the main process. This function is used in
     `get_simulator_ids` and should be used separately.
+
+    If ``priority_dict`` is passed, it is populated with the priority of each
+    simulator.
     """
 
     _load_module(module_path)
@@ -99,6 +127,8 @@ def _get_simulator_ids_child_process(id_list, module_path: Path) -> None:
     if len(id_list) != 0:
         id_list *= 0
     id_list.extend([sim.get_id() for sim in _multi_sim])
+    if priority_dict is not None:
+        priority_dict.update(_priorities)
 
 
 def _get_num_processes_child_process(
@@ -144,6 +174,69 @@ def get_simulator_ids(config_module_path: Path) -> list[str]:
     return id_list
 
 
+def get_simulator_ids_by_priority(config_module_path: Path) -> list[str]:
+    """Returns the IDs of the simulations to be run, ordered by descending
+    priority. Simulations with equal priority are ordered by their ID.
+
+    See `get_simulator_ids` for how the IDs are obtained.
+    """
+
+    manager = multiprocessing.Manager()
+    id_list = manager.list()
+    priority_dict = manager.dict()
+    p = multiprocessing.Process(
+        target=_get_simulator_ids_child_process,
+        args=(id_list, config_module_path, priority_dict),
+    )
+    p.start()
+    p.join()
+    return _sort_by_priority(id_list, dict(priority_dict))
+
+
+def _sort_by_priority(
+    ids: Iterable[str], priorities: Dict[str, float]
+) -> List[str]:
+    """Returns the IDs ordered by descending priority, then by ID. IDs absent
+    from ``priorities`` have a priority of 0.
+    """
+    return sorted(ids, key=lambda id: (-priorities.get(id, 0), id))
+
+
+def _get_result_collection_child_process(
+    result_dict, module_path: Path
+) -> None:
+    """Get the result collection settings of the config script. See
+    `_get_num_processes_child_process`.
+    """
+
+    _load_module(module_path)
+    if _result_collection is not None:
+        result_dict.update(_result_collection)
+
+
+def get_result_collection(config_module_path: Path) -> Optional[Dict]:
+    """Returns the result collection settings of the config script, or
+    `None` if result collection is not enabled.
+    """
+    manager = multiprocessing.Manager()
+    result_dict = manager.dict()
+    p = multiprocessing.Process(
+        target=_get_result_collection_child_process,
+        args=(result_dict, config_module_path),
+    )
+    p.start()
+    p.join()
+    return dict(result_dict) or None
+
+
+def _get_result_path(collection: Dict[str, Any]) -> Path:
+    if collection["path"]:
+        return Path(collection["path"])
+    import m5
+
+    return Path(m5.options.outdir) / "multisim_results"
+
+
 def get_num_processes(config_module_path: Path) -> Optional[int]:
     manager = multiprocessing.Manager()
     num_processes_dict = manager.dict()
@@ -156,8 +249,10 @@ def get_num_processes(config_module_path: Path) -> Optional[int]:
     return num_processes_dict["num_processes"]
 
 
-def _run(module_path: Path, id: str) -> None:
-    """Run the simulator with the ID specified."""
+def _run(module_path: Path, id: str) -> Any:
+    """Run the simulator with the ID specified. Returns the value returned
+    by the simulator's ``on_complete`` function, if set, otherwise ``None``.
+    """
 
     _load_module(module_path)
 
@@ -168,6 +263,10 @@ def _run(module_path: Path, id: str) -> None:
     assert len(sim_list) == 1, f"Multiple simulators with id '{id}' found."
     import m5
 
+    # Resolved before the output directory is overridden for this simulator.
+    if _result_collection is not None:
+        result_path = _get_result_path(_result_collection)
+
     subdir = Path(Path(m5.options.outdir) / Path(sim_list[0].get_id()))
     sim_list[0].override_outdir(subdir)
     # This doesn't do anything if none of the redirect options are passed
@@ -175,14 +274,40 @@ def _run(module_path: Path, id: str) -> None:
 
     sim_list[0].run()
 
+    if _result_collection is not None:
+        from .results import write_record
+
+        write_record(
+            directory=result_path,
+            id=id,
+            params=_params.get(id, {}),
+            stats=sim_list[0].get_stats(),
+            patterns=_result_collection["stats"],
+        )
+
+    if id in _on_complete:
+        return _on_complete[id](sim_list[0])
+    return None
 
-def run(module_path: Path, processes: Optional[int] = None) -> None:
+
+def run(module_path: Path, processes: Optional[int] = None) -> Dict[str, Any]:
     """Run the simulators specified in the module in parallel.
 
+    Simulators are started in order of descending priority (see
+    `add_simulator`). Placing the longest simulations first reduces the time
+    spent waiting on a few long simulations at the end of the run.
+
     :param module_path: The path to the module containing the simulators to
     run.
     :param processes: The number of processes to run in parallel. If not
     specified, the number of available threads will be used.
+
+    :returns: A dictionary mapping the ID of each simulator with an
+    ``on_complete`` function to the value it returned.
+
+    If result collection is enabled (see `set_result_collection`), the
+    statistics of the simulators are merged into one dataset once all have
+    finished.
     """
 
     assert len(_multi_sim) == 0, (
@@ -192,8 +317,9 @@ def run(module_path: Path, processes: Optional[int] = None) -> None:
 
     # Get the simulator IDs. This both provides us a list of targets
     # and, by-proxy, the number of jobs.
-    ids = get_simulator_ids(module_path)
+    ids = get_simulator_ids_by_priority(module_path)
     max_num_processes = get_num_processes(module_path)
+    result_collection = get_result_collection(module_path)
 
     assert len(_multi_sim) == 0, (
         "Simulators instantiated in main thread instead of child thread "
@@ -209,8 +335,26 @@ def run(module_path: Path, processes: Optional[int] = None) -> None:
     # Use the starmap function to create N child processes each with same
     # module path (the config script specifying all simulations using MultiSim)
     # but a different ID. The ID is used to select the correct simulator to
-    # run.
-    pool.starmap(_run, zip([module_path for _ in range(len(ids))], tuple(ids)))
+    # run. A chunksize of 1 ensures the simulations are started in priority
+    # order rather than being handed out to processes in batches.
+    results = pool.starmap(
+        _run,
+        zip([module_path for _ in range(len(ids))], tuple(ids)),
+        chunksize=1,
+    )
+
+    if result_collection is not None:
+        from .results import merge_records
+
+        merge_records(
+            _get_result_path(result_collection),
+            format=result_collection["format"],
+            ids=None if result_collection["shared"] else ids,
+        )
+
+    return {
+        id: result for id, result in zip(ids, results) if result is not None
+    }
 
 
 def set_num_processes(num_processes: int) -> None:
@@ -227,12 +371,48 @@ def set_num_processes(num_processes: int) -> None:
         raise ValueError("Number of processes must be an integer.")
 
 
+def set_result_collection(
+    stats: Optional[List[str]] = None,
+    path: Optional[Path] = None,
+    format: Optional[str] = None,
+    shared: bool = False,
+) -> None:
+    """Record the statistics of each simulator once it finishes, and merge
+    them into one columnar dataset, keyed by simulator id and sweep
+    parameters (see `add_simulator`), once all have finished. See
+    `gem5.utils.multisim.results`.
+
+    :param stats: Glob patterns (e.g., ``"board.cache_hierarchy.*.missRate"``)
+    of the statistics to record. If not set, all statistics are recorded.
+    :param path: The directory of the dataset. ``<outdir>/multisim_results``
+    by default.
+    :param format: ``"parquet"`` or ``"npy"``. By default Parquet if
+    ``pyarrow`` is installed, otherwise NumPy.
+    :param shared: If set, the dataset includes the records of all the
+    simulators recorded in its directory, including those of earlier MultiSim
+    runs (e.g., of other configuration scripts with the same ``path``). By
+    default only the simulators of this run are included.
+    """
+    global _result_collection
+    _result_collection = {
+        "stats": list(stats) if stats is not None else None,
+        "path": str(path) if path else None,
+        "format": format,
+        "shared": shared,
+    }
+
+
 def num_simulators() -> int:
     """Returns the number of simulators added to the MultiSim."""
     return len(_multi_sim)
 
 
-def add_simulator(simulator: "Simulator") -> None:
+def add_simulator(
+    simulator: "Simulator",
+    priority: float = 0,
+    on_complete: Optional[Callable[["Simulator"], Any]] = None,
+    params: Optional[Dict[str, Any]] = None,
+) -> None:
     """Add a single simulator to the Multisim. Doing so informs the simulators
     to run this simulator via multiprocessing.
 
@@ -247,6 +427,16 @@ def add_simulator(simulator: "Simulator") -> None:
     :param id: The id of the simulator. This is used to reference the
     simulation. This is particularly important when referencing the correct
     m5out subdirectory.
+    :param priority: The scheduling priority of the simulator. Simulators with
+    a higher priority are started first. Typically this is an estimate of the
+    simulation's length. 0 by default.
+    :param on_complete: An optional function run in the simulator's process
+    once the simulator has finished running. It is passed the simulator and
+    its return value, which must be picklable, is returned by `run`.
+    :param params: The sweep parameters of the simulator (e.g.,
+    ``{"l2_size": "1MiB"}``), which must be JSON serializable. These are
+    recorded with its statistics if result collection is enabled (see
+    `set_result_collection`).
     """
 
     global _multi_sim
@@ -256,6 +446,12 @@ def add_simulator(simulator: "Simulator") -> None:
         # id.
         simulator.set_id(f"sim_{len(_multi_sim)}")
     _multi_sim.add(simulator)
+    if priority:
+        _priorities[simulator.get_id()] = priority
+    if on_complete:
+        _on_complete[simulator.get_id()] = on_complete
+    if params:
+        _params[simulator.get_id()] = dict(params)
 
     # The following code is used to enable a user to run a single simulation
     # from the config script, based on an ID, in the case the config script is
@@ -0,0 +1,345 @@
+# Copyright (c) 2026 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Collection of the statistics of MultiSim simulations into one columnar
+dataset.
+
+When enabled in the configuration script, each simulator writes a compact
+record of its statistics, its ID and its sweep parameters once it finishes.
+After all the simulators have finished, the records are merged into one
+dataset with a row per simulator and a column per parameter and statistic:
+
+.. code-block:: python
+
+    from gem5.utils import multisim
+
+    multisim.set_result_collection(
+        stats=["simSeconds", "board.processor.cores*.core.ipc"],
+    )
+    for size in ["256KiB", "1MiB"]:
+        ...
+        multisim.add_simulator(simulator, params={"l2_size": size})
+
+The dataset is written to ``<outdir>/multisim_results`` by default, as a
+Parquet file if ``pyarrow`` is installed, otherwise as a NumPy matrix which
+can be memory mapped. It is loaded with:
+
+.. code-block:: python
+
+    from gem5.utils.multisim.results import load_results
+
+    df = load_results("m5out/multisim_results")
+
+This returns a ``pandas.DataFrame`` if ``pandas`` is installed, otherwise a
+dictionary of column names to NumPy arrays. This module does not depend on
+gem5, so it may be imported by analysis scripts run outside of gem5.
+
+The records are kept, one per simulator ID, in the ``records``
+subdirectory, and the dataset is rebuilt from the records of the simulators
+of the current run. A simulator which is run again replaces its earlier
+record. Records left by earlier runs (e.g., of simulators since removed from
+the configuration script) are only included if the dataset is shared between
+MultiSim runs, with ``set_result_collection(shared=True)``.
+"""
+
+import fnmatch
+import json
+import os
+import re
+from numbers import Number
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Union,
+)
+
+try:
+    import numpy as np
+
+    _have_numpy = True
+except ImportError:
+    _have_numpy = False
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+
+    _have_pyarrow = True
+except ImportError:
+    _have_pyarrow = False
+
+_RECORDS_DIR = "records"
+_PARQUET_FILE = "results.parquet"
+_NPY_VALUES_FILE = "values.npy"
+_NPY_COLUMNS_FILE = "columns.json"
+# Records the format of the last dataset written.
+_FORMAT_FILE = "format.json"
+
+# The keys of a JSON statistic which describe it rather than hold its value.
+_METADATA_KEYS = {"type", "unit", "description", "datatype"}
+
+
+def _flatten(node: Any, path: str, out: Dict[str, float]) -> None:
+    """Flattens the JSON statistics of a simulation (see
+    ``Simulator.get_stats``) into a dictionary of dotted statistic paths to
+    numeric values.
+    """
+    if isinstance(node, dict):
+        if "value" in node and "type" in node:
+            _flatten(node["value"], path, out)
+            return
+        for key, value in node.items():
+            if key not in _METADATA_KEYS:
+                _flatten(value, f"{path}.{key}" if path else str(key), out)
+    elif isinstance(node, list):
+        for index, value in enumerate(node):
+            _flatten(value, f"{path}::{index}", out)
+    elif isinstance(node, Number) and not isinstance(node, bool):
+        out[path] = float(node)
+
+
+def _select(
+    stats: Dict[str, float], patterns: Optional[List[str]]
+) -> Dict[str, float]:
+    if patterns is None:
+        return stats
+    regex = re.compile(
+        "|".join(f"(?:{fnmatch.translate(p)})" for p in patterns)
+    )
+    return {name: value for name, value in stats.items() if regex.match(name)}
+
+
+def write_record(
+    directory: Union[str, Path],
+    id: str,
+    params: Dict[str, Any],
+    stats: Dict[str, Any],
+    patterns: Optional[List[str]] = None,
+) -> Path:
+    """Writes the record of one simulation.
+
+    :param directory: The dataset directory.
+    :param id: The simulator ID.
+    :param params: The simulator's sweep parameters.
+    :param stats: The simulator's statistics, as returned by
+                  ``Simulator.get_stats``.
+    :param patterns: If set, only the statistics matching one of these glob
+                     patterns are recorded.
+
+    :returns: The path of the record.
+    """
+    flat = {}
+    _flatten(stats, "", flat)
+    record = {
+        "id": id,
+        "params": params,
+        "stats": _select(flat, patterns),
+    }
+    records = Path(directory) / _RECORDS_DIR
+    records.mkdir(parents=True, exist_ok=True)
+    path = records / f"{id}.json"
+    # Written then renamed, so a record is never read partially written.
+    tmp = path.with_name(f".{path.name}.{os.getpid()}")
+    with open(tmp, "w") as f:
+        json.dump(record, f, separators=(",", ":"))
+    os.replace(tmp, path)
+    return path
+
+
+def _read_records(
+    directory: Path, ids: Optional[Iterable[str]] = None
+) -> List[Dict[str, Any]]:
+    records_dir = directory / _RECORDS_DIR
+    if ids is None:
+        paths = sorted(records_dir.glob("*.json"))
+    else:
+        paths = [records_dir / f"{id}.json" for id in sorted(set(ids))]
+    records = []
+    for path in paths:
+        try:
+            with open(path) as f:
+                records.append(json.load(f))
+        except FileNotFoundError:
+            # A simulator which hasn't written a record.
+            if ids is None:
+                raise
+    return records
+
+
+def merge_records(
+    directory: Union[str, Path],
+    format: Optional[str] = None,
+    ids: Optional[Iterable[str]] = None,
+) -> Path:
+    """Merges the records in a dataset directory into a dataset.
+
+    :param directory: The dataset directory.
+    :param format: ``"parquet"`` or ``"npy"``. By default Parquet if
+                   ``pyarrow`` is installed, otherwise NumPy.
+    :param ids: If set, only the records of the simulators with these IDs
+                are merged. Otherwise, all the records in the directory are.
+
+    :returns: The path of the dataset file.
+    """
+    directory = Path(directory)
+    if format is None:
+        format = "parquet" if _have_pyarrow else "npy"
+    if format == "parquet" and not _have_pyarrow:
+        raise Exception("Writing Parquet requires the `pyarrow` package.")
+    if format == "npy" and not _have_numpy:
+        raise Exception("Writing the dataset requires the `numpy` package.")
+    if format not in ("parquet", "npy"):
+        raise ValueError(f"Unknown result dataset format '{format}'.")
+
+    records = _read_records(directory, ids)
+    ids = [record["id"] for record in records]
+    param_names = sorted({k for r in records for k in r["params"]})
+    stat_names = sorted({k for r in records for k in r["stats"]})
+    params = {
+        name: [r["params"].get(name) for r in records] for name in param_names
+    }
+    column = {name: i for i, name in enumerate(stat_names)}
+
+    if format == "parquet":
+        columns = {"id": ids}
+        columns.update({f"param.{k}": v for k, v in params.items()})
+        for name in stat_names:
+            columns[name] = [r["stats"].get(name) for r in records]
+        path = directory / _PARQUET_FILE
+        pyarrow.parquet.write_table(pyarrow.table(columns), path)
+        stale = (_NPY_VALUES_FILE, _NPY_COLUMNS_FILE)
+    else:
+        values = np.full((len(records), len(stat_names)), np.nan)
+        for row, record in enumerate(records):
+            stats = record["stats"]
+            values[row, [column[name] for name in stats]] = list(
+                stats.values()
+            )
+        path = directory / _NPY_VALUES_FILE
+        np.save(path, values)
+        with open(directory / _NPY_COLUMNS_FILE, "w") as f:
+            json.dump({"ids": ids, "params": params, "stats": stat_names}, f)
+        stale = (_PARQUET_FILE,)
+
+    tmp = directory / f".{_FORMAT_FILE}.{os.getpid()}"
+    with open(tmp, "w") as f:
+        json.dump({"format": format}, f)
+    os.replace(tmp, directory / _FORMAT_FILE)
+    # A dataset written earlier in the other format is out of date.
+    for name in stale:
+        (directory / name).unlink(missing_ok=True)
+    return path
+
+
+def _dataset_format(directory: Path) -> str:
+    """Returns the format of the dataset in a directory. This is the format
+    recorded by ``merge_records`` or, for datasets without one, the format of
+    the newest dataset file.
+    """
+    try:
+        with open(directory / _FORMAT_FILE) as f:
+            return json.load(f)["format"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    paths = {
+        format: directory / name
+        for format, name in (
+            ("parquet", _PARQUET_FILE),
+            ("npy", _NPY_VALUES_FILE),
+        )
+        if (directory / name).exists()
+    }
+    if not paths:
+        raise FileNotFoundError(
+            f"There is no result dataset in '{directory}'."
+        )
+    return max(paths, key=lambda format: paths[format].stat().st_mtime_ns)
+
+
+def load_results(
+    directory: Union[str, Path], stats: Optional[Iterable[str]] = None
+):
+    """Loads a dataset written by ``merge_records``.
+
+    :param directory: The dataset directory.
+    :param stats: If set, only these statistics are loaded.
+
+    :returns: A ``pandas.DataFrame`` with an ``id`` column, a
+              ``param.<name>`` column per parameter and a column per
+              statistic, if ``pandas`` is installed. Otherwise, a dictionary
+              of these column names to NumPy arrays (or lists, for the
+              parameters).
+    """
+    directory = Path(directory)
+    stats = list(stats) if stats is not None else None
+
+    format = _dataset_format(directory)
+    if format == "parquet" and not _have_pyarrow:
+        raise Exception("Reading Parquet requires the `pyarrow` package.")
+    if format == "npy" and not _have_numpy:
+        raise Exception("Reading the dataset requires the `numpy` package.")
+
+    if format == "parquet":
+        columns = None if stats is None else ["id"] + stats
+        schema = pyarrow.parquet.read_schema(directory / _PARQUET_FILE)
+        if columns is not None:
+            columns[1:1] = [n for n in schema.names if n.startswith("param.")]
+        table = pyarrow.parquet.read_table(
+            directory / _PARQUET_FILE, columns=columns
+        )
+        try:
+            return table.to_pandas()
+        except ImportError:
+            return {
+                name: table[name].to_numpy() for name in table.column_names
+            }
+
+    with open(directory / _NPY_COLUMNS_FILE) as f:
+        meta = json.load(f)
+    values = np.load(directory / _NPY_VALUES_FILE, mmap_mode="r")
+    names = meta["stats"]
+    if stats is not None:
+        index = {name: i for i, name in enumerate(names)}
+        values = values[:, [index[name] for name in stats]]
+        names = stats
+
+    columns = {"id": meta["ids"]}
+    columns.update({f"param.{k}": v for k, v in meta["params"].items()})
+    try:
+        import pandas
+
+        frame = pandas.DataFrame(values, columns=names)
+        for i, (name, value) in enumerate(columns.items()):
+            frame.insert(i, name, value)
+        return frame
+    except ImportError:
+        columns.update({name: values[:, i] for i, name in enumerate(names)})
+        return columns
@@ -36,6 +36,10 @@ from m5.util import (
 )
 
 from gem5.resources.resource import SimpointResource
+from gem5.resources.simpoint_utils import (
+    compute_warmup,
+    load_simpoints_and_weights,
+)
 
 
 class SimPoint:
@@ -135,27 +139,12 @@ class SimPoint:
         This function takes in file paths and outputs a list of SimPoints
         instruction starts and a list of weights.
         """
-        simpoint = []
-        with open(simpoint_path) as simpoint_file, open(
-            weight_path
-        ) as weight_file:
-            while True:
-                line = simpoint_file.readline()
-                if not line:
-                    break
-                interval = int(line.split(" ", 1)[0])
-                line = weight_file.readline()
-                if not line:
-                    fatal("not engough weights")
-                weight = float(line.split(" ", 1)[0])
-                simpoint.append((interval, weight))
-        simpoint.sort(key=lambda obj: obj[0])
-        # use simpoint to sort
-        simpoint_start_insts = []
-        weight_list = []
-        for start, weight in simpoint:
-            simpoint_start_insts.append(start * self._simpoint_interval)
-            weight_list.append(weight)
+        simpoint_list, weight_list = load_simpoints_and_weights(
+            simpoint_path, weight_path
+        )
+        simpoint_start_insts = [
+            start * self._simpoint_interval for start in simpoint_list
+        ]
         return simpoint_start_insts, weight_list
 
     def set_warmup_intervals(self, warmup_interval: int) -> List[int]:
@@ -170,17 +159,11 @@ class SimPoint:
         instruction length is the gap between the starting instruction of a
         SimPoint and the ending instruction of the last SimPoint.
         """
-        warmup_list = []
-        for index, start_inst in enumerate(self._simpoint_start_insts):
-            warmup_inst = start_inst - warmup_interval
-            if warmup_inst < 0:
-                warmup_inst = start_inst
-            else:
-                warmup_inst = warmup_interval
-            warmup_list.append(warmup_inst)
-            # change the starting instruction of a SimPoint to include the
-            # warmup instruction length
-            self._simpoint_start_insts[index] = start_inst - warmup_inst
+        # change the starting instruction of a SimPoint to include the
+        # warmup instruction length
+        self._simpoint_start_insts, warmup_list = compute_warmup(
+            self._simpoint_start_insts, warmup_interval
+        )
         return warmup_list
 
     def get_simpoint_start_insts(self) -> List[int]:
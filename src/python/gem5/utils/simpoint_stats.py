@@ -0,0 +1,305 @@
+# Copyright (c) 2026 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Aggregation of the statistics of SimPoint runs.
+
+When each SimPoint (e.g., each checkpoint taken with
+``simpoints_save_checkpoint_generator``) is simulated as its own job, each job
+writes its own ``stats.txt``. This module combines these into a weighted
+estimate of each statistic for the whole workload, along with a confidence
+interval for that estimate:
+
+.. code-block:: python
+
+    from gem5.utils.simpoint_stats import aggregate_simpoint_stats
+
+    aggregated = aggregate_simpoint_stats(
+        outdirs=[f"m5out/simpoint_{i}" for i in range(num_simpoints)],
+        weights=simpoint_resource.get_weight_list(),
+    )
+    print(aggregated["system.processor.cores0.core.ipc"].get_mean())
+
+Every scalar statistic, every vector element and every distribution bucket
+(e.g., ``system.cpu.dcache.overallMissLatency::0-999``) is aggregated
+independently. Only the statistics of the dump being aggregated are read from
+each stats file, via its index (see `m5.ext.pystats.textloader`), so neither
+the time nor the memory use grows with the number of dumps in a file.
+"""
+
+from pathlib import Path
+from statistics import NormalDist
+from typing import (
+    Any,
+    Dict,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from m5.ext.pystats.textloader import StatsTextFile
+
+try:
+    import numpy as np
+
+    _have_numpy = True
+except ImportError:
+    _have_numpy = False
+
+
+def _get_stats_dump(path: Path, dump_index: int) -> Dict[str, float]:
+    """Returns the statistics of a dump in a ``stats.txt`` file. Negative
+    indices count back from the last dump.
+    """
+    return StatsTextFile(path).read_values(dumps=[dump_index])[0]
+
+
+class AggregatedStat:
+    """The weighted aggregate of a single statistic across SimPoints."""
+
+    def __init__(
+        self,
+        mean: float,
+        std_dev: float,
+        confidence_interval: Tuple[float, float],
+        weight: float,
+    ):
+        """
+        :param mean: The weighted mean of the statistic.
+        :param std_dev: The weighted standard deviation of the statistic.
+        :param confidence_interval: The lower and upper bounds of the
+                                    confidence interval of the mean.
+        :param weight: The total weight of the SimPoints with a value (which
+                       isn't NaN) for this statistic.
+        """
+        self._mean = mean
+        self._std_dev = std_dev
+        self._confidence_interval = confidence_interval
+        self._weight = weight
+
+    def get_mean(self) -> float:
+        """Returns the weighted mean of the statistic."""
+        return self._mean
+
+    def get_std_dev(self) -> float:
+        """Returns the weighted standard deviation of the statistic."""
+        return self._std_dev
+
+    def get_confidence_interval(self) -> Tuple[float, float]:
+        """Returns the lower and upper bounds of the confidence interval of
+        the weighted mean."""
+        return self._confidence_interval
+
+    def get_weight(self) -> float:
+        """Returns the total weight of the SimPoints with a valid value for
+        this statistic."""
+        return self._weight
+
+    def to_json(self) -> Dict[str, Any]:
+        """Returns this aggregate as a JSON-serializable dictionary."""
+        return {
+            "mean": self._mean,
+            "std_dev": self._std_dev,
+            "confidence_interval": list(self._confidence_interval),
+            "weight": self._weight,
+        }
+
+    def __repr__(self) -> str:
+        low, high = self._confidence_interval
+        return f"{self._mean} [{low}, {high}]"
+
+
+class SimpointStatsAggregator:
+    """
+    Incrementally aggregates the statistics of SimPoint runs. Requires NumPy.
+
+    For each statistic, the total weight of the SimPoints with a value for
+    it, the weighted mean and the weighted sum of the squared deviations from
+    the mean are updated as each SimPoint's statistics are added, using
+    West's weighted variant of Welford's algorithm. This is numerically
+    stable even if the variance is small relative to the mean. The
+    statistics are kept in NumPy arrays, over the union of the names of the
+    statistics added so far, so each SimPoint is added in one vectorized
+    pass.
+
+    A statistic absent from a SimPoint's stats, or with a NaN value, is
+    excluded for that SimPoint and the remaining weights renormalized.
+    """
+
+    def __init__(self):
+        if not _have_numpy:
+            raise Exception(
+                "Aggregating SimPoint statistics requires the `numpy` package."
+            )
+        self._total_weight = 0.0
+        # The column of each statistic in the arrays below.
+        self._columns: Dict[str, int] = {}
+        # For each statistic: the total weight of the SimPoints with a value,
+        # the sum of the squares of those weights, the weighted mean and the
+        # weighted sum of the squared deviations from the mean.
+        self._weights = np.zeros(0)
+        self._weights_squared = np.zeros(0)
+        self._means = np.zeros(0)
+        self._squared_deviations = np.zeros(0)
+
+    def _grow(self, size: int) -> None:
+        """Grows the arrays to hold at least ``size`` statistics."""
+        capacity = len(self._weights)
+        if size <= capacity:
+            return
+        extra = np.zeros(max(size, 2 * capacity) - capacity)
+        self._weights = np.concatenate((self._weights, extra))
+        self._weights_squared = np.concatenate((self._weights_squared, extra))
+        self._means = np.concatenate((self._means, extra))
+        self._squared_deviations = np.concatenate(
+            (self._squared_deviations, extra)
+        )
+
+    def add_stats(self, stats: Dict[str, float], weight: float) -> None:
+        """Adds the statistics of one SimPoint.
+
+        :param stats: A dictionary mapping statistic names to values.
+        :param weight: The SimPoint's weight.
+        """
+        if weight < 0:
+            raise ValueError("SimPoint weights cannot be negative.")
+        self._total_weight += weight
+
+        columns = self._columns
+        indices = np.fromiter(
+            (columns.setdefault(name, len(columns)) for name in stats),
+            dtype=np.intp,
+            count=len(stats),
+        )
+        values = np.fromiter(stats.values(), dtype=float, count=len(stats))
+        self._grow(len(columns))
+        if weight == 0:
+            return
+
+        valid = ~np.isnan(values)
+        indices = indices[valid]
+        values = values[valid]
+        weights = self._weights[indices] + weight
+        deltas = values - self._means[indices]
+        means = self._means[indices] + deltas * (weight / weights)
+        self._squared_deviations[indices] += weight * deltas * (values - means)
+        self._means[indices] = means
+        self._weights[indices] = weights
+        self._weights_squared[indices] += weight * weight
+
+    def add_stats_file(
+        self, path: Union[str, Path], weight: float, dump_index: int = -1
+    ) -> None:
+        """Adds the statistics of one SimPoint from a ``stats.txt`` file.
+
+        :param path: The path to the ``stats.txt`` file.
+        :param weight: The SimPoint's weight.
+        :param dump_index: The index of the stats dump to use. By default the
+                           last dump is used.
+        """
+        self.add_stats(_get_stats_dump(Path(path), dump_index), weight)
+
+    def get_results(
+        self, confidence: float = 0.95
+    ) -> Dict[str, AggregatedStat]:
+        """Returns the aggregate of each statistic.
+
+        The confidence interval assumes the SimPoints with a value for a
+        statistic are a weighted sample of the workload's intervals, with an
+        effective sample size of ``(sum(w) ** 2) / sum(w ** 2)``.
+
+        :param confidence: The confidence level of the confidence intervals.
+                           0.95 by default.
+        """
+        if self._total_weight <= 0:
+            raise Exception("No SimPoint statistics have been added.")
+
+        z = NormalDist().inv_cdf(0.5 + confidence / 2)
+        size = len(self._columns)
+        weights = self._weights[:size]
+        valid = weights > 0
+        # Statistics without a valid value in any SimPoint are NaN.
+        with np.errstate(divide="ignore", invalid="ignore"):
+            means = np.where(valid, self._means[:size], np.nan)
+            variances = np.maximum(
+                self._squared_deviations[:size] / weights, 0.0
+            )
+            std_devs = np.sqrt(variances)
+            effective_samples = weights**2 / self._weights_squared[:size]
+            half_widths = z * std_devs / np.sqrt(effective_samples)
+        lows = means - half_widths
+        highs = means + half_widths
+
+        return {
+            name: AggregatedStat(
+                mean=float(means[column]),
+                std_dev=float(std_devs[column]),
+                confidence_interval=(
+                    float(lows[column]),
+                    float(highs[column]),
+                ),
+                weight=float(weights[column]),
+            )
+            for name, column in self._columns.items()
+        }
+
+
+def aggregate_simpoint_stats(
+    outdirs: Sequence[Union[str, Path]],
+    weights: Union[Sequence[float], "SimpointResource"],
+    stats_file: str = "stats.txt",
+    dump_index: int = -1,
+    confidence: float = 0.95,
+) -> Dict[str, AggregatedStat]:
+    """
+    Aggregates the statistics of SimPoint runs, each in its own output
+    directory, into a weighted estimate of each statistic.
+
+    :param outdirs: The output directory of each SimPoint run.
+    :param weights: The weight of each SimPoint, in the same order as
+                    ``outdirs``, or a ``SimpointResource`` whose
+                    ``get_weight_list()`` is used.
+    :param stats_file: The name of the stats file in each output directory.
+    :param dump_index: The index of the stats dump to use from each stats
+                       file. By default the last dump is used.
+    :param confidence: The confidence level of the confidence intervals.
+
+    :returns: A dictionary mapping each statistic's name to its aggregate.
+    """
+    if hasattr(weights, "get_weight_list"):
+        weights = weights.get_weight_list()
+    if len(outdirs) != len(weights):
+        raise ValueError(
+            f"{len(outdirs)} output directories were given for "
+            f"{len(weights)} SimPoint weights."
+        )
+
+    aggregator = SimpointStatsAggregator()
+    for outdir, weight in zip(outdirs, weights):
+        aggregator.add_stats_file(
+            Path(outdir) / stats_file, weight, dump_index=dump_index
+        )
+    return aggregator.get_results(confidence=confidence)
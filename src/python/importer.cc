@@ -30,6 +30,7 @@
 
 #include "python/embedded.hh"
 #include "python/m5ImporterCode.hh"
+#include "python/m5PythonZdict.hh"
 #include "python/pybind_init.hh"
 
 namespace py = pybind11;
@@ -41,6 +42,8 @@ void
 importerInit(py::module_ &m)
 {
     m.def("_init_all_embedded", gem5::EmbeddedPython::initAll);
+    m.attr("_zdict") = py::memoryview::from_memory(
+            gem5::Blobs::m5PythonZdict, gem5::Blobs::m5PythonZdict_len);
     py::str importer_code(
             reinterpret_cast<const char *>(gem5::Blobs::m5ImporterCode),
             gem5::Blobs::m5ImporterCode_len);
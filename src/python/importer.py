@@ -27,7 +27,9 @@
 import importlib
 import importlib.abc
 import importlib.util
+import marshal
 import os
+import zlib
 
 
 class ByteCodeLoader(importlib.abc.Loader):
@@ -42,30 +44,49 @@ class ByteCodeLoader(importlib.abc.Loader):
         return self.code
 
 
-# Simple importer that allows python to import data from a dict of
-# code objects.  The keys are the module path, and the items are the
-# filename and bytecode of the file.
+# Simple importer that allows python to import modules embedded in gem5.
+# The keys are the module path, and the items are the filename, the
+# compressed marshalled bytecode of the file and its uncompressed size.
+#
+# The compressed data is a read-only view of the data embedded in the
+# gem5 binary, so it is only paged in by the OS when it is used. It is
+# only decompressed and unmarshalled when the module is imported, and the
+# code object is not kept afterwards.
 class CodeImporter:
-    def __init__(self):
+    def __init__(self, zdict=None):
         self.modules = {}
+        self.zdict = zdict
         override_var = os.environ.get("M5_OVERRIDE_PY_SOURCE", "false")
         self.override = override_var.lower() in ("true", "yes")
 
-    def add_module(self, abspath, modpath, code):
+    def add_module(self, abspath, modpath, data, size):
         if modpath in self.modules:
             raise AttributeError(f"{modpath} already found in importer")
 
-        self.modules[modpath] = (abspath, code)
+        self.modules[modpath] = (abspath, data, size)
+
+    def get_code(self, modpath):
+        abspath, data, size = self.modules[modpath]
+        if self.zdict is not None:
+            decompressor = zlib.decompressobj(zdict=self.zdict)
+        else:
+            decompressor = zlib.decompressobj()
+        marshalled = decompressor.decompress(data) + decompressor.flush()
+        if len(marshalled) != size or not decompressor.eof:
+            raise ImportError(f"Embedded code for {modpath} is corrupt")
+        return marshal.loads(marshalled)
 
     def find_spec(self, fullname, path, target=None):
         if fullname not in self.modules:
             return None
 
-        abspath, code = self.modules[fullname]
+        abspath = self.modules[fullname][0]
 
         if self.override and os.path.exists(abspath):
             src = open(abspath).read()
             code = compile(src, abspath, "exec")
+        else:
+            code = self.get_code(fullname)
 
         is_package = os.path.basename(abspath) == "__init__.py"
         spec = importlib.util.spec_from_loader(
@@ -81,7 +102,10 @@ class CodeImporter:
 # use it.  There's currently nothing in the importer, but calls to
 # add_module can be used to add code.
 def install():
-    importer = CodeImporter()
+    # _zdict is injected into this module's namespace by the c++ code that
+    # loads it. It's the dictionary the embedded modules were compressed
+    # with.
+    importer = CodeImporter(_zdict)
     global add_module
     add_module = importer.add_module
     import sys
@@ -42,4 +42,8 @@ from .statistic import (
     Vector2d,
 )
 from .storagetype import StorageType
+from .textloader import (
+    StatsTextFile,
+    write_seekable_gzip,
+)
 from .timeconversion import TimeConversion
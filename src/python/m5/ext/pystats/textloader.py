@@ -0,0 +1,645 @@
+# Copyright (c) 2026 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Indexed reading of gem5's text statistics (``stats.txt``).
+
+Each stats dump appends a window, delimited by the ``Begin Simulation
+Statistics`` and ``End Simulation Statistics`` markers, to the stats file. A
+run which dumps its statistics periodically may therefore produce a very large
+file. Rather than parsing the whole file, `StatsTextFile` builds an index of
+the byte range and ``finalTick`` of each window, which is cached alongside the
+file (``<file>.index.json``) and reused until the file changes. Only the
+requested statistics of the requested windows are then parsed, optionally in
+parallel:
+
+.. code-block::
+
+    from m5.ext.pystats.textloader import StatsTextFile
+
+    stats = StatsTextFile("m5out/stats.txt")
+    ticks = stats.get_final_ticks()
+    names, values = stats.to_numpy(stats=["board.processor.*.ipc"], jobs=8)
+    last = stats.read_simstats(dumps=[-1])[0]
+
+Statistics are selected by name or by glob pattern. A name also selects each
+element of the vector or distribution of that name (``<name>::<element>``).
+
+Gzip-compressed stats files are also supported. A gzip file can only be
+entered at the start of one of its members, so the index records the member
+boundaries as access points and a window is decompressed from the nearest
+preceding access point. gem5 writes ``stats.txt.gz`` as a single member, which
+is read sequentially. `write_seekable_gzip` rewrites a stats file with one
+member per window so that any window can be read directly.
+"""
+
+import gzip
+import json
+import os
+import re
+import zlib
+from bisect import (
+    bisect_left,
+    bisect_right,
+)
+from concurrent.futures import ProcessPoolExecutor
+from fnmatch import translate
+from pathlib import Path
+from typing import (
+    IO,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from .group import Group
+from .simstat import SimStat
+from .statistic import (
+    Scalar,
+    Vector,
+)
+
+_BEGIN_MARKER = b"---------- Begin Simulation Statistics ----------"
+_END_MARKER = b"---------- End Simulation Statistics"
+
+# `final_tick` is the name of the statistic prior to gem5 v21.0.
+_FINAL_TICK_REGEX = re.compile(rb"\n(?:finalTick|final_tick)\s+(\d+)\s")
+
+# The comment of a statistic: its description followed by its unit in
+# parentheses. A compound unit is itself parenthesized, e.g.,
+# "IPC ((Count/Cycle))".
+_COMMENT_REGEX = re.compile(r"^(.*?)\s*\((\([^()]*\)|[^()]*)\)$")
+
+# The number of bytes kept between chunks while indexing, such that a marker
+# or a `finalTick` line split across two chunks is still found.
+_SCAN_OVERLAP = 256
+
+# The size of the chunks in which a stats file is read. Compressed chunks are
+# smaller as they may expand to many times their size.
+_CHUNK_SIZE = 16 * 1024 * 1024
+_GZIP_CHUNK_SIZE = 1024 * 1024
+
+# The minimum number of uncompressed bytes between two access points in a
+# gzip file.
+_ACCESS_POINT_SPACING = 1024 * 1024
+
+_GZIP_MAGIC = b"\x1f\x8b"
+
+# An index of any other version is rebuilt.
+_INDEX_VERSION = 1
+
+
+def _gzip_chunks(
+    f: IO[bytes], offset: int
+) -> Iterator[Tuple[Optional[int], bytes]]:
+    """Yields the decompressed data of a gzip file, from the member at the
+    given compressed offset, across member boundaries. At the start of each
+    member its compressed offset is yielded, with no data. The data of every
+    other chunk is yielded with an offset of ``None``.
+    """
+    f.seek(offset)
+    decompressor = zlib.decompressobj(wbits=31)
+    yield offset, b""
+    while True:
+        data = f.read(_GZIP_CHUNK_SIZE)
+        if not data:
+            return
+        offset += len(data)
+        while data:
+            out = decompressor.decompress(data)
+            if out:
+                yield None, out
+            if not decompressor.eof:
+                break
+            data = decompressor.unused_data
+            if len(data) >= 2 and not data.startswith(_GZIP_MAGIC):
+                # Trailing garbage, such as zero padding, ends the file.
+                return
+            decompressor = zlib.decompressobj(wbits=31)
+            yield offset - len(data), b""
+
+
+def _data_chunks(f: IO[bytes], compressed: bool) -> Iterator[bytes]:
+    """Yields the (decompressed) data of a stats file from its start."""
+    if compressed:
+        for _, data in _gzip_chunks(f, 0):
+            if data:
+                yield data
+    else:
+        while True:
+            data = f.read(_CHUNK_SIZE)
+            if not data:
+                return
+            yield data
+
+
+class _WindowScanner:
+    """Finds the windows of a stats file as its data is fed, in order.
+
+    Each window is recorded as the offsets of the start of its data (just
+    after the begin marker) and of its end marker, and its ``finalTick``. A
+    window without an end marker, e.g., that of a run which is still
+    dumping its statistics, is not recorded.
+    """
+
+    def __init__(self):
+        self.windows: List[List[Optional[int]]] = []
+        # The number of bytes fed so far.
+        self.offset = 0
+        self._buffer = b""
+        # The offset of the first byte of the buffer.
+        self._base = 0
+        # The start of the current window, if within a window.
+        self._begin = None
+        self._final_tick = None
+
+    def feed(self, data: bytes) -> None:
+        buffer = self._buffer + data
+        self.offset += len(data)
+        pos = 0
+        while True:
+            if self._begin is None:
+                index = buffer.find(_BEGIN_MARKER, pos)
+                if index < 0:
+                    keep = max(pos, len(buffer) - _SCAN_OVERLAP)
+                    break
+                pos = index + len(_BEGIN_MARKER)
+                self._begin = self._base + pos
+                self._final_tick = None
+            else:
+                index = buffer.find(_END_MARKER, pos)
+                if self._final_tick is None:
+                    match = _FINAL_TICK_REGEX.search(
+                        buffer, pos, len(buffer) if index < 0 else index
+                    )
+                    if match:
+                        self._final_tick = int(match.group(1))
+                if index < 0:
+                    keep = max(pos, len(buffer) - _SCAN_OVERLAP)
+                    break
+                self.windows.append(
+                    [self._begin, self._base + index, self._final_tick]
+                )
+                pos = index + len(_END_MARKER)
+                self._begin = None
+        self._buffer = buffer[keep:]
+        self._base += keep
+
+
+class _StatSelector:
+    """Selects statistics by name or glob pattern. See the module
+    documentation.
+    """
+
+    def __init__(self, stats: Optional[Iterable[str]]):
+        self._all = stats is None
+        self._names = set()
+        patterns = []
+        for stat in stats or []:
+            if any(c in stat for c in "*?["):
+                patterns.append(translate(stat))
+            else:
+                self._names.add(stat.encode())
+        self._pattern = (
+            re.compile("|".join(patterns).encode()) if patterns else None
+        )
+
+    def __call__(self, name: bytes) -> bool:
+        if self._all or name in self._names:
+            return True
+        base = name.split(b"::", 1)[0]
+        if base in self._names:
+            return True
+        return self._pattern is not None and (
+            self._pattern.match(name) is not None
+            or self._pattern.match(base) is not None
+        )
+
+
+def _parse_window(
+    data: bytes, selector: _StatSelector, comments: bool
+) -> Tuple[Dict[str, float], Optional[Dict[str, str]]]:
+    """Parses the selected statistics of a window. Non-numeric values are
+    skipped.
+
+    :returns: The value of each statistic and, if ``comments`` is set, its
+              comment (the text following the ``#``).
+    """
+    values = {}
+    texts = {} if comments else None
+    for line in data.split(b"\n"):
+        space = line.find(b" ")
+        if space <= 0 or not selector(line[:space]):
+            continue
+        fields = line.split(None, 2)
+        name = fields[0].decode()
+        try:
+            values[name] = float(fields[1])
+        except ValueError:
+            continue
+        if comments:
+            comment = fields[2].partition(b"#")[2] if len(fields) > 2 else b""
+            texts[name] = comment.strip().decode(errors="replace")
+    return values, texts
+
+
+def _read_windows(
+    path: str,
+    access_point: Optional[Tuple[int, int]],
+    windows: List[Tuple[int, int]],
+    stats: Optional[List[str]],
+    comments: bool,
+) -> List[Tuple[Dict[str, float], Optional[Dict[str, str]]]]:
+    """Parses the given windows, in increasing order, of a stats file. A
+    gzip file is decompressed from the given access point (the compressed
+    and uncompressed offsets of a member).
+
+    This is run in the worker processes when reading in parallel.
+    """
+    selector = _StatSelector(stats)
+    results = []
+    with open(path, "rb") as f:
+        if access_point is None:
+            for begin, end in windows:
+                f.seek(begin)
+                data = f.read(end - begin)
+                results.append(_parse_window(data, selector, comments))
+            return results
+
+        compressed_offset, buffer_start = access_point
+        chunks = (
+            data for _, data in _gzip_chunks(f, compressed_offset) if data
+        )
+        buffer = bytearray()
+        for begin, end in windows:
+            while buffer_start + len(buffer) < end:
+                data = next(chunks, None)
+                if data is None:
+                    raise EOFError(f"'{path}' ended within a stats dump.")
+                if buffer_start + len(buffer) <= begin:
+                    # None of the buffer is part of this window.
+                    buffer_start += len(buffer)
+                    buffer = bytearray(data)
+                else:
+                    buffer += data
+            data = bytes(buffer[begin - buffer_start : end - buffer_start])
+            results.append(_parse_window(data, selector, comments))
+            del buffer[: end - buffer_start]
+            buffer_start = end
+    return results
+
+
+def _to_simstat(
+    values: Dict[str, float],
+    comments: Dict[str, str],
+    final_tick: Optional[int],
+) -> SimStat:
+    """Builds the pystats hierarchy of a stats dump from its flat, dotted
+    statistic names. Elements of vectors and distributions
+    (``<name>::<element>``) are gathered into a `Vector`.
+    """
+    simstat = SimStat(simulated_end_time=final_tick)
+    for full_name, value in values.items():
+        name, _, element = full_name.partition("::")
+        *path, leaf = name.split(".")
+        group = simstat
+        for component in path:
+            child = group.__dict__.get(component)
+            if not isinstance(child, Group):
+                child = Group(type="Group")
+                setattr(group, component, child)
+            group = child
+
+        description, unit = comments.get(full_name, ""), None
+        match = _COMMENT_REGEX.match(description)
+        if match:
+            description, unit = match.groups()
+        scalar = Scalar(value=value, unit=unit, description=description)
+
+        if not element:
+            setattr(group, leaf, scalar)
+            continue
+        vector = group.__dict__.get(leaf)
+        if not isinstance(vector, Vector):
+            vector = Vector({}, type="Vector", description=description)
+            setattr(group, leaf, vector)
+        vector.value[int(element) if element.isdigit() else element] = scalar
+    return simstat
+
+
+class StatsTextFile:
+    """A text stats file, indexed by stats dump. See the module
+    documentation.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        index_path: Optional[Union[str, Path]] = None,
+        cache_index: bool = True,
+    ):
+        """
+        :param path: The path to the stats file, which may be gzip
+                     compressed.
+        :param index_path: The path of the cached index. By default
+                           ``<path>.index.json``.
+        :param cache_index: If ``False`` the index is neither loaded from nor
+                            saved to ``index_path``.
+        """
+        self._path = Path(path)
+        self._index_path = (
+            Path(index_path)
+            if index_path
+            else self._path.with_name(self._path.name + ".index.json")
+        )
+        self._cache_index = cache_index
+        self._index = self._load_index()
+
+    def _build_index(self) -> Dict:
+        with open(self._path, "rb") as f:
+            compressed = f.read(2) == _GZIP_MAGIC
+            scanner = _WindowScanner()
+            access_points = []
+            if compressed:
+                for offset, data in _gzip_chunks(f, 0):
+                    if offset is None:
+                        scanner.feed(data)
+                    elif (
+                        not access_points
+                        or scanner.offset - access_points[-1][1]
+                        >= _ACCESS_POINT_SPACING
+                    ):
+                        access_points.append([offset, scanner.offset])
+                if len(access_points) > 1 and (
+                    access_points[-1][1] == scanner.offset
+                ):
+                    # The end of the last member is not an access point.
+                    access_points.pop()
+            else:
+                f.seek(0)
+                for data in _data_chunks(f, compressed=False):
+                    scanner.feed(data)
+        return {
+            "compressed": compressed,
+            "windows": scanner.windows,
+            "access_points": access_points,
+        }
+
+    def _load_index(self) -> Dict:
+        """Loads the cached index if it is of the current file, otherwise
+        builds (and caches) the index.
+        """
+        stat = os.stat(self._path)
+        key = {
+            "version": _INDEX_VERSION,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+        }
+        if self._cache_index:
+            try:
+                with open(self._index_path) as f:
+                    index = json.load(f)
+                if all(index.get(k) == v for k, v in key.items()):
+                    return index
+            except (OSError, ValueError):
+                pass
+
+        index = dict(key, **self._build_index())
+        if self._cache_index:
+            # Write to a temporary file first so that a concurrent reader
+            # never loads a partial index. The index is only a cache: if it
+            # cannot be written, e.g., the directory is read-only, it is
+            # rebuilt next time.
+            tmp = self._index_path.with_name(
+                f"{self._index_path.name}.{os.getpid()}.tmp"
+            )
+            try:
+                with open(tmp, "w") as f:
+                    json.dump(index, f)
+                os.replace(tmp, self._index_path)
+            except OSError:
+                pass
+        return index
+
+    def get_path(self) -> Path:
+        """Returns the path to the stats file."""
+        return self._path
+
+    def get_num_dumps(self) -> int:
+        """Returns the number of (complete) stats dumps in the file."""
+        return len(self._index["windows"])
+
+    def __len__(self) -> int:
+        return self.get_num_dumps()
+
+    def get_final_ticks(self) -> List[Optional[int]]:
+        """Returns the ``finalTick`` of each stats dump, or ``None`` for a
+        dump without a ``finalTick`` statistic.
+        """
+        return [window[2] for window in self._index["windows"]]
+
+    def get_dump_at_tick(self, tick: int) -> int:
+        """Returns the index of the first stats dump at or after the given
+        tick.
+
+        :raises IndexError: If there is no such dump.
+        """
+        ticks = [-1 if t is None else t for t in self.get_final_ticks()]
+        index = bisect_left(ticks, tick)
+        if index == len(ticks):
+            raise IndexError(f"'{self._path}' has no dump at tick {tick}.")
+        return index
+
+    def _read(
+        self,
+        dumps: Optional[Sequence[int]],
+        stats: Optional[Iterable[str]],
+        jobs: int,
+        comments: bool,
+    ) -> List[Tuple[Dict[str, float], Optional[Dict[str, str]]]]:
+        windows = self._index["windows"]
+        if dumps is None:
+            dumps = range(len(windows))
+        indices = []
+        for dump in dumps:
+            if not -len(windows) <= dump < len(windows):
+                raise IndexError(
+                    f"'{self._path}' does not have a dump {dump}."
+                )
+            indices.append(dump % len(windows))
+        stats = list(stats) if stats is not None else None
+
+        # Each window is read once, in file order, however it is requested.
+        unique = sorted(set(indices))
+
+        # The windows are read in tasks. Each window of an uncompressed file
+        # is its own task. The windows of a gzip file are grouped by their
+        # nearest preceding access point, from which they are decompressed.
+        tasks: Dict[Optional[Tuple[int, int]], List[int]] = {}
+        if self._index["compressed"]:
+            access_points = self._index["access_points"]
+            starts = [uncompressed for _, uncompressed in access_points]
+            for i in unique:
+                point = access_points[bisect_right(starts, windows[i][0]) - 1]
+                tasks.setdefault(tuple(point), []).append(i)
+            task_list = list(tasks.items())
+        elif jobs > 1:
+            task_list = [(None, [i]) for i in unique]
+        else:
+            task_list = [(None, unique)]
+
+        args = [
+            (
+                str(self._path),
+                point,
+                [tuple(windows[i][:2]) for i in task],
+                stats,
+                comments,
+            )
+            for point, task in task_list
+        ]
+        if jobs > 1 and len(args) > 1:
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                results = list(executor.map(_read_windows, *zip(*args)))
+        else:
+            results = [_read_windows(*arg) for arg in args]
+
+        parsed = {}
+        for (_, task), result in zip(task_list, results):
+            parsed.update(zip(task, result))
+        return [parsed[i] for i in indices]
+
+    def read_values(
+        self,
+        dumps: Optional[Sequence[int]] = None,
+        stats: Optional[Iterable[str]] = None,
+        jobs: int = 1,
+    ) -> List[Dict[str, float]]:
+        """Returns the values of the selected statistics of each of the given
+        stats dumps. Statistics with non-numeric values are omitted.
+
+        :param dumps: The indices of the stats dumps. Negative indices count
+                      back from the last dump. By default all dumps are read.
+        :param stats: The names or glob patterns of the statistics to read.
+                      By default all statistics are read.
+        :param jobs: The number of processes in which to parse the dumps.
+        """
+        return [
+            values
+            for values, _ in self._read(dumps, stats, jobs, comments=False)
+        ]
+
+    def read_simstats(
+        self,
+        dumps: Optional[Sequence[int]] = None,
+        stats: Optional[Iterable[str]] = None,
+        jobs: int = 1,
+    ) -> List[SimStat]:
+        """Returns the selected statistics of each of the given stats dumps as
+        a pystats `SimStat`, whose ``simulated_end_time`` is the dump's
+        ``finalTick``. See `read_values` for the parameters.
+        """
+        indices = range(self.get_num_dumps()) if dumps is None else dumps
+        final_ticks = self.get_final_ticks()
+        return [
+            _to_simstat(values, comments, final_ticks[index])
+            for index, (values, comments) in zip(
+                indices, self._read(indices, stats, jobs, comments=True)
+            )
+        ]
+
+    def to_numpy(
+        self,
+        dumps: Optional[Sequence[int]] = None,
+        stats: Optional[Iterable[str]] = None,
+        jobs: int = 1,
+    ) -> Tuple[List[str], "np.ndarray"]:
+        """Returns the selected statistics of each of the given stats dumps as
+        a NumPy array with one row per dump and one column per statistic.
+        Statistics absent from a dump are NaN. See `read_values` for the
+        parameters. Requires NumPy.
+
+        :returns: The names of the columns, in the order first found, and the
+                  array.
+        """
+        import numpy as np
+
+        dump_values = self.read_values(dumps, stats, jobs)
+        names = list(dict.fromkeys(n for v in dump_values for n in v))
+        columns = {name: column for column, name in enumerate(names)}
+        array = np.full((len(dump_values), len(names)), np.nan)
+        for row, values in enumerate(dump_values):
+            for name, value in values.items():
+                array[row, columns[name]] = value
+        return names, array
+
+
+def write_seekable_gzip(
+    path: Union[str, Path],
+    output: Union[str, Path],
+    compresslevel: int = 6,
+) -> None:
+    """Writes a stats file, which may itself be gzip compressed, as a gzip
+    file with a member per stats dump. Any dump of the output can be read
+    without decompressing the dumps before it. The output is a valid gzip
+    file, e.g., it can be decompressed with ``zcat``.
+
+    :param path: The path to the stats file.
+    :param output: The path of the gzip file to write.
+    :param compresslevel: The gzip compression level.
+    """
+    stats = StatsTextFile(path, cache_index=False)
+    # Each member starts at the begin marker of a window.
+    splits = iter(
+        begin - len(_BEGIN_MARKER) for begin, _, _ in stats._index["windows"]
+    )
+    next_split = next(splits, None)
+    position = 0
+
+    def new_member():
+        return gzip.GzipFile(
+            fileobj=out, mode="wb", compresslevel=compresslevel, mtime=0
+        )
+
+    with open(path, "rb") as f, open(output, "wb") as out:
+        member = new_member()
+        for data in _data_chunks(f, stats._index["compressed"]):
+            while next_split is not None and next_split < position + len(data):
+                cut = next_split - position
+                member.write(data[:cut])
+                member.close()
+                member = new_member()
+                data = data[cut:]
+                position = next_split
+                next_split = next(splits, None)
+            member.write(data)
+            position += len(data)
+        member.close()
@@ -230,6 +230,55 @@ def setMaxTick(tick: int) -> None:
     _m5.event.setMaxTick(tick=tick)
 
 
+def setNativeExitHandler(
+    exit_string: str,
+    dump_stats: bool = False,
+    reset_stats: bool = False,
+    return_every: int = 0,
+) -> None:
+    """Handle the exit events with the given exit string within ``simulate``,
+    without returning from it. On each such exit event the stats are
+    optionally dumped and/or reset, the exit event is counted (see
+    `getNativeExitCount`) and the simulation continues.
+
+    The exit events which end the simulation cannot be handled this way:
+    "simulate() limit reached", "user interrupt received", "exiting with last
+    active thread context", "m5_exit instruction encountered" and "m5_fail
+    instruction encountered".
+
+    :param exit_string: The exit string of the exit events to handle.
+    :param dump_stats: Dump the stats on each exit event.
+    :param reset_stats: Reset the stats on each exit event, after dumping them
+                        if ``dump_stats`` is also set.
+    :param return_every: If non-zero, ``simulate`` returns on every
+                         ``return_every``-th exit event, so it can also be
+                         handled in Python. By default ``simulate`` never
+                         returns on these exit events.
+    """
+    if return_every < 0:
+        raise ValueError("return_every cannot be negative.")
+    _m5.event.setNativeExitHandler(
+        cause=exit_string,
+        dump_stats=dump_stats,
+        reset_stats=reset_stats,
+        return_every=return_every,
+    )
+
+
+def clearNativeExitHandler(exit_string: str) -> None:
+    """Stop handling the exit events with the given exit string within
+    ``simulate``. See `setNativeExitHandler`.
+    """
+    _m5.event.clearNativeExitHandler(cause=exit_string)
+
+
+def getNativeExitCount(exit_string: str) -> int:
+    """Returns the number of exit events with the given exit string which
+    have been handled within ``simulate``. See `setNativeExitHandler`.
+    """
+    return _m5.event.getNativeExitCount(cause=exit_string)
+
+
 def getMaxTick() -> int:
     """Returns the current maximum tick."""
     return _m5.event.getMaxTick()
@@ -321,7 +370,7 @@ def memInvalidate(root):
         obj.memInvalidate()
 
 
-def checkpoint(dir):
+def _prepareCheckpoint(dir):
     root = objects.Root.getInstance()
     if not isinstance(root, objects.Root):
         raise TypeError("Checkpoint must be called on a root object.")
@@ -332,10 +381,121 @@ def checkpoint(dir):
     # Recursively create the checkpoint directory if it does not exist.
     os.makedirs(dir, exist_ok=True)
 
-    print("Writing checkpoint")
+
+def _serialize(dir, compression_level, sparse_memory):
+    _m5.core.setCheckpointCompressionLevel(compression_level)
+    _m5.core.setCheckpointSparseMemory(sparse_memory)
     _m5.core.serializeAll(dir)
 
 
+def checkpoint(dir, compression_level=-1, sparse_memory=False):
+    """Write a checkpoint to a directory.
+
+    Keyword Arguments:
+      compression_level -- The zlib compression level (0-9) of the memory
+                           images. 0 writes them uncompressed and -1 (the
+                           default) uses zlib's default level.
+      sparse_memory -- Write the memory images as sparse images, which omit
+                       the pages which are all zero. These are not
+                       compressed. See util/checkpoint_pmem.py.
+    """
+    _prepareCheckpoint(dir)
+
+    print("Writing checkpoint")
+    _serialize(dir, compression_level, sparse_memory)
+
+
+# The checkpoint writer processes which have not yet been waited for, mapped
+# to the directory of the checkpoint each is writing.
+_checkpoint_writers = {}
+
+
+def asyncCheckpoint(
+    dir, max_writers=1, compression_level=-1, sparse_memory=False
+):
+    """Write a checkpoint to a directory in a forked process.
+
+    The simulator is drained and forked. The child process writes the
+    checkpoint and exits, while the parent returns immediately and may
+    continue simulating. Each writer holds a copy-on-write snapshot of the
+    simulator's memory, so at most max_writers writers are run at once: if
+    that many are running, this waits for one to finish first.
+
+    All writers are waited for when gem5 exits. Use waitForCheckpoints to
+    wait for them sooner (e.g., before restoring a checkpoint).
+
+    Keyword Arguments:
+      max_writers -- The maximum number of checkpoint writers to run at once.
+      compression_level -- See checkpoint.
+      sparse_memory -- See checkpoint.
+
+    Return Value:
+      pid of the checkpoint writer process.
+    """
+    if max_writers < 1:
+        raise ValueError("At least one checkpoint writer is required.")
+
+    _prepareCheckpoint(dir)
+
+    while len(_checkpoint_writers) >= max_writers:
+        _waitForCheckpointWriter()
+
+    if not _checkpoint_writers:
+        # atexit ignores duplicate registrations of the same function.
+        atexit.unregister(waitForCheckpoints)
+        atexit.register(waitForCheckpoints)
+
+    # Terminate helper threads that service parallel event queues.
+    _m5.event.terminateEventQueueThreads()
+
+    print("Writing checkpoint asynchronously")
+    sys.stdout.flush()
+    sys.stderr.flush()
+
+    pid = os.fork()
+    if pid == 0:
+        # The child must not run the parent's exit handlers (e.g., the
+        # final stats dump), so it exits with os._exit.
+        code = 0
+        try:
+            _serialize(dir, compression_level, sparse_memory)
+        except BaseException:
+            import traceback
+
+            traceback.print_exc()
+            code = 1
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os._exit(code)
+
+    _checkpoint_writers[pid] = dir
+    return pid
+
+
+def _waitForCheckpointWriter():
+    # Only the writers are waited for, as any other children of this process
+    # (e.g., from fork) are waited for elsewhere. A writer which has already
+    # finished is preferred, otherwise the oldest writer is waited for.
+    for pid in _checkpoint_writers:
+        finished, status = os.waitpid(pid, os.WNOHANG)
+        if finished:
+            break
+    else:
+        pid = next(iter(_checkpoint_writers))
+        _, status = os.waitpid(pid, 0)
+
+    dir = _checkpoint_writers.pop(pid)
+    if os.waitstatus_to_exitcode(status) != 0:
+        warn(f"Writing the checkpoint '{dir}' failed.")
+
+
+def waitForCheckpoints():
+    """Wait for all the asynchronous checkpoint writers to finish."""
+    while _checkpoint_writers:
+        _waitForCheckpointWriter()
+
+
 def _changeMemoryMode(system, mode):
     if not isinstance(system, (objects.Root, objects.System)):
         raise TypeError(
@@ -476,6 +636,9 @@ def fork(simout="%(parent)s.f%(fork_seq)i"):
         raise e
 
     if pid == 0:
+        # The parent's checkpoint writers are not children of the child.
+        _checkpoint_writers.clear()
+
         # In child, notify objects of the fork
         root = objects.Root.getInstance()
         notifyFork(root)
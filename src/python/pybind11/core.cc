@@ -336,6 +336,9 @@ pybind_init_core(py::module_ &m_native)
      */
     m_core
         .def("serializeAll", &SimObject::serializeAll)
+        .def("setCheckpointCompressionLevel",
+             &CheckpointIn::setCompressionLevel)
+        .def("setCheckpointSparseMemory", &CheckpointIn::setSparseMemory)
         .def("getCheckpoint", [](const std::string &cpt_dir) {
             SimObject::setSimObjectResolver(&pybindSimObjectResolver);
             return new CheckpointIn(cpt_dir);
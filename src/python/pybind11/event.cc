@@ -111,6 +111,12 @@ pybind_init_event(py::module_ &m_native)
     m.def("getMaxTick", &get_max_tick, py::return_value_policy::copy);
     m.def("terminateEventQueueThreads", &terminateEventQueueThreads);
     m.def("exitSimLoop", &exitSimLoop);
+    m.def("setNativeExitHandler", &setNativeExitHandler,
+          py::arg("cause"), py::arg("dump_stats"), py::arg("reset_stats"),
+          py::arg("return_every"));
+    m.def("clearNativeExitHandler", &clearNativeExitHandler,
+          py::arg("cause"));
+    m.def("getNativeExitCount", &getNativeExitCount, py::arg("cause"));
     m.def("getEventQueue", []() { return curEventQueue(); },
           py::return_value_policy::reference);
     m.def("setEventQueue", [](EventQueue *q) { return curEventQueue(q); });
@@ -49,6 +49,7 @@
 #include <cassert>
 #include <cerrno>
 
+#include "base/logging.hh"
 #include "base/trace.hh"
 #include "debug/Checkpoint.hh"
 
@@ -159,6 +160,41 @@ CheckpointIn::dir()
     return currentDirectory;
 }
 
+int CheckpointIn::compressionLevel = -1;
+
+void
+CheckpointIn::setCompressionLevel(int level)
+{
+    fatal_if(level < -1 || level > 9,
+             "Invalid checkpoint compression level %d.", level);
+    compressionLevel = level;
+}
+
+std::string
+CheckpointIn::compressedWriteMode()
+{
+    if (compressionLevel < 0)
+        return "wb";
+    // "T" writes without any compression or gzip framing.
+    if (compressionLevel == 0)
+        return "wbT";
+    return csprintf("wb%d", compressionLevel);
+}
+
+bool CheckpointIn::_sparseMemory = false;
+
+void
+CheckpointIn::setSparseMemory(bool sparse)
+{
+    _sparseMemory = sparse;
+}
+
+bool
+CheckpointIn::sparseMemory()
+{
+    return _sparseMemory;
+}
+
 CheckpointIn::CheckpointIn(const std::string &cpt_dir)
     : db(), _cptDir(setDir(cpt_dir))
 {
@@ -104,6 +104,12 @@ class CheckpointIn
     // current directory we're serializing into.
     static std::string currentDirectory;
 
+    // zlib compression level of checkpoint data files.
+    static int compressionLevel;
+
+    // Whether memory images are written as sparse images.
+    static bool _sparseMemory;
+
 
   public:
     /**
@@ -128,6 +134,40 @@ class CheckpointIn
      */
     static std::string dir();
 
+    /**
+     * Set the zlib compression level (0-9) of the data files written with
+     * a checkpoint (e.g., memory images). -1 selects zlib's default and 0
+     * writes the files uncompressed. Compressed and uncompressed files are
+     * both read back transparently.
+     *
+     * @ingroup api_serialize
+     */
+    static void setCompressionLevel(int level);
+
+    /**
+     * Get the zlib file mode (see gzopen) with which checkpoint data files
+     * are written, according to the compression level.
+     *
+     * @ingroup api_serialize
+     */
+    static std::string compressedWriteMode();
+
+    /**
+     * Set whether memory images are written as sparse images, which omit
+     * the pages which are all zero, rather than as dense images. Both are
+     * read back transparently.
+     *
+     * @ingroup api_serialize
+     */
+    static void setSparseMemory(bool sparse);
+
+    /**
+     * Get whether memory images are written as sparse images.
+     *
+     * @ingroup api_serialize
+     */
+    static bool sparseMemory();
+
     // Filename for base checkpoint file within directory.
     static const char *baseFilename;
 };
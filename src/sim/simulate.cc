@@ -43,10 +43,14 @@
 #include "sim/simulate.hh"
 
 #include <atomic>
+#include <string>
 #include <thread>
+#include <unordered_map>
+#include <unordered_set>
 
 #include "base/logging.hh"
 #include "base/pollevent.hh"
+#include "base/statistics.hh"
 #include "base/types.hh"
 #include "sim/async.hh"
 #include "sim/eventq.hh"
@@ -63,6 +67,19 @@ Event *doSimLoop(EventQueue *);
 
 GlobalSimLoopExitEvent *simulate_limit_event = nullptr;
 
+// The cause of simulate_limit_event.
+static const std::string simulateLimitCause = "simulate() limit reached";
+
+// The causes of the exit events which end the simulation, so can't be
+// handled natively. See setNativeExitHandler.
+static const std::unordered_set<std::string> nonNativeExitCauses = {
+    simulateLimitCause,
+    "user interrupt received",
+    "exiting with last active thread context",
+    "m5_exit instruction encountered",
+    "m5_fail instruction encountered",
+};
+
 class SimulatorThreads
 {
   public:
@@ -179,6 +196,70 @@ struct DescheduleDeleter
     }
 };
 
+/**
+ * The actions performed on the global exit events of a given cause, which
+ * are handled without returning from simulate(). See setNativeExitHandler.
+ */
+struct NativeExitHandler
+{
+    bool dumpStats;
+    bool resetStats;
+    uint64_t returnEvery;
+    uint64_t count = 0;
+};
+
+static std::unordered_map<std::string, NativeExitHandler> nativeExitHandlers;
+
+void
+setNativeExitHandler(const std::string &cause, bool dump_stats,
+                     bool reset_stats, uint64_t return_every)
+{
+    fatal_if(nonNativeExitCauses.count(cause),
+             "The '%s' exit event cannot be handled natively.", cause);
+    auto &handler = nativeExitHandlers[cause];
+    handler.dumpStats = dump_stats;
+    handler.resetStats = reset_stats;
+    handler.returnEvery = return_every;
+}
+
+void
+clearNativeExitHandler(const std::string &cause)
+{
+    nativeExitHandlers.erase(cause);
+}
+
+uint64_t
+getNativeExitCount(const std::string &cause)
+{
+    auto it = nativeExitHandlers.find(cause);
+    return it == nativeExitHandlers.end() ? 0 : it->second.count;
+}
+
+/**
+ * Performs the native actions, if any, for a global exit event.
+ *
+ * @return true if the simulation should continue without returning the
+ * exit event from simulate().
+ */
+static bool
+handleNativeExit(GlobalSimLoopExitEvent *exit_event)
+{
+    if (nativeExitHandlers.empty())
+        return false;
+
+    auto it = nativeExitHandlers.find(exit_event->getCause());
+    if (it == nativeExitHandlers.end())
+        return false;
+
+    auto &handler = it->second;
+    handler.count++;
+    if (handler.dumpStats)
+        statistics::dump();
+    if (handler.resetStats)
+        statistics::reset();
+    return !handler.returnEvery || handler.count % handler.returnEvery != 0;
+}
+
 /** Simulate for num_cycles additional cycles.  If num_cycles is -1
  * (the default), we simulate to MAX_TICKS unless the max ticks has been set
  * via the 'set_max_tick' function prior. This function is exported to Python.
@@ -230,23 +311,28 @@ simulate(Tick num_cycles)
         inParallelMode = true;
     }
 
-    simulatorThreads->runUntilLocalExit();
-    Event *local_event = doSimLoop(mainEventQueue[0]);
-    assert(local_event);
+    // Keep simulating while the exit events are handled natively.
+    GlobalSimLoopExitEvent *exit_event = nullptr;
+    do {
+        simulatorThreads->runUntilLocalExit();
+        Event *local_event = doSimLoop(mainEventQueue[0]);
+        assert(local_event);
+
+        // locate the global exit event
+        BaseGlobalEvent *global_event = local_event->globalEvent();
+        assert(global_event);
+
+        exit_event = dynamic_cast<GlobalSimLoopExitEvent *>(global_event);
+        assert(exit_event);
+    } while (handleNativeExit(exit_event));
 
     // Restore normal ctrl-c operation as soon as the event queue is done
     restoreSigInt();
 
     inParallelMode = false;
 
-    // locate the global exit event and return it to Python
-    BaseGlobalEvent *global_event = local_event->globalEvent();
-    assert(global_event);
-
-    global_exit_event =
-        dynamic_cast<GlobalSimLoopExitEvent *>(global_event);
-    assert(global_exit_event);
-
+    // return the global exit event to Python
+    global_exit_event = exit_event;
     return global_exit_event;
 }
 
@@ -254,8 +340,7 @@ void set_max_tick(Tick tick)
 {
     if (!simulate_limit_event) {
         simulate_limit_event = new GlobalSimLoopExitEvent(
-            mainEventQueue[0]->getCurTick(),
-            "simulate() limit reached", 0);
+            mainEventQueue[0]->getCurTick(), simulateLimitCause, 0);
     }
     simulate_limit_event->reschedule(tick);
 }
@@ -41,6 +41,9 @@
 #ifndef __SIMULATE_HH__
 #define __SIMULATE_HH__
 
+#include <cstdint>
+#include <string>
+
 #include "base/types.hh"
 
 namespace gem5
@@ -78,6 +81,36 @@ Tick get_max_tick();
  */
 void terminateEventQueueThreads();
 
+/**
+ * Handle the global exit events with the given cause without returning
+ * from simulate(). Each time such an exit event occurs, the statistics are
+ * optionally dumped and/or reset, the occurrence is counted and the
+ * simulation continues. The exit events which end the simulation (e.g.,
+ * the simulate() limit, a user interrupt or an m5_exit or m5_fail
+ * instruction) can't be handled natively.
+ *
+ * @param cause The cause of the exit events to handle.
+ * @param dump_stats Dump the statistics on each occurrence.
+ * @param reset_stats Reset the statistics on each occurrence (after dumping
+ *        them, if they are also dumped).
+ * @param return_every If non-zero, simulate() returns on every
+ *        return_every-th occurrence, so the exit event can also be handled
+ *        by the caller.
+ */
+void setNativeExitHandler(const std::string &cause, bool dump_stats,
+                          bool reset_stats, uint64_t return_every);
+
+/**
+ * Stop handling the global exit events with the given cause natively.
+ */
+void clearNativeExitHandler(const std::string &cause);
+
+/**
+ * @return The number of global exit events with the given cause handled
+ * natively (including those also returned from simulate()).
+ */
+uint64_t getNativeExitCount(const std::string &cause);
+
 extern GlobalSimLoopExitEvent *simulate_limit_event;
 
 } // namespace gem5
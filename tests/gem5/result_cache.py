@@ -0,0 +1,280 @@
+# Copyright (c) 2026 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+A cache of gem5 run outputs, keyed by a hash of everything the run depends
+on.
+
+A run's key is computed from the contents of the gem5 binary, the config
+script (and the other configs it may import), the arguments given to gem5
+and the config, the contents of any files named by those arguments, and the
+resources listed in the resource JSON files used to locate gem5 resources.
+Directories named by the arguments are only keyed by their path: these are
+typically the resource directory, whose contents change as resources are
+downloaded, and gem5 checks the md5 of every resource it obtains from there.
+When a run with the same key has succeeded before, its output directory is
+restored from the cache instead of running gem5 again. The verifiers are
+then run on the restored outputs as usual.
+
+Which version of a resource gem5 obtains may depend on the resource
+database, e.g., for ``obtain_resource("x")`` without a version, so it can't
+be known from the key alone. gem5 lists the resources it resolves in the
+file named by ``GEM5_RESOURCE_LOG``. A run which obtained any resources is
+only stored if ``GEM5_RESOURCE_JSON`` names a local file: that file is then
+the only source of resources, and the ID, version and md5 of each of its
+resources are part of the key.
+
+The cache is a plain directory, so it can be shared between machines (e.g.,
+CI workers) via a shared file system. Entries are written to a temporary
+directory and renamed into place, so concurrent writers are safe.
+
+Runs which write outside of their output directory can't be cached, as
+restoring them wouldn't recreate those files. An absolute path argument
+which doesn't exist (e.g., the directory to save a checkpoint to) is assumed
+to be an output and disables caching of the run. Other such runs should pass
+``cacheable=False`` to :func:`gem5_verify_config`.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+
+from testlib.configuration import config
+
+# Bump this to invalidate all existing cache entries if the key or the
+# layout of the entries changes.
+_cache_version = b"3"
+
+# Environment variables which change which resources gem5 obtains.
+_resource_env_vars = (
+    "GEM5_CONFIG",
+    "GEM5_RESOURCE_JSON",
+    "GEM5_RESOURCE_JSON_APPEND",
+)
+
+# Digests of files, keyed by (path, size, mtime), so large inputs such as
+# the gem5 binary or disk images are only hashed once per process.
+_file_digests = {}
+
+
+def _file_digest(path):
+    st = os.stat(path)
+    memo_key = (os.path.abspath(path), st.st_size, st.st_mtime_ns)
+    if memo_key not in _file_digests:
+        h = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+        _file_digests[memo_key] = h.hexdigest()
+    return _file_digests[memo_key]
+
+
+def _path_digest(path, suffix=None):
+    """
+    Returns a digest of the file or directory at ``path``. If ``suffix`` is
+    given only files with that suffix in a directory are included.
+    """
+    if not os.path.isdir(path):
+        return _file_digest(path)
+    h = hashlib.sha256()
+    for root, dirs, files in os.walk(path):
+        dirs.sort()
+        for name in sorted(files):
+            if suffix and not name.endswith(suffix):
+                continue
+            filepath = os.path.join(root, name)
+            if not os.path.isfile(filepath):
+                continue
+            h.update(os.path.relpath(filepath, path).encode())
+            h.update(_file_digest(filepath).encode())
+    return h.hexdigest()
+
+
+def _resource_json_digest(path):
+    """
+    Returns a digest of the resources in a resource JSON file. A resource's
+    files are identified by its ID, version and md5, so only these are
+    included. Entries without an md5 (e.g., workloads) are included in full.
+    """
+    try:
+        with open(path) as f:
+            resources = json.load(f)
+    except ValueError:
+        return _file_digest(path)
+    if isinstance(resources, dict):
+        resources = [resources]
+    entries = []
+    for resource in resources:
+        if isinstance(resource, dict) and "md5sum" in resource:
+            resource = {
+                field: resource.get(field)
+                for field in ("id", "resource_version", "md5sum")
+            }
+        entries.append(json.dumps(resource, sort_keys=True))
+    return hashlib.sha256("\n".join(sorted(entries)).encode()).hexdigest()
+
+
+def _resources_in_key():
+    """
+    Returns True if every resource gem5 may obtain is identified by the key,
+    i.e., the only source of resources is a local resource JSON file.
+    """
+    path = os.environ.get("GEM5_RESOURCE_JSON")
+    return bool(path) and os.path.isfile(path)
+
+
+def read_resource_log(path):
+    """
+    Returns the resources listed in a ``GEM5_RESOURCE_LOG`` file, or None if
+    it can't be read.
+    """
+    try:
+        with open(path) as f:
+            return [json.loads(line) for line in f if line.strip()]
+    except (OSError, ValueError):
+        return None
+
+
+def _normalize_path(path):
+    """
+    Paths within the gem5 directory are made relative to it, so the same run
+    has the same key in different checkouts.
+    """
+    if os.path.isabs(path):
+        base_dir = os.path.abspath(config.base_dir)
+        if os.path.commonpath((path, base_dir)) == base_dir:
+            return os.path.relpath(path, base_dir)
+    return path
+
+
+class ResultCache:
+    def __init__(self, directory):
+        self.directory = directory
+
+    def key(self, gem5, config_path, gem5_args, config_args):
+        """
+        Returns the key of a gem5 run, or None if the run can't be cached.
+        """
+        h = hashlib.sha256(_cache_version)
+
+        def update(*items):
+            for item in items:
+                h.update(str(item).encode())
+                h.update(b"\0")
+
+        try:
+            update("gem5", _file_digest(gem5))
+            update(
+                "config",
+                _normalize_path(config_path),
+                _path_digest(config_path),
+            )
+
+            # Configs in the configs directory may import any of the other
+            # configs (e.g., configs/common).
+            configs_dir = os.path.join(config.base_dir, "configs")
+            if os.path.commonpath(
+                (os.path.abspath(config_path), configs_dir)
+            ) == os.path.abspath(configs_dir):
+                update("configs", _path_digest(configs_dir, ".py"))
+
+            for kind, args in (("gem5", gem5_args), ("args", config_args)):
+                update(kind, len(args))
+                for arg in map(str, args):
+                    update(_normalize_path(arg))
+                    if os.path.isfile(arg):
+                        update(_file_digest(arg))
+                    elif not os.path.exists(arg) and os.path.isabs(arg):
+                        return None
+        except OSError:
+            return None
+
+        for var in _resource_env_vars:
+            value = os.environ.get(var)
+            update(var, value)
+            if value and os.path.isfile(value):
+                try:
+                    if var == "GEM5_CONFIG":
+                        update(_file_digest(value))
+                    else:
+                        update(_resource_json_digest(value))
+                except OSError:
+                    return None
+
+        return h.hexdigest()
+
+    def entry_path(self, key):
+        return os.path.join(self.directory, key[:2], key)
+
+    def restore(self, key, outdir):
+        """
+        Copy the outputs of the run with the given key into ``outdir``.
+
+        :returns: True if the run was in the cache.
+        """
+        entry = self.entry_path(key)
+        if not os.path.isdir(entry):
+            return False
+        shutil.copytree(entry, outdir, dirs_exist_ok=True)
+        return True
+
+    def store(self, key, outdir, resource_log=None):
+        """
+        Store the outputs of a successful run in ``outdir``.
+
+        :param resource_log: The ``GEM5_RESOURCE_LOG`` file of the run. If
+            the run obtained resources which aren't identified by the key, or
+            the file can't be read, the run isn't stored.
+
+        :returns: True if the run is in the cache.
+        """
+        if resource_log is not None:
+            resources = read_resource_log(resource_log)
+            if resources is None or (resources and not _resources_in_key()):
+                return False
+        entry = self.entry_path(key)
+        if os.path.isdir(entry):
+            return True
+        tmp = f"{entry}.{os.getpid()}.tmp"
+        shutil.rmtree(tmp, ignore_errors=True)
+        shutil.copytree(outdir, tmp)
+        try:
+            os.rename(tmp, entry)
+        except OSError:
+            # Another run stored the same entry first.
+            shutil.rmtree(tmp, ignore_errors=True)
+        return True
+
+
+def get_result_cache():
+    """
+    Returns the result cache, or None if caching has been disabled with
+    ``--no-cache``.
+    """
+    if config.no_cache:
+        return None
+    return ResultCache(config.result_cache_path)
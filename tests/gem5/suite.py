@@ -40,6 +40,7 @@ import copy
 import os
 import subprocess
 import sys
+import tempfile
 
 from testlib.configuration import (
     config,
@@ -55,6 +56,7 @@ from .fixture import (
     TempdirFixture,
     VariableFixture,
 )
+from .result_cache import get_result_cache
 
 
 def gem5_verify_config(
@@ -70,6 +72,7 @@ def gem5_verify_config(
     valid_hosts=constants.supported_hosts,
     protocol=None,
     uses_kvm=False,
+    cacheable=True,
 ):
     """
     Helper class to generate common gem5 tests using verifiers.
@@ -98,6 +101,10 @@ def gem5_verify_config(
 
     :param uses_kvm: States if this verifier uses KVM. If so, the "kvm" tag
         will be included.
+
+    :param cacheable: If False the gem5 run is never restored from the
+        result cache. This should be set if the run writes files outside of
+        its output directory which are used by other tests.
     """
     fixtures = list(fixtures)
     testsuites = []
@@ -121,7 +128,9 @@ def gem5_verify_config(
                 # first.
                 tests = []
                 gem5_execution = TestFunction(
-                    _create_test_run_gem5(config, config_args, gem5_args),
+                    _create_test_run_gem5(
+                        config, config_args, gem5_args, cacheable
+                    ),
                     name=_name,
                 )
                 tests.append(gem5_execution)
@@ -154,7 +163,7 @@ def gem5_verify_config(
     return testsuites
 
 
-def _create_test_run_gem5(config, config_args, gem5_args):
+def _create_test_run_gem5(config, config_args, gem5_args, cacheable=True):
     def test_run_gem5(params):
         """
         Simple \'test\' which runs gem5 and saves the result into a tempdir.
@@ -192,12 +201,43 @@ def _create_test_run_gem5(config, config_args, gem5_args):
         command.append(config)
         # Config_args should set up the program args.
         command.extend(config_args)
-        log_call(
-            params.log,
-            command,
-            time=params.time,
-            stdout=sys.stdout,
-            stderr=sys.stderr,
-        )
+
+        # If this run has succeeded before with identical inputs, restore its
+        # outputs rather than running gem5 again.
+        cache = get_result_cache() if cacheable else None
+        key = None
+        if cache is not None:
+            key = cache.key(gem5, config, _gem5_args, config_args)
+        if key is not None and cache.restore(key, tempdir):
+            params.log.message(f"Restored cached results for {key}")
+            return
+
+        # gem5 lists the resources it obtains in the resource log, as runs
+        # which depend on the resource database can't be cached.
+        env = None
+        resource_log = None
+        if key is not None:
+            fd, resource_log = tempfile.mkstemp(suffix=".jsonl")
+            os.close(fd)
+            env = dict(os.environ, GEM5_RESOURCE_LOG=resource_log)
+
+        try:
+            log_call(
+                params.log,
+                command,
+                time=params.time,
+                stdout=sys.stdout,
+                stderr=sys.stderr,
+                env=env,
+            )
+
+            if key is not None and not cache.store(key, tempdir, resource_log):
+                params.log.message(
+                    "Not caching the results, as the run obtained resources "
+                    "from a resource database"
+                )
+        finally:
+            if resource_log is not None:
+                os.remove(resource_log)
 
     return test_run_gem5
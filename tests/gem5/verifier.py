@@ -40,7 +40,10 @@
 """
 Built in test cases that verify particular details about a gem5 run.
 """
+import fnmatch
+import itertools
 import json
+import math
 import os
 import re
 
@@ -275,10 +278,166 @@ class NoMatchRegex(MatchRegex):
                 test_util.fail("Could not match regex.")
 
 
+class MatchStatsTolerance(Verifier):
+    """
+    Compares the stats of a gem5 run to a reference, allowing each stat to
+    differ by a tolerance.
+
+    Both files are read incrementally and compared as they are read, so
+    stats files of any size can be compared. Only the stats which aren't
+    yet matched in the other file are kept in memory, which is usually very
+    few as both files list the stats in the same order.
+
+    Text (stats.txt) and JSON stats files are supported. A stat is named by
+    its full name in a text file (e.g., ``system.cpu.numCycles`` or
+    ``system.cpu.op_class::IntAlu`` for a vector element), and by the keys
+    and list indices leading to it joined by ``.`` in a JSON file (e.g.,
+    ``system.cpu.numCycles.value``). Only numeric stats are compared. Stats
+    missing from the test output are mismatches, while stats only in the test
+    output are ignored.
+    """
+
+    def __init__(
+        self,
+        reference,
+        test_filename=constants.gem5_simulation_stats,
+        stats=None,
+        rel_tol=0.0,
+        abs_tol=0.0,
+        tolerances=None,
+        max_mismatches=10,
+        test_name_in_outdir=True,
+    ):
+        """
+        :param reference: The path of the reference stats file.
+
+        :param test_filename: The stats file to check. If
+            ``test_name_in_outdir`` is True this is relative to the output
+            directory of the gem5 run.
+
+        :param stats: An iterable of shell-style patterns (see
+            :mod:`fnmatch`) selecting the stats to compare. For example,
+            ``system.cpu.op_class::*`` selects every element of a vector. If
+            None all stats are compared.
+
+        :param rel_tol: The default relative tolerance.
+
+        :param abs_tol: The default absolute tolerance.
+
+        :param tolerances: A dict mapping stat patterns to a
+            ``(rel_tol, abs_tol)`` tuple overriding the default tolerance
+            for the matching stats. The first matching pattern is used.
+
+        :param max_mismatches: The comparison stops once this many
+            mismatches have been found.
+        """
+        super().__init__()
+        self.reference = reference
+        self.test_filename = test_filename
+        self.stats = None if stats is None else tuple(stats)
+        self.default_tolerance = (rel_tol, abs_tol)
+        self.tolerances = dict(tolerances or {})
+        self.max_mismatches = max_mismatches
+        self.test_name_in_outdir = test_name_in_outdir
+
+    def _selected(self, name):
+        return self.stats is None or any(
+            fnmatch.fnmatchcase(name, pattern) for pattern in self.stats
+        )
+
+    def _tolerance(self, name):
+        for pattern, tolerance in self.tolerances.items():
+            if fnmatch.fnmatchcase(name, pattern):
+                return tolerance
+        return self.default_tolerance
+
+    def _read(self, filename):
+        with open(filename) as f:
+            if filename.endswith(".json"):
+                stats = ((0, name, value) for name, value in _json_stats(f))
+            else:
+                stats = _text_stats(f)
+            for dump, name, value in stats:
+                if self._selected(name):
+                    yield (dump, name), value
+
+    def compare(self, reference, test):
+        """
+        Compares two stats files.
+
+        :returns: A list of strings describing the mismatches.
+        """
+        mismatches = []
+        tolerances = {}
+        pending_reference = {}
+        pending_test = {}
+
+        def check(key, expected, actual):
+            name = key[1]
+            if name not in tolerances:
+                tolerances[name] = self._tolerance(name)
+            rel_tol, abs_tol = tolerances[name]
+            if math.isnan(expected) and math.isnan(actual):
+                return
+            if not math.isclose(
+                expected, actual, rel_tol=rel_tol, abs_tol=abs_tol
+            ):
+                mismatches.append(
+                    f"{_stat_name(key)}: expected {expected}, got {actual}"
+                )
+
+        for ref_item, test_item in itertools.zip_longest(
+            self._read(reference), self._read(test)
+        ):
+            if ref_item is not None:
+                key, value = ref_item
+                if key in pending_test:
+                    check(key, value, pending_test.pop(key))
+                else:
+                    pending_reference[key] = value
+            if test_item is not None:
+                key, value = test_item
+                if key in pending_reference:
+                    check(key, pending_reference.pop(key), value)
+                else:
+                    pending_test[key] = value
+            if len(mismatches) >= self.max_mismatches:
+                return mismatches
+
+        for key, value in pending_reference.items():
+            if len(mismatches) >= self.max_mismatches:
+                break
+            mismatches.append(
+                f"{_stat_name(key)}: expected {value}, but it is missing"
+            )
+        return mismatches
+
+    def test(self, params):
+        test_filename = self.test_filename
+        if self.test_name_in_outdir:
+            tempdir = params.fixtures[constants.tempdir_fixture_name].path
+            test_filename = joinpath(tempdir, test_filename)
+
+        mismatches = self.compare(self.reference, test_filename)
+        if mismatches:
+            limit = ""
+            if len(mismatches) >= self.max_mismatches:
+                limit = f" (stopped after {self.max_mismatches})"
+            test_util.fail(
+                f"Stats in {test_filename} did not match {self.reference}"
+                f"{limit}:\n" + "\n".join(mismatches)
+            )
+
+
 class MatchJSONStats(Verifier):
     """
     Verifer to check the correctness of stats reported by gem5. It uses
     gem5stats to store the stastistics as json files and does the comparison.
+    The trusted stats must be a subset of the test stats: every top-level
+    item of the trusted stats, including its units, types and other
+    non-numeric fields, must be exactly equal in the test stats. Use
+    ``MatchStatsTolerance`` to compare only the numeric stats, or to allow
+    them to differ by a tolerance.
     """
 
     def __init__(
@@ -299,37 +458,144 @@ class MatchJSONStats(Verifier):
         self.test_name_in_outdir = test_name_in_outdir
 
     def _compare_stats(self, trusted_file, test_file):
+        """
+        :returns: A list of strings describing the trusted items which
+            differ in, or are missing from, the test stats.
+        """
         trusted_stats = json.load(trusted_file)
         test_stats = json.load(test_file)
-        is_subset = trusted_stats.items() <= test_stats.items()
-        if is_subset:
-            err = (
-                "Following differences found between "
-                + f"{self.truth_name} and {self.test_name}.\n"
-            )
-            diffs = set(trusted_stats.items()) - set(test_stats.items())
-            for diff in diffs:
-                trusted_value = trusted_stats[diff[0]]
-                test_value = None
-                if diff[0] in test_stats.keys():
-                    test_value = test_stats[diff[0]]
-                err += f"{diff[0]}:\n"
-                err += (
-                    f"trusted_value: {trusted_value}, "
-                    + f"test_value: {test_value}"
+        diffs = []
+        for name, trusted_value in trusted_stats.items():
+            if name not in test_stats:
+                diffs.append(
+                    f"{name}: trusted_value: {trusted_value}, missing"
                 )
-            test_util.fail(err)
+            elif test_stats[name] != trusted_value:
+                diffs.append(
+                    f"{name}: trusted_value: {trusted_value}, "
+                    f"test_value: {test_stats[name]}"
+                )
+        return diffs
 
     def test(self, params):
-        trusted_file = open(self.truth_name)
+        test_name = self.test_name
         if self.test_name_in_outdir:
-            fixtures = params.fixtures
-            tempdir = fixtures[constants.tempdir_fixture_name].path
-            test_file = open(joinpath(tempdir, self.test_name))
-        else:
-            test_file = open(self.test_name)
+            tempdir = params.fixtures[constants.tempdir_fixture_name].path
+            test_name = joinpath(tempdir, test_name)
+
+        with open(self.truth_name) as trusted_file:
+            with open(test_name) as test_file:
+                diffs = self._compare_stats(trusted_file, test_file)
+        if diffs:
+            test_util.fail(
+                "Following differences found between "
+                f"{self.truth_name} and {test_name}.\n" + "\n".join(diffs)
+            )
+
+
+# Lines of a text stats file are "<name> <value> [<value> ...] # <desc>".
+_text_stats_begin = "---------- Begin Simulation Statistics"
+
+
+def _text_stats(f):
+    """
+    Yields a ``(dump, name, value)`` tuple for each numeric stat in a text
+    stats file, where ``dump`` counts the stats dumps in the file.
+    """
+    dump = -1
+    for line in f:
+        if line.startswith(_text_stats_begin):
+            dump += 1
+            continue
+        fields = line.split("#", 1)[0].split()
+        if len(fields) < 2:
+            continue
+        try:
+            value = float(fields[1])
+        except ValueError:
+            continue
+        yield max(dump, 0), fields[0], value
+
+
+# The tokens of a JSON document: punctuation, strings, numbers and literals.
+_json_punct, _json_string, _json_number, _json_literal = range(1, 5)
+_json_token_re = re.compile(
+    r"""\s*(?:([{}\[\]:,])|"((?:[^"\\]|\\.)*)"|"""
+    r"""(-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?)|"""
+    r"""(true|false|null|NaN|-?Infinity))"""
+)
+_json_literals = {
+    "NaN": math.nan,
+    "Infinity": math.inf,
+    "-Infinity": -math.inf,
+}
+
+
+def _json_tokens(f, chunk_size=1 << 20):
+    buf = ""
+    pos = 0
+    eof = False
+    while True:
+        m = _json_token_re.match(buf, pos)
+        # A token near the end of the buffer may continue in the next chunk
+        # (e.g., "1.5" may be the start of "1.5e3").
+        if m is None or (len(buf) - m.end() < 64 and not eof):
+            if eof:
+                if buf[pos:].strip():
+                    raise ValueError(f"Invalid JSON in {f.name}")
+                return
+            chunk = f.read(chunk_size)
+            buf = buf[pos:] + chunk
+            pos = 0
+            eof = not chunk
+            continue
+        pos = m.end()
+        yield m.lastindex, m.group(m.lastindex)
+
+
+def _json_stats(f):
+    """
+    Yields a ``(name, value)`` tuple for each number in a JSON document,
+    without loading the whole document. The name is the keys and list indices
+    leading to the value, joined by ``.``.
+    """
+    # For each enclosing object or list, its type and the current key or
+    # index.
+    stack = []
+    expect_key = False
+    for kind, token in _json_tokens(f):
+        if kind == _json_punct:
+            if token == "{":
+                stack.append(["{", None])
+                expect_key = True
+            elif token == "[":
+                stack.append(["[", 0])
+            elif token in "}]":
+                stack.pop()
+                expect_key = False
+            elif token == ",":
+                if stack[-1][0] == "[":
+                    stack[-1][1] += 1
+                else:
+                    expect_key = True
+            continue
+        if expect_key:
+            if "\\" in token:
+                token = json.loads(f'"{token}"')
+            stack[-1][1] = token
+            expect_key = False
+        elif kind == _json_number:
+            yield ".".join(str(key) for _, key in stack), float(token)
+        elif kind == _json_literal and token in _json_literals:
+            yield (
+                ".".join(str(key) for _, key in stack),
+                _json_literals[token],
+            )
+
 
-        return self._compare_stats(trusted_file, test_file)
+def _stat_name(key):
+    dump, name = key
+    return f"{name} (dump {dump})" if dump else name
 
 
 _re_type = type(re.compile(""))
@@ -0,0 +1,290 @@
+# Copyright (c) 2026 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import gzip
+import json
+import math
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from m5.ext.pystats import (
+    StatsTextFile,
+    Vector,
+    textloader,
+    write_seekable_gzip,
+)
+
+_NUM_DUMPS = 5
+
+
+def _dump(index: int) -> str:
+    """Returns the text of a stats dump, whose values depend on its index."""
+    return f"""
+---------- Begin Simulation Statistics ----------
+simSeconds                                   {index + 1}  # Simulated (Second)
+finalTick                                {1000 * (index + 1)}  # Ticks (Tick)
+system.cpu.ipc                                   {index}.5  # IPC ((Count/Cycle))
+system.cpu.op_class::IntAlu           {10 + index}     50.00%     50.00% # Class (Count)
+system.cpu.op_class::FloatAdd          {20 + index}     50.00%    100.00% # Class (Count)
+system.cpu.op_class::total                       {30 + 2 * index}  # Class (Count)
+system.cpu1.ipc                                  {index}.25  # IPC ((Count/Cycle))
+system.cpu.idle                                  nan  # Idle (Ratio)
+system.name                                   system  # Not a number
+system.cpu.op_classes                            {index}  # Not a vector element
+
+---------- End Simulation Statistics   ----------
+"""
+
+
+def _text(num_dumps: int = _NUM_DUMPS) -> str:
+    return "".join(_dump(i) for i in range(num_dumps))
+
+
+class StatsTextFileTestSuite(unittest.TestCase):
+    """Tests the indexed reading of text stats files."""
+
+    def setUp(self) -> None:
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.dir = Path(tmpdir.name)
+        self.plain = self.dir / "stats.txt"
+        self.plain.write_text(_text())
+        self.gzip = self.dir / "stats.txt.gz"
+        with gzip.open(self.gzip, "wb") as f:
+            f.write(_text().encode())
+        self.seekable = self.dir / "seekable.txt.gz"
+        with mock.patch.object(textloader, "_ACCESS_POINT_SPACING", 0):
+            write_seekable_gzip(self.plain, self.seekable)
+
+    def _files(self):
+        return {
+            "plain": self.plain,
+            "gzip": self.gzip,
+            "seekable": self.seekable,
+        }
+
+    def _check_dumps(self, stats: StatsTextFile, dumps) -> None:
+        values = stats.read_values(dumps=dumps)
+        indices = [dump % _NUM_DUMPS for dump in dumps]
+        self.assertEqual(
+            [1000 * (i + 1) for i in indices],
+            [v["finalTick"] for v in values],
+        )
+        self.assertEqual(
+            [10 + i for i in indices],
+            [v["system.cpu.op_class::IntAlu"] for v in values],
+        )
+
+    def test_index(self) -> None:
+        for kind, path in self._files().items():
+            with self.subTest(kind=kind):
+                stats = StatsTextFile(path)
+                self.assertEqual(_NUM_DUMPS, len(stats))
+                self.assertEqual(
+                    [1000 * (i + 1) for i in range(_NUM_DUMPS)],
+                    stats.get_final_ticks(),
+                )
+                self.assertEqual(2, stats.get_dump_at_tick(2500))
+                self.assertEqual(0, stats.get_dump_at_tick(0))
+                with self.assertRaises(IndexError):
+                    stats.get_dump_at_tick(_NUM_DUMPS * 1000 + 1)
+
+    def test_access_points(self) -> None:
+        self.assertEqual([], StatsTextFile(self.plain)._index["access_points"])
+        self.assertEqual(
+            1, len(StatsTextFile(self.gzip)._index["access_points"])
+        )
+        with mock.patch.object(textloader, "_ACCESS_POINT_SPACING", 0):
+            stats = StatsTextFile(self.seekable, cache_index=False)
+        # A member per window, after a member holding the text before the
+        # first window.
+        self.assertEqual(_NUM_DUMPS + 1, len(stats._index["access_points"]))
+
+    def test_seekable_gzip_contents(self) -> None:
+        with gzip.open(self.seekable, "rb") as f:
+            self.assertEqual(_text().encode(), f.read())
+        # A gzip file may also be rewritten.
+        output = self.dir / "rewritten.txt.gz"
+        write_seekable_gzip(self.gzip, output)
+        with gzip.open(output, "rb") as f:
+            self.assertEqual(_text().encode(), f.read())
+        with mock.patch.object(textloader, "_ACCESS_POINT_SPACING", 0):
+            stats = StatsTextFile(output, cache_index=False)
+        self.assertEqual(_NUM_DUMPS + 1, len(stats._index["access_points"]))
+
+    def test_read_all(self) -> None:
+        expected = StatsTextFile(self.plain).read_values()
+        self.assertEqual(_NUM_DUMPS, len(expected))
+        for kind, path in self._files().items():
+            with self.subTest(kind=kind):
+                values = StatsTextFile(path).read_values()
+                self.assertEqual(
+                    [
+                        {k: v for k, v in d.items() if not math.isnan(v)}
+                        for d in expected
+                    ],
+                    [
+                        {k: v for k, v in d.items() if not math.isnan(v)}
+                        for d in values
+                    ],
+                )
+                self.assertTrue(math.isnan(values[0]["system.cpu.idle"]))
+                self.assertNotIn("system.name", values[0])
+
+    def test_dump_indices(self) -> None:
+        for kind, path in self._files().items():
+            with self.subTest(kind=kind):
+                stats = StatsTextFile(path)
+                self._check_dumps(stats, [-1])
+                self._check_dumps(stats, [3, 0, -5, -2, 3])
+                for dump in (_NUM_DUMPS, -_NUM_DUMPS - 1):
+                    with self.assertRaises(IndexError):
+                        stats.read_values(dumps=[dump])
+
+    def test_small_chunks(self) -> None:
+        # Markers and finalTick lines split between chunks.
+        with mock.patch.multiple(
+            textloader, _CHUNK_SIZE=7, _GZIP_CHUNK_SIZE=5
+        ):
+            for kind, path in self._files().items():
+                with self.subTest(kind=kind):
+                    stats = StatsTextFile(path, cache_index=False)
+                    self.assertEqual(
+                        [1000 * (i + 1) for i in range(_NUM_DUMPS)],
+                        stats.get_final_ticks(),
+                    )
+                    self._check_dumps(stats, [4, 1, -3])
+
+    def test_vector_selection(self) -> None:
+        stats = StatsTextFile(self.plain)
+
+        (values,) = stats.read_values(dumps=[1], stats=["system.cpu.op_class"])
+        self.assertEqual(
+            {
+                "system.cpu.op_class::IntAlu": 11,
+                "system.cpu.op_class::FloatAdd": 21,
+                "system.cpu.op_class::total": 32,
+            },
+            values,
+        )
+
+        (values,) = stats.read_values(
+            dumps=[1], stats=["system.cpu.op_class::IntAlu"]
+        )
+        self.assertEqual({"system.cpu.op_class::IntAlu": 11}, values)
+
+    def test_glob_selection(self) -> None:
+        stats = StatsTextFile(self.gzip)
+
+        (values,) = stats.read_values(dumps=[2], stats=["system.cpu*.ipc"])
+        self.assertEqual(
+            {"system.cpu.ipc": 2.5, "system.cpu1.ipc": 2.25}, values
+        )
+
+        (values,) = stats.read_values(
+            dumps=[2], stats=["system.cpu.op_class::*Add", "finalTick"]
+        )
+        self.assertEqual(
+            {"finalTick": 3000, "system.cpu.op_class::FloatAdd": 22}, values
+        )
+
+    def test_simstats(self) -> None:
+        (simstat,) = StatsTextFile(self.seekable).read_simstats(
+            dumps=[-1], stats=["system.cpu.*"]
+        )
+
+        self.assertEqual(5000, simstat.simulated_end_time)
+        ipc = simstat.system.cpu.ipc
+        self.assertEqual(4.5, ipc.value)
+        self.assertEqual("IPC", ipc.description)
+        self.assertEqual("(Count/Cycle)", ipc.unit)
+        op_class = simstat.system.cpu.op_class
+        self.assertIsInstance(op_class, Vector)
+        self.assertEqual(14, op_class.value["IntAlu"].value)
+        self.assertEqual(24, op_class.value["FloatAdd"].value)
+
+    def test_incomplete_dump(self) -> None:
+        path = self.dir / "running.txt"
+        path.write_text(_text(2) + _dump(2).split("system.cpu.ipc")[0])
+
+        stats = StatsTextFile(path)
+        self.assertEqual(2, len(stats))
+        self.assertEqual([1000, 2000], stats.get_final_ticks())
+        self.assertEqual(2000, stats.read_values(dumps=[-1])[0]["finalTick"])
+
+    def test_index_cache(self) -> None:
+        index_path = self.dir / "stats.txt.index.json"
+        self.assertFalse(index_path.exists())
+
+        self.assertEqual(_NUM_DUMPS, len(StatsTextFile(self.plain)))
+        self.assertTrue(index_path.exists())
+        with mock.patch.object(
+            StatsTextFile, "_build_index", side_effect=AssertionError
+        ):
+            # The cached index is used while the file is unchanged.
+            self.assertEqual(_NUM_DUMPS, len(StatsTextFile(self.plain)))
+
+        # The index is rebuilt once the file changes.
+        with open(self.plain, "a") as f:
+            f.write(_dump(_NUM_DUMPS))
+        stats = StatsTextFile(self.plain)
+        self.assertEqual(_NUM_DUMPS + 1, len(stats))
+        self.assertEqual(
+            1000 * (_NUM_DUMPS + 1),
+            stats.read_values(dumps=[-1])[0]["finalTick"],
+        )
+        with open(index_path) as f:
+            self.assertEqual(_NUM_DUMPS + 1, len(json.load(f)["windows"]))
+
+        # As is an index of another version.
+        with open(index_path) as f:
+            index = json.load(f)
+        index["version"] = -1
+        index["windows"] = []
+        with open(index_path, "w") as f:
+            json.dump(index, f)
+        self.assertEqual(_NUM_DUMPS + 1, len(StatsTextFile(self.plain)))
+
+    def test_no_index_cache(self) -> None:
+        custom = self.dir / "custom.json"
+
+        StatsTextFile(self.gzip, cache_index=False)
+        self.assertFalse((self.dir / "stats.txt.gz.index.json").exists())
+        StatsTextFile(self.gzip, index_path=custom)
+        self.assertTrue(custom.exists())
+
+    def test_parallel(self) -> None:
+        for kind, path in self._files().items():
+            with self.subTest(kind=kind):
+                stats = StatsTextFile(path)
+                self.assertEqual(
+                    stats.read_values(dumps=[0, -1, 2], stats=["finalTick"]),
+                    stats.read_values(
+                        dumps=[0, -1, 2], stats=["finalTick"], jobs=2
+                    ),
+                )
@@ -0,0 +1,82 @@
+# Copyright (c) 2026 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import unittest
+
+from gem5.simulate.exit_event import ExitEvent
+
+
+class ExitEventTestSuite(unittest.TestCase):
+    """Tests the translation of exit strings in
+    gem5.simulate.exit_event."""
+
+    def test_get_exit_strings(self) -> None:
+        self.assertEqual(
+            [
+                "m5_exit instruction encountered",
+                "exiting with last active thread context",
+            ],
+            ExitEvent.get_exit_strings(ExitEvent.EXIT),
+        )
+        self.assertEqual(
+            ["a thread reached the max instruction count"],
+            ExitEvent.get_exit_strings(ExitEvent.MAX_INSTS),
+        )
+        self.assertEqual(
+            ["user interrupt received"],
+            ExitEvent.get_exit_strings(ExitEvent.USER_INTERRUPT),
+        )
+        # Spatter exits are only matched by their suffix.
+        self.assertEqual(
+            [], ExitEvent.get_exit_strings(ExitEvent.SPATTER_EXIT)
+        )
+
+    def test_round_trip(self) -> None:
+        for exit_event in ExitEvent:
+            for exit_string in ExitEvent.get_exit_strings(exit_event):
+                with self.subTest(exit_string=exit_string):
+                    self.assertEqual(
+                        exit_event,
+                        ExitEvent.translate_exit_status(exit_string),
+                    )
+
+    def test_translate_suffix(self) -> None:
+        self.assertEqual(
+            ExitEvent.EXIT,
+            ExitEvent.translate_exit_status(
+                "Traffic generator will terminate the simulation.\n"
+            ),
+        )
+        self.assertEqual(
+            ExitEvent.SPATTER_EXIT,
+            ExitEvent.translate_exit_status(
+                "Spatter core received all expected responses."
+            ),
+        )
+
+    def test_translate_unknown(self) -> None:
+        with self.assertRaises(NotImplementedError):
+            ExitEvent.translate_exit_status("an unknown exit string")
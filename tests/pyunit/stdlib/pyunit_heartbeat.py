@@ -0,0 +1,192 @@
+# Copyright (c) 2026 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+from gem5.simulate import heartbeat
+from gem5.simulate.heartbeat import Heartbeat
+
+
+class _Core:
+    """A stand-in for a core, with its committed instruction count."""
+
+    def __init__(self, insts: int):
+        self.insts = insts
+
+    def get_simobject(self):
+        return SimpleNamespace(totalInsts=lambda: self.insts)
+
+
+class _Processor:
+    """A stand-in for a processor."""
+
+    def __init__(self, cores):
+        self.cores = cores
+
+    def get_cores(self):
+        return self.cores
+
+
+class HeartbeatTestSuite(unittest.TestCase):
+    """Tests gem5.simulate.heartbeat.Heartbeat with a stubbed simulation
+    loop and host clock."""
+
+    def setUp(self) -> None:
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.path = Path(tmpdir.name) / "heartbeat.jsonl"
+
+        self.tick = 1000
+        self.now = 0.0
+        # The host seconds each call to `m5.simulate` takes.
+        self.seconds_per_simulate = 0.0
+
+        def simulate(ticks):
+            self.tick += ticks
+            self.now += self.seconds_per_simulate
+            return "exit event"
+
+        for patcher in (
+            mock.patch.object(
+                heartbeat,
+                "m5",
+                SimpleNamespace(curTick=lambda: self.tick, simulate=simulate),
+            ),
+            mock.patch.object(
+                heartbeat,
+                "time",
+                SimpleNamespace(
+                    monotonic=lambda: self.now, time=lambda: 1e9 + self.now
+                ),
+            ),
+            mock.patch.object(heartbeat, "_get_rss", lambda: 4096),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _records(self):
+        with open(self.path) as f:
+            return [json.loads(line) for line in f]
+
+    def test_interval_validation(self) -> None:
+        with self.assertRaises(ValueError):
+            Heartbeat(self.path)
+        with self.assertRaises(ValueError):
+            Heartbeat(self.path, host_interval=1.0, tick_interval=100)
+        with self.assertRaises(ValueError):
+            Heartbeat(self.path, host_interval=0.0)
+        with self.assertRaises(ValueError):
+            Heartbeat(self.path, tick_interval=-1)
+
+    def test_ticks_to_run_tick_interval(self) -> None:
+        beat = Heartbeat(self.path, tick_interval=500)
+
+        self.assertEqual(500, beat.get_ticks_to_run(10_000))
+        self.assertEqual(200, beat.get_ticks_to_run(200))
+        self.assertEqual("exit event", beat.simulate(300))
+        self.assertEqual(200, beat.get_ticks_to_run(10_000))
+        self.assertFalse(beat.is_due())
+        beat.simulate(200)
+        self.assertTrue(beat.is_due())
+        # At least one tick is always run.
+        self.assertEqual(1, beat.get_ticks_to_run(0))
+
+    def test_chunk_adaptation(self) -> None:
+        beat = Heartbeat(self.path, host_interval=1.0)
+        chunk = heartbeat._MIN_CHUNK_TICKS
+        self.assertEqual(chunk, beat.get_ticks_to_run(10**12))
+
+        # The simulation is much faster than the interval, but the chunk
+        # only grows by a bounded factor at once.
+        self.seconds_per_simulate = 0.001
+        beat.simulate(chunk)
+        chunk *= heartbeat._MAX_CHUNK_SCALE
+        self.assertEqual(chunk, beat.get_ticks_to_run(10**12))
+        self.assertEqual(500, beat.get_ticks_to_run(500))
+
+        # Running one chunk takes twice the interval, so it halves.
+        self.seconds_per_simulate = 2.0
+        beat.simulate(chunk)
+        self.assertEqual(chunk // 2, beat.get_ticks_to_run(10**12))
+        self.assertTrue(beat.is_due())
+
+        # The chunk never drops below the minimum.
+        self.seconds_per_simulate = 1000.0
+        for _ in range(4):
+            beat.simulate(beat.get_ticks_to_run(10**12))
+        self.assertEqual(
+            heartbeat._MIN_CHUNK_TICKS, beat.get_ticks_to_run(10**12)
+        )
+
+    def test_records(self) -> None:
+        beat = Heartbeat(self.path, tick_interval=1000)
+        cores = [_Core(0), _Core(0)]
+        processor = _Processor(cores)
+        beat.get_ticks_to_run(10_000)
+
+        self.seconds_per_simulate = 2.0
+        beat.simulate(1000)
+        cores[0].insts, cores[1].insts = 3000, 1000
+        self.now += 0.5
+        beat.beat(processor)
+
+        beat.simulate(1000)
+        cores[0].insts, cores[1].insts = 5000, 3000
+        beat.beat(processor)
+
+        # The cores are switched.
+        processor.cores = [_Core(100)]
+        beat.simulate(1000)
+        beat.beat(processor)
+
+        first, second, third = self._records()
+        self.assertEqual(
+            {
+                "host_time": 1e9 + 2.5,
+                "elapsed": 2.5,
+                "tick": 2000,
+                "insts": [3000, 1000],
+                "kips": 4000 / 2.5 / 1000,
+                "ticks_per_second": 1000 / 2.5,
+                "cxx_seconds": 2.0,
+                "python_seconds": 0.5,
+                "rss": 4096,
+            },
+            first,
+        )
+        self.assertEqual([5000, 3000], second["insts"])
+        self.assertEqual(4000 / 2.0 / 1000, second["kips"])
+        self.assertEqual(1000 / 2.0, second["ticks_per_second"])
+        self.assertEqual(4.0, second["cxx_seconds"])
+        self.assertEqual(0.5, second["python_seconds"])
+        self.assertEqual([100], third["insts"])
+        self.assertIsNone(third["kips"])
+        self.assertEqual(4000, third["tick"])
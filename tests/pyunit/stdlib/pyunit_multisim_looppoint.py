@@ -0,0 +1,292 @@
+# Copyright (c) 2026 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import unittest
+
+from gem5.utils.multisim import multisim
+from gem5.utils.multisim.looppoint import (
+    _default_region_cost,
+    _extrapolate,
+    add_looppoint_region_simulators,
+    extrapolate_looppoint_stats,
+    get_region_simulator_id,
+)
+
+
+class _Region:
+    """A stand-in for a LooppointRegion."""
+
+    def __init__(self, multiplier: float, warmup: bool):
+        self._multiplier = multiplier
+        self._warmup = warmup
+
+    def get_multiplier(self) -> float:
+        return self._multiplier
+
+    def get_warmup(self):
+        return object() if self._warmup else None
+
+
+class _Looppoint:
+    """A stand-in for a Looppoint."""
+
+    def __init__(self, regions):
+        self._regions = regions
+
+    def get_regions(self):
+        return self._regions
+
+
+class _Simulator:
+    """A stand-in for a Simulator."""
+
+    def __init__(self, stats=None):
+        self._id = None
+        self._stats = stats or {}
+
+    def get_id(self):
+        return self._id
+
+    def set_id(self, id):
+        self._id = id
+
+    def get_stats(self):
+        return self._stats
+
+
+def _scalar(value, unit="Count"):
+    return {"type": "Scalar", "value": value, "unit": unit}
+
+
+class LooppointRegionSchedulingTestSuite(unittest.TestCase):
+    """Tests the scheduling of LoopPoint region simulators in
+    gem5.utils.multisim.looppoint."""
+
+    def setUp(self) -> None:
+        self._saved = (
+            multisim.module_run,
+            set(multisim._multi_sim),
+            dict(multisim._priorities),
+            dict(multisim._on_complete),
+            dict(multisim._params),
+        )
+        multisim.module_run = True
+        multisim._multi_sim.clear()
+        multisim._priorities.clear()
+        multisim._on_complete.clear()
+        multisim._params.clear()
+
+    def tearDown(self) -> None:
+        (
+            multisim.module_run,
+            multi_sim,
+            priorities,
+            on_complete,
+            params,
+        ) = self._saved
+        multisim._multi_sim.clear()
+        multisim._multi_sim.update(multi_sim)
+        multisim._priorities.clear()
+        multisim._priorities.update(priorities)
+        multisim._on_complete.clear()
+        multisim._on_complete.update(on_complete)
+        multisim._params.clear()
+        multisim._params.update(params)
+
+    def _scheduled_ids(self):
+        return multisim._sort_by_priority(
+            [sim.get_id() for sim in multisim._multi_sim],
+            multisim._priorities,
+        )
+
+    def test_default_region_cost(self) -> None:
+        # A warmup doubles the cost. The multiplier only breaks ties.
+        self.assertGreater(
+            _default_region_cost(_Region(1.0, warmup=True)),
+            _default_region_cost(_Region(100.0, warmup=False)),
+        )
+        self.assertGreater(
+            _default_region_cost(_Region(5.0, warmup=False)),
+            _default_region_cost(_Region(2.0, warmup=False)),
+        )
+
+    def test_regions_scheduled_by_cost(self) -> None:
+        looppoint = _Looppoint(
+            {
+                1: _Region(2.0, warmup=False),
+                2: _Region(1.0, warmup=True),
+                3: _Region(5.0, warmup=False),
+                4: _Region(3.0, warmup=True),
+            }
+        )
+        add_looppoint_region_simulators(looppoint, lambda _: _Simulator())
+
+        self.assertEqual(
+            [get_region_simulator_id(region) for region in (4, 2, 3, 1)],
+            self._scheduled_ids(),
+        )
+
+    def test_custom_region_cost(self) -> None:
+        looppoint = _Looppoint(
+            {
+                "a": _Region(1.0, warmup=True),
+                "b": _Region(2.0, warmup=False),
+            }
+        )
+        add_looppoint_region_simulators(
+            looppoint,
+            lambda _: _Simulator(),
+            region_cost=lambda region: region.get_multiplier(),
+        )
+
+        self.assertEqual(["region_b", "region_a"], self._scheduled_ids())
+
+    def test_ties_ordered_by_id(self) -> None:
+        self.assertEqual(
+            ["c", "a", "b"],
+            multisim._sort_by_priority(["b", "a", "c"], {"c": 1.0}),
+        )
+
+    def test_on_complete_result(self) -> None:
+        stats = {"ipc": _scalar(1.5, "(Count/Cycle)")}
+        looppoint = _Looppoint({7: _Region(4.0, warmup=False)})
+        simulator = _Simulator(stats)
+        add_looppoint_region_simulators(looppoint, lambda _: simulator)
+
+        result = multisim._on_complete[simulator.get_id()](simulator)
+        self.assertEqual(
+            {"region_id": 7, "multiplier": 4.0, "stats": stats}, result
+        )
+
+
+class LooppointExtrapolationTestSuite(unittest.TestCase):
+    """Tests the extrapolation of LoopPoint statistics in
+    gem5.utils.multisim.looppoint."""
+
+    def test_counts_summed(self) -> None:
+        result = _extrapolate([_scalar(10), _scalar(20)], [2.0, 3.0])
+        self.assertEqual(_scalar(80.0), result)
+
+    def test_rates_averaged(self) -> None:
+        result = _extrapolate(
+            [_scalar(1.0, "(Count/Cycle)"), _scalar(2.0, "(Count/Cycle)")],
+            [1.0, 3.0],
+        )
+        self.assertAlmostEqual(1.75, result["value"])
+
+        result = _extrapolate(
+            [_scalar(0.5, "Ratio"), _scalar(1.0, "Ratio")], [1.0, 1.0]
+        )
+        self.assertAlmostEqual(0.75, result["value"])
+
+    def test_nested_groups(self) -> None:
+        region_stats = [
+            {
+                "type": "Group",
+                "cpu": {"type": "Group", "insts": _scalar(100)},
+                "name": "first",
+            },
+            {
+                "type": "Group",
+                "cpu": {"type": "Group", "insts": _scalar(300)},
+                "name": "second",
+            },
+        ]
+        result = _extrapolate(region_stats, [1.0, 0.5])
+
+        self.assertEqual(250.0, result["cpu"]["insts"]["value"])
+        # Non-numeric values are taken from the first region.
+        self.assertEqual("first", result["name"])
+        self.assertEqual("Group", result["type"])
+
+    def test_missing_stat_dropped(self) -> None:
+        region_stats = [
+            {"a": _scalar(1), "b": _scalar(2), "c": {"x": _scalar(1)}},
+            {"a": _scalar(3), "c": {}},
+        ]
+        result = _extrapolate(region_stats, [1.0, 1.0])
+
+        self.assertEqual({"a": _scalar(4.0), "c": {}}, result)
+
+    def test_distribution(self) -> None:
+        def distribution(low, high, samples):
+            return {
+                "type": "Distribution",
+                "value": {0: _scalar(samples), 1: _scalar(0)},
+                "min": low,
+                "max": high,
+                "num_bins": 2,
+                "bin_size": 10,
+                "sum": 5 * samples,
+                "sum_squared": 25 * samples,
+                "underflow": 1,
+                "overflow": 0,
+                "logs": 0.5,
+                "description": "A distribution",
+            }
+
+        result = _extrapolate(
+            [distribution(2, 8, 10), distribution(1, 6, 20)], [2.0, 1.0]
+        )
+
+        self.assertEqual(40.0, result["value"][0]["value"])
+        self.assertEqual(1, result["min"])
+        self.assertEqual(8, result["max"])
+        self.assertEqual(2, result["num_bins"])
+        self.assertEqual(10, result["bin_size"])
+        self.assertEqual(200.0, result["sum"])
+        self.assertEqual(1000.0, result["sum_squared"])
+        self.assertEqual(3.0, result["underflow"])
+        self.assertEqual(0.0, result["overflow"])
+        self.assertEqual(1.5, result["logs"])
+        self.assertEqual("A distribution", result["description"])
+
+    def test_non_numeric_scalar(self) -> None:
+        scalar = {"type": "Scalar", "value": "nan?", "unit": "Count"}
+        self.assertEqual(scalar, _extrapolate([scalar, scalar], [1.0, 2.0]))
+
+    def test_extrapolate_region_results(self) -> None:
+        results = {
+            "region_1": {
+                "region_id": 1,
+                "multiplier": 2.0,
+                "stats": {"insts": _scalar(5)},
+            },
+            "region_2": {
+                "region_id": 2,
+                "multiplier": 1.0,
+                "stats": {"insts": _scalar(7)},
+            },
+            # Results of other simulators are ignored.
+            "other": 42,
+        }
+        self.assertEqual(
+            17.0, extrapolate_looppoint_stats(results)["insts"]["value"]
+        )
+
+    def test_no_region_results(self) -> None:
+        with self.assertRaises(Exception):
+            extrapolate_looppoint_stats({"other": None})
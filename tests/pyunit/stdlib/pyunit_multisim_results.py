@@ -0,0 +1,203 @@
+# Copyright (c) 2026 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import json
+import math
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from gem5.utils.multisim import results
+
+
+def _stats(cycles, ipc):
+    """Statistics in the format returned by ``Simulator.get_stats``."""
+    return {
+        "type": "Group",
+        "simSeconds": {"type": "Scalar", "value": cycles * 1e-9, "unit": "s"},
+        "board": {
+            "type": "Group",
+            "cores": [
+                {"type": "Group", "ipc": {"type": "Scalar", "value": ipc}},
+                {"type": "Group", "ipc": {"type": "Scalar", "value": ipc / 2}},
+            ],
+            "name": "board",
+            "enabled": True,
+        },
+    }
+
+
+def _column(dataset, name):
+    """Returns a column of a dataset loaded as a dictionary or a pandas
+    DataFrame as a list. Missing values are None.
+    """
+    column = []
+    for value in list(dataset[name]):
+        if hasattr(value, "item"):
+            value = value.item()
+        if isinstance(value, float) and math.isnan(value):
+            value = None
+        column.append(value)
+    return column
+
+
+@unittest.skipUnless(results._have_numpy, "The datasets require numpy")
+class MultisimResultsTestSuite(unittest.TestCase):
+    """Tests the collection of MultiSim statistics into a dataset."""
+
+    def setUp(self) -> None:
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.dir = Path(tmpdir.name)
+        results.write_record(self.dir, "sim_b", {"l2": "1MiB"}, _stats(20, 2))
+        results.write_record(
+            self.dir, "sim_a", {"l2": "256KiB", "assoc": 4}, _stats(10, 1)
+        )
+
+    def _check_dataset(self, dataset) -> None:
+        self.assertEqual(["sim_a", "sim_b"], _column(dataset, "id"))
+        self.assertEqual(["256KiB", "1MiB"], _column(dataset, "param.l2"))
+        self.assertEqual([4, None], _column(dataset, "param.assoc"))
+        self.assertEqual([1e-8, 2e-8], _column(dataset, "simSeconds"))
+        self.assertEqual([1.0, 2.0], _column(dataset, "board.cores::0.ipc"))
+        self.assertEqual([0.5, 1.0], _column(dataset, "board.cores::1.ipc"))
+        self.assertNotIn("board.enabled", list(dataset.keys()))
+
+    def test_record(self) -> None:
+        path = results.write_record(
+            self.dir,
+            "sim_c",
+            {},
+            _stats(30, 3),
+            patterns=["board.cores::*.ipc"],
+        )
+
+        with open(path) as f:
+            record = json.load(f)
+        self.assertEqual(
+            {
+                "id": "sim_c",
+                "params": {},
+                "stats": {
+                    "board.cores::0.ipc": 3.0,
+                    "board.cores::1.ipc": 1.5,
+                },
+            },
+            record,
+        )
+
+    def test_npy(self) -> None:
+        path = results.merge_records(self.dir, format="npy")
+
+        self.assertEqual(self.dir / "values.npy", path)
+        self._check_dataset(results.load_results(self.dir))
+
+        dataset = results.load_results(self.dir, stats=["board.cores::1.ipc"])
+        self.assertEqual([0.5, 1.0], _column(dataset, "board.cores::1.ipc"))
+        self.assertNotIn("simSeconds", list(dataset.keys()))
+        self.assertEqual(["256KiB", "1MiB"], _column(dataset, "param.l2"))
+
+    def test_npy_missing_stats(self) -> None:
+        results.write_record(
+            self.dir,
+            "sim_c",
+            {},
+            _stats(30, 3),
+            patterns=["board.cores::0.ipc"],
+        )
+        results.merge_records(self.dir, format="npy")
+
+        dataset = results.load_results(self.dir)
+        self.assertEqual(
+            [1.0, 2.0, 3.0], _column(dataset, "board.cores::0.ipc")
+        )
+        # Stats which were not recorded are NaN.
+        self.assertIsNone(_column(dataset, "simSeconds")[2])
+        self.assertEqual([4, None, None], _column(dataset, "param.assoc"))
+
+    def test_record_replaced(self) -> None:
+        results.write_record(self.dir, "sim_a", {"l2": "512KiB"}, _stats(5, 4))
+        results.merge_records(self.dir, format="npy")
+
+        dataset = results.load_results(self.dir)
+        self.assertEqual(["512KiB", "1MiB"], _column(dataset, "param.l2"))
+        self.assertEqual([4.0, 2.0], _column(dataset, "board.cores::0.ipc"))
+
+    def test_merge_ids(self) -> None:
+        # A record left by an earlier run, of a simulator no longer run.
+        results.write_record(self.dir, "sim_old", {"l2": "2MiB"}, _stats(5, 4))
+        results.merge_records(
+            self.dir, format="npy", ids=["sim_b", "sim_a", "sim_failed"]
+        )
+        self._check_dataset(results.load_results(self.dir))
+
+        # Shared datasets include every record.
+        results.merge_records(self.dir, format="npy")
+        dataset = results.load_results(self.dir)
+        self.assertEqual(["sim_a", "sim_b", "sim_old"], _column(dataset, "id"))
+
+    @unittest.skipUnless(results._have_pyarrow, "Parquet requires pyarrow")
+    def test_parquet(self) -> None:
+        path = results.merge_records(self.dir, format="parquet")
+
+        self.assertEqual(self.dir / "results.parquet", path)
+        self._check_dataset(results.load_results(self.dir))
+
+        dataset = results.load_results(self.dir, stats=["simSeconds"])
+        self.assertEqual([1e-8, 2e-8], _column(dataset, "simSeconds"))
+        self.assertNotIn("board.cores::0.ipc", list(dataset.keys()))
+
+    def test_stale_parquet_ignored(self) -> None:
+        # A Parquet dataset written by an earlier run.
+        (self.dir / "results.parquet").write_bytes(b"PAR1 stale")
+        results.merge_records(self.dir, format="npy")
+
+        self.assertFalse((self.dir / "results.parquet").exists())
+        self._check_dataset(results.load_results(self.dir))
+
+    def test_newest_dataset_without_format(self) -> None:
+        results.merge_records(self.dir, format="npy")
+        os.remove(self.dir / "format.json")
+        stale = self.dir / "results.parquet"
+        stale.write_bytes(b"PAR1 stale")
+        os.utime(stale, ns=(0, 0))
+
+        self._check_dataset(results.load_results(self.dir))
+
+    def test_parquet_without_pyarrow(self) -> None:
+        with open(self.dir / "format.json", "w") as f:
+            json.dump({"format": "parquet"}, f)
+
+        with mock.patch.object(results, "_have_pyarrow", False):
+            with self.assertRaises(Exception) as context:
+                results.load_results(self.dir)
+        self.assertIn("pyarrow", str(context.exception))
+
+    def test_no_dataset(self) -> None:
+        with self.assertRaises(FileNotFoundError):
+            results.load_results(self.dir)
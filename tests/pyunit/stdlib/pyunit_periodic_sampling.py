@@ -0,0 +1,301 @@
+# Copyright (c) 2026 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import math
+import statistics
+import unittest
+from unittest import mock
+
+from gem5.simulate import periodic_sampling
+from gem5.simulate.periodic_sampling import (
+    PeriodicSampler,
+    SamplingEstimator,
+    _Phase,
+)
+
+
+class _Stat:
+    def __init__(self, value):
+        self.value = value
+
+
+class _Core:
+    """A stand-in for a core, whose stats are set by the test."""
+
+    def __init__(self):
+        self.stats = {"numCycles": 0, "numInsts": 0}
+
+    def get_simobject(self):
+        return self
+
+    def resolveStat(self, name):
+        return _Stat(self.stats[name])
+
+
+class _Processor:
+    """A stand-in for a SwitchableProcessor."""
+
+    def __init__(self, keys=("atomic", "o3"), num_cores=1):
+        self._switchable_cores = {
+            key: [_Core() for _ in range(num_cores)] for key in keys
+        }
+        self._current = keys[0]
+
+    def get_current_cores_key(self):
+        return self._current
+
+    def switch_to_processor(self, key):
+        self._current = key
+
+    def get_num_cores(self):
+        return len(self._switchable_cores[self._current])
+
+    def get_cores(self):
+        return self._switchable_cores[self._current]
+
+
+class SamplingEstimatorTestSuite(unittest.TestCase):
+    """Tests the estimate of the mean and its error."""
+
+    def test_no_samples(self) -> None:
+        estimator = SamplingEstimator()
+
+        self.assertEqual(0, estimator.get_count())
+        self.assertTrue(math.isnan(estimator.get_mean()))
+        self.assertTrue(math.isnan(estimator.get_stdev()))
+        self.assertEqual(math.inf, estimator.get_relative_error(0.997))
+
+    def test_one_sample(self) -> None:
+        estimator = SamplingEstimator()
+        estimator.add_sample(2.0)
+
+        self.assertEqual(2.0, estimator.get_mean())
+        self.assertTrue(math.isnan(estimator.get_stdev()))
+        self.assertEqual(math.inf, estimator.get_relative_error(0.997))
+
+    def test_mean_and_stdev(self) -> None:
+        samples = [1.2, 0.9, 1.5, 1.1, 1.3, 0.8]
+        estimator = SamplingEstimator()
+        for sample in samples:
+            estimator.add_sample(sample)
+
+        self.assertEqual(samples, estimator.get_samples())
+        self.assertAlmostEqual(statistics.mean(samples), estimator.get_mean())
+        self.assertAlmostEqual(
+            statistics.stdev(samples), estimator.get_stdev()
+        )
+
+    def test_relative_error(self) -> None:
+        samples = [2.0, 4.0, 3.0, 5.0]
+        estimator = SamplingEstimator()
+        for sample in samples:
+            estimator.add_sample(sample)
+
+        expected = (
+            statistics.NormalDist().inv_cdf(0.975)
+            * statistics.stdev(samples)
+            / (math.sqrt(len(samples)) * statistics.mean(samples))
+        )
+        self.assertAlmostEqual(expected, estimator.get_relative_error(0.95))
+        self.assertGreater(
+            estimator.get_relative_error(0.997),
+            estimator.get_relative_error(0.95),
+        )
+
+    def test_zero_mean(self) -> None:
+        estimator = SamplingEstimator()
+        estimator.add_sample(1.0)
+        estimator.add_sample(-1.0)
+
+        self.assertEqual(math.inf, estimator.get_relative_error(0.95))
+
+
+class PeriodicSamplerPhasesTestSuite(unittest.TestCase):
+    """Tests the phases of each period built by PeriodicSampler."""
+
+    def test_default_phases(self) -> None:
+        sampler = PeriodicSampler(
+            _Processor(),
+            period=1000,
+            measure_insts=10,
+            detailed_warmup_insts=5,
+        )
+
+        self.assertEqual(
+            [
+                _Phase("atomic", 985, False),
+                _Phase("o3", 5, False),
+                _Phase("o3", 10, True),
+            ],
+            sampler._phases,
+        )
+
+    def test_no_detailed_warmup(self) -> None:
+        sampler = PeriodicSampler(_Processor(), period=100, measure_insts=10)
+
+        self.assertEqual(
+            [_Phase("atomic", 90, False), _Phase("o3", 10, True)],
+            sampler._phases,
+        )
+
+    def test_fast_forward_phases(self) -> None:
+        processor = _Processor(keys=("kvm", "atomic", "o3"))
+        sampler = PeriodicSampler(
+            processor,
+            period=1000,
+            measure_insts=10,
+            detailed_warmup_insts=20,
+            functional_warming_insts=100,
+            detailed_cores="o3",
+            functional_cores="atomic",
+            fast_forward_cores="kvm",
+        )
+
+        self.assertEqual(
+            [
+                _Phase("kvm", 870, False),
+                _Phase("atomic", 100, False),
+                _Phase("o3", 20, False),
+                _Phase("o3", 10, True),
+            ],
+            sampler._phases,
+        )
+
+    def test_empty_phases_skipped(self) -> None:
+        processor = _Processor(keys=("kvm", "atomic", "o3"))
+        kwargs = {
+            "period": 100,
+            "measure_insts": 10,
+            "detailed_cores": "o3",
+            "functional_cores": "atomic",
+            "fast_forward_cores": "kvm",
+        }
+
+        self.assertEqual(
+            [_Phase("atomic", 90, False), _Phase("o3", 10, True)],
+            PeriodicSampler(processor, **kwargs)._phases,
+        )
+        self.assertEqual(
+            [_Phase("kvm", 90, False), _Phase("o3", 10, True)],
+            PeriodicSampler(
+                processor, functional_warming_insts=0, **kwargs
+            )._phases,
+        )
+
+    def test_invalid_schedules(self) -> None:
+        for kwargs in (
+            {"period": 100, "measure_insts": 0},
+            {"period": 100, "measure_insts": 10, "detailed_warmup_insts": -1},
+            {"period": 100, "measure_insts": 60, "detailed_warmup_insts": 40},
+            {
+                "period": 100,
+                "measure_insts": 10,
+                "functional_warming_insts": 91,
+            },
+            {"period": 100, "measure_insts": 10, "target_error": 0},
+        ):
+            with self.subTest(**kwargs):
+                with self.assertRaises(ValueError):
+                    PeriodicSampler(_Processor(), **kwargs)
+
+    def test_invalid_cores(self) -> None:
+        for keys, kwargs in (
+            (("kvm", "atomic", "o3"), {}),
+            (("atomic", "o3"), {"detailed_cores": "timing"}),
+            (("atomic", "o3"), {"functional_cores": "o3"}),
+            (("atomic", "o3"), {"detailed_cores": "atomic"}),
+        ):
+            with self.subTest(keys=keys, **kwargs):
+                with self.assertRaises(ValueError):
+                    PeriodicSampler(
+                        _Processor(keys),
+                        period=100,
+                        measure_insts=10,
+                        **kwargs
+                    )
+
+    def test_multiple_cores_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            PeriodicSampler(
+                _Processor(num_cores=2), period=100, measure_insts=10
+            )
+
+
+@mock.patch.object(periodic_sampling.m5.stats, "dump")
+@mock.patch.object(periodic_sampling.m5.stats, "reset")
+class PeriodicSamplerGeneratorTestSuite(unittest.TestCase):
+    """Tests the handling of the MAX_INSTS exits of each phase."""
+
+    def _run(self, sampler, processor, exits):
+        scheduled = []
+        sampler.start(scheduled.append, instantiated=False)
+        generator = sampler.generator()
+        results = []
+        for i in range(exits):
+            cores = processor.get_cores()
+            cores[0].stats = {"numCycles": 2 * (i + 1), "numInsts": i + 1}
+            results.append(next(generator))
+        return scheduled, results
+
+    def test_phases_cycled(self, reset, dump) -> None:
+        processor = _Processor()
+        sampler = PeriodicSampler(
+            processor, period=100, measure_insts=10, detailed_warmup_insts=5
+        )
+        scheduled, results = self._run(sampler, processor, 6)
+
+        self.assertEqual([85, 5, 10, 85, 5, 10, 85], scheduled)
+        self.assertEqual([False] * 6, results)
+        self.assertEqual(2, reset.call_count)
+        self.assertEqual(2, dump.call_count)
+        self.assertEqual([2.0, 2.0], sampler.get_estimator().get_samples())
+        self.assertEqual("atomic", processor.get_current_cores_key())
+
+    def test_max_samples(self, reset, dump) -> None:
+        processor = _Processor()
+        sampler = PeriodicSampler(
+            processor, period=100, measure_insts=10, max_samples=2
+        )
+        scheduled, results = self._run(sampler, processor, 5)
+
+        self.assertEqual([False, False, False, True, True], results)
+        self.assertEqual(2, sampler.get_estimator().get_count())
+
+    def test_converged(self, reset, dump) -> None:
+        processor = _Processor()
+        sampler = PeriodicSampler(
+            processor,
+            period=100,
+            measure_insts=10,
+            target_error=0.01,
+            min_samples=3,
+        )
+        # Every sample has a CPI of 2, so the error is 0 once there are
+        # min_samples samples.
+        scheduled, results = self._run(sampler, processor, 6)
+
+        self.assertEqual([False] * 5 + [True], results)
+        self.assertTrue(sampler.is_converged())
@@ -0,0 +1,69 @@
+# Copyright (c) 2026 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import unittest
+from unittest import mock
+
+from gem5.components.processors.switchable_processor import SwitchableProcessor
+from gem5.simulate.sampled_simulator import SampledSimulator
+
+
+def _board(processor):
+    board = mock.MagicMock()
+    board.get_processor.return_value = processor
+    return board
+
+
+class SampledSimulatorTestSuite(unittest.TestCase):
+    """Tests the processors accepted by the SampledSimulator."""
+
+    def _processor(self, num_cores):
+        processor = mock.MagicMock(spec=SwitchableProcessor)
+        processor.get_num_cores.return_value = num_cores
+        return processor
+
+    def test_multiple_cores_rejected(self) -> None:
+        for num_cores in (2, 4):
+            with self.subTest(num_cores=num_cores):
+                with self.assertRaises(ValueError):
+                    SampledSimulator(
+                        board=_board(self._processor(num_cores)),
+                        sample_points=[100],
+                        warmup_insts=10,
+                        measure_insts=10,
+                    )
+
+    def test_non_switchable_processor_rejected(self) -> None:
+        processor = mock.MagicMock()
+        processor.get_num_cores.return_value = 1
+
+        with self.assertRaises(Exception):
+            SampledSimulator(
+                board=_board(processor),
+                sample_points=[100],
+                warmup_insts=10,
+                measure_insts=10,
+            )
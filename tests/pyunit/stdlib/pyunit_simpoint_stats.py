@@ -0,0 +1,152 @@
+# Copyright (c) 2026 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import math
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from gem5.utils.simpoint_stats import (
+    SimpointStatsAggregator,
+    aggregate_simpoint_stats,
+)
+
+
+def _write_stats(path: Path, dumps) -> None:
+    with open(path, "w") as f:
+        for dump in dumps:
+            f.write("\n---------- Begin Simulation Statistics ----------\n")
+            for name, value in dump.items():
+                f.write(f"{name}    {value}    # A description (Count)\n")
+            f.write("\n---------- End Simulation Statistics   ----------\n")
+
+
+class SimpointStatsAggregatorTestSuite(unittest.TestCase):
+    """Tests gem5.utils.simpoint_stats.SimpointStatsAggregator."""
+
+    def test_weighted_mean(self) -> None:
+        aggregator = SimpointStatsAggregator()
+        aggregator.add_stats({"a": 1.0, "b": 4.0}, 0.25)
+        aggregator.add_stats({"a": 3.0}, 0.75)
+        results = aggregator.get_results()
+
+        self.assertAlmostEqual(2.5, results["a"].get_mean())
+        self.assertAlmostEqual(1.0, results["a"].get_weight())
+        # "b" is absent from the second SimPoint so only the first counts.
+        self.assertAlmostEqual(4.0, results["b"].get_mean())
+        self.assertAlmostEqual(0.25, results["b"].get_weight())
+        self.assertAlmostEqual(0.0, results["b"].get_std_dev())
+
+    def test_stats_added_later(self) -> None:
+        aggregator = SimpointStatsAggregator()
+        aggregator.add_stats({"a": 1.0}, 0.5)
+        aggregator.add_stats({"b": 2.0, "a": 3.0}, 0.25)
+        aggregator.add_stats({"c": 5.0, "b": 4.0}, 0.25)
+        results = aggregator.get_results()
+
+        self.assertAlmostEqual(5.0 / 3.0, results["a"].get_mean())
+        self.assertAlmostEqual(0.75, results["a"].get_weight())
+        self.assertAlmostEqual(3.0, results["b"].get_mean())
+        self.assertAlmostEqual(1.0, results["b"].get_std_dev())
+        self.assertAlmostEqual(5.0, results["c"].get_mean())
+
+    def test_only_nan(self) -> None:
+        aggregator = SimpointStatsAggregator()
+        aggregator.add_stats({"a": float("nan"), "b": 1.0}, 1.0)
+        result = aggregator.get_results()["a"]
+
+        self.assertTrue(math.isnan(result.get_mean()))
+        self.assertEqual(0.0, result.get_weight())
+
+    def test_variance_is_stable(self) -> None:
+        aggregator = SimpointStatsAggregator()
+        for value in (1e9 + 1, 1e9 + 3, 1e9 + 1, 1e9 + 3):
+            aggregator.add_stats({"a": value}, 0.25)
+        result = aggregator.get_results()["a"]
+
+        self.assertAlmostEqual(1e9 + 2, result.get_mean())
+        self.assertAlmostEqual(1.0, result.get_std_dev())
+
+    def test_nan_excluded(self) -> None:
+        aggregator = SimpointStatsAggregator()
+        aggregator.add_stats({"a": float("nan")}, 0.5)
+        aggregator.add_stats({"a": 2.0}, 0.5)
+        results = aggregator.get_results()
+
+        self.assertAlmostEqual(2.0, results["a"].get_mean())
+        self.assertAlmostEqual(0.5, results["a"].get_weight())
+
+    def test_confidence_interval(self) -> None:
+        aggregator = SimpointStatsAggregator()
+        aggregator.add_stats({"a": 1.0}, 0.5)
+        aggregator.add_stats({"a": 3.0}, 0.5)
+        low, high = aggregator.get_results()["a"].get_confidence_interval()
+
+        self.assertAlmostEqual(
+            1.0, aggregator.get_results()["a"].get_std_dev()
+        )
+        self.assertAlmostEqual(2.0, (low + high) / 2)
+        self.assertAlmostEqual(1.959964 / math.sqrt(2), high - 2.0, places=5)
+
+
+class AggregateSimpointStatsTestSuite(unittest.TestCase):
+    """Tests gem5.utils.simpoint_stats.aggregate_simpoint_stats."""
+
+    def setUp(self) -> None:
+        self.dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.dir)
+
+    def test_aggregate_last_dump(self) -> None:
+        outdirs = []
+        for index, value in enumerate([1, 3]):
+            outdir = self.dir / f"simpoint_{index}"
+            outdir.mkdir()
+            _write_stats(
+                outdir / "stats.txt",
+                [{"simInsts": 100, "ipc": 0}, {"simInsts": 10, "ipc": value}],
+            )
+            outdirs.append(outdir)
+
+        results = aggregate_simpoint_stats(outdirs, [0.5, 0.5])
+
+        self.assertAlmostEqual(2.0, results["ipc"].get_mean())
+        self.assertAlmostEqual(10.0, results["simInsts"].get_mean())
+
+    def test_aggregate_first_dump(self) -> None:
+        outdir = self.dir / "simpoint_0"
+        outdir.mkdir()
+        _write_stats(outdir / "stats.txt", [{"ipc": 1}, {"ipc": 2}])
+
+        results = aggregate_simpoint_stats([outdir], [1.0], dump_index=0)
+
+        self.assertAlmostEqual(1.0, results["ipc"].get_mean())
+
+    def test_mismatched_weights(self) -> None:
+        with self.assertRaises(ValueError):
+            aggregate_simpoint_stats([self.dir], [0.5, 0.5])
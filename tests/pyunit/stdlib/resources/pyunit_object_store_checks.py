@@ -0,0 +1,112 @@
+# Copyright (c) 2026 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from gem5.resources.md5_utils import md5
+from gem5.resources.object_store import ResourceObjectStore
+
+
+class ResourceObjectStoreTestSuite(unittest.TestCase):
+    """Test cases for gem5.resources.object_store.ResourceObjectStore"""
+
+    def setUp(self) -> None:
+        self.dir = Path(tempfile.mkdtemp())
+        self.store = ResourceObjectStore(self.dir / "objects")
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.dir)
+
+    def _create_file(self, name: str, content: str) -> Path:
+        path = self.dir / name
+        with open(path, "w") as f:
+            f.write(content)
+        return path
+
+    def test_add_file_links_to_object(self) -> None:
+        path = self._create_file("resource", "test content")
+        md5sum = md5(path)
+
+        self.store.add(path, md5sum)
+
+        self.assertTrue(self.store.contains(md5sum))
+        self.assertTrue(self.store.is_linked(md5sum, path))
+        self.assertEqual(2, os.stat(path).st_nlink)
+
+    def test_add_duplicate_shares_object(self) -> None:
+        first = self._create_file("first", "test content")
+        second = self._create_file("second", "test content")
+        md5sum = md5(first)
+
+        self.store.add(first, md5sum)
+        self.store.add(second, md5sum)
+
+        self.assertTrue(os.path.samefile(first, second))
+        self.assertEqual(1, len(list((self.dir / "objects").iterdir())))
+
+    def test_add_md5_mismatch(self) -> None:
+        path = self._create_file("resource", "test content")
+
+        with self.assertRaises(Exception):
+            self.store.add(path, "0" * 32)
+        self.assertTrue(path.exists())
+
+    def test_link_directory(self) -> None:
+        directory = self.dir / "resource_dir"
+        (directory / "subdir").mkdir(parents=True)
+        with open(directory / "subdir" / "file", "w") as f:
+            f.write("test content")
+        md5sum = md5(directory)
+
+        self.store.add(directory, md5sum)
+        self.store.link(md5sum, self.dir / "other_dir")
+
+        self.assertTrue(self.store.is_linked(md5sum, self.dir / "other_dir"))
+        self.assertEqual(md5sum, md5(self.dir / "other_dir"))
+
+    def test_collect_garbage(self) -> None:
+        kept = self._create_file("kept", "kept content")
+        removed = self._create_file("removed", "removed content")
+        kept_md5 = md5(kept)
+        removed_md5 = md5(removed)
+        self.store.add(kept, kept_md5)
+        self.store.add(removed, removed_md5)
+        os.remove(removed)
+
+        self.assertEqual(
+            [self.store.get_object_path(removed_md5)],
+            self.store.collect_garbage(dry_run=True),
+        )
+        self.assertTrue(self.store.contains(removed_md5))
+
+        self.store.collect_garbage()
+
+        self.assertFalse(self.store.contains(removed_md5))
+        self.assertTrue(self.store.contains(kept_md5))
@@ -0,0 +1,93 @@
+# Copyright (c) 2026 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from gem5.resources.simpoint_utils import (
+    compute_warmup,
+    load_simpoints_and_weights,
+)
+
+
+class SimpointUtilsTestSuite(unittest.TestCase):
+    """Test cases for gem5.resources.simpoint_utils"""
+
+    def setUp(self) -> None:
+        self.dir = Path(tempfile.mkdtemp())
+        self.simpoint_file = self.dir / "simpoints"
+        self.weight_file = self.dir / "weights"
+        with open(self.simpoint_file, "w") as f:
+            f.write("5 0\n1 1\n3 2\n")
+        with open(self.weight_file, "w") as f:
+            f.write("0.5 0\n0.2 1\n0.3 2\n")
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.dir)
+
+    def test_load_sorted(self) -> None:
+        simpoints, weights = load_simpoints_and_weights(
+            self.simpoint_file, self.weight_file
+        )
+        self.assertEqual([1, 3, 5], simpoints)
+        self.assertEqual([0.2, 0.3, 0.5], weights)
+
+    def test_load_cached(self) -> None:
+        cache = self.dir / "cache"
+        first = load_simpoints_and_weights(
+            self.simpoint_file, self.weight_file, cache_path=cache
+        )
+        self.assertTrue(cache.exists())
+        second = load_simpoints_and_weights(
+            self.simpoint_file, self.weight_file, cache_path=cache
+        )
+        self.assertEqual(first, second)
+
+    def test_cache_invalidated(self) -> None:
+        cache = self.dir / "cache"
+        load_simpoints_and_weights(
+            self.simpoint_file, self.weight_file, cache_path=cache
+        )
+        with open(self.simpoint_file, "w") as f:
+            f.write("7 0\n")
+        simpoints, weights = load_simpoints_and_weights(
+            self.simpoint_file, self.weight_file, cache_path=cache
+        )
+        self.assertEqual([7], simpoints)
+        self.assertEqual([0.5], weights)
+
+    def test_not_enough_weights(self) -> None:
+        with open(self.weight_file, "w") as f:
+            f.write("0.5 0\n")
+        with self.assertRaises(Exception):
+            load_simpoints_and_weights(self.simpoint_file, self.weight_file)
+
+    def test_compute_warmup(self) -> None:
+        start_insts, warmups = compute_warmup([100, 1000, 50], 200)
+        self.assertEqual([0, 800, 0], start_insts)
+        self.assertEqual([100, 200, 50], warmups)
@@ -0,0 +1,225 @@
+# Copyright (c) 2026 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import argparse
+import contextlib
+import gzip
+import importlib.util
+import io
+import tempfile
+import unittest
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+_path = Path(__file__).resolve().parents[3] / "util" / "checkpoint_pmem.py"
+
+
+def _load_checkpoint_pmem():
+    spec = importlib.util.spec_from_file_location("checkpoint_pmem", _path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+cp = _load_checkpoint_pmem() if np is not None else None
+
+_PAGE = 4096
+# A partial last page, which is zero padded in sparse images.
+_SIZE = 21 * _PAGE + 100
+
+
+def _memory(seed=0):
+    """Returns the contents of a memory with zero, duplicate and unique
+    pages.
+    """
+    rng = np.random.default_rng(seed)
+    memory = np.zeros(_SIZE, dtype=np.uint8)
+    page = rng.integers(0, 256, _PAGE, dtype=np.uint8)
+    for n in (1, 2, 7, 15):
+        memory[n * _PAGE : (n + 1) * _PAGE] = page
+    for n in (4, 5, 20):
+        memory[n * _PAGE : (n + 1) * _PAGE] = rng.integers(
+            0, 256, _PAGE, dtype=np.uint8
+        )
+    memory[21 * _PAGE :] = 0xAB
+    return memory
+
+
+@unittest.skipIf(np is None, "checkpoint_pmem.py requires numpy")
+class CheckpointPmemTestSuite(unittest.TestCase):
+    """Tests the conversion of checkpoint memory images between the dense and
+    sparse formats.
+    """
+
+    def setUp(self) -> None:
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.dir = Path(tmpdir.name)
+
+    def _checkpoint(self, name, memory):
+        """Writes a checkpoint with a dense, gzip compressed memory image."""
+        checkpoint = self.dir / name
+        checkpoint.mkdir()
+        with gzip.open(checkpoint / "board.physmem.store0.pmem", "wb") as f:
+            f.write(memory.tobytes())
+        (checkpoint / "m5.cpt").write_text(
+            "[Globals]\ncurTick=0\n\n"
+            "[board.physmem]\nnbr_of_stores=1\n\n"
+            "[board.physmem.store0]\nstore_id=0\n"
+            "filename=board.physmem.store0.pmem\n"
+            f"range_size={_SIZE}\n"
+        )
+        return checkpoint
+
+    def _image(self, checkpoint):
+        ((path, size),) = cp.get_memory_images(checkpoint)
+        return cp.open_image(path, size)
+
+    def _contents(self, image):
+        data = b"".join(chunk.tobytes() for _, chunk in image.chunks(3))
+        return data[: image.size]
+
+    def _convert(self, checkpoints, dense=False, store=None, output=None):
+        args = argparse.Namespace(
+            checkpoints=[str(c) for c in checkpoints],
+            dense=dense,
+            sparse=not dense,
+            store=store,
+            level=-1,
+            output=output,
+        )
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertEqual(0, cp._convert(args))
+
+    def _run(self, command, args):
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            return command(args), out.getvalue()
+
+    def test_round_trip_inline(self) -> None:
+        memory = _memory()
+        checkpoint = self._checkpoint("cpt", memory)
+
+        self._convert([checkpoint], output=str(self.dir / "sparse"))
+        sparse = self._image(self.dir / "sparse")
+        self.assertIsInstance(sparse, cp.SparseImage)
+        self.assertIsNone(sparse.store)
+        self.assertEqual([], sparse.check())
+        self.assertEqual([1, 2, 4, 5, 7, 15, 20, 21], sparse.pages.tolist())
+        # The four identical pages share a slot.
+        self.assertEqual(5, len(set(sparse.slots.tolist())))
+        self.assertEqual(memory.tobytes(), self._contents(sparse))
+
+        self._convert(
+            [self.dir / "sparse"], dense=True, output=str(self.dir / "dense")
+        )
+        dense = self._image(self.dir / "dense")
+        self.assertIsInstance(dense, cp.DenseImage)
+        with gzip.open(dense.path, "rb") as f:
+            self.assertEqual(memory.tobytes(), f.read())
+
+    def test_round_trip_store(self) -> None:
+        memories = [_memory(0), _memory(0)]
+        # The second checkpoint differs from the first in one page.
+        memories[1][9 * _PAGE + 10] = 1
+        checkpoints = [
+            self._checkpoint(f"cpt.{i}", memory)
+            for i, memory in enumerate(memories)
+        ]
+        store = self.dir / "pages"
+
+        self._convert(checkpoints, store=str(store))
+        images = [self._image(c) for c in checkpoints]
+        for image, memory in zip(images, memories):
+            self.assertIsNotNone(image.store)
+            self.assertEqual([], image.check())
+            self.assertEqual(memory.tobytes(), self._contents(image))
+        # The pages common to both images are stored once.
+        self.assertEqual(6, len(cp.PageStore(store)))
+        self.assertEqual([], images[0].store.verify(images[0].slots))
+
+        self.assertEqual([9], cp.diff_images(*images).tolist())
+        self.assertEqual(
+            [], cp.diff_images(images[0], self._image(checkpoints[0])).tolist()
+        )
+
+        self._convert(checkpoints, dense=True)
+        for checkpoint, memory in zip(checkpoints, memories):
+            image = self._image(checkpoint)
+            self.assertIsInstance(image, cp.DenseImage)
+            self.assertEqual(memory.tobytes(), self._contents(image))
+
+    def test_diff_dense_and_sparse(self) -> None:
+        memory = _memory()
+        changed = memory.copy()
+        changed[3 * _PAGE] = 1
+        changed[21 * _PAGE + 99] = 0
+        self._checkpoint("a", memory)
+        self._checkpoint("b", changed)
+        self._convert([self.dir / "b"], output=str(self.dir / "b.sparse"))
+
+        self.assertEqual(
+            [3, 21],
+            cp.diff_images(
+                self._image(self.dir / "a"), self._image(self.dir / "b.sparse")
+            ).tolist(),
+        )
+        args = argparse.Namespace(
+            a=str(self.dir / "a"), b=str(self.dir / "b.sparse"), max_ranges=20
+        )
+        result, out = self._run(cp._diff, args)
+        self.assertEqual(1, result)
+        self.assertIn("2 pages differ", out)
+
+        args.b = args.a
+        self.assertEqual(0, self._run(cp._diff, args)[0])
+
+    def test_verify(self) -> None:
+        checkpoint = self._checkpoint("cpt", _memory())
+        store = self.dir / "pages"
+        self._convert([checkpoint], store=str(store))
+        args = argparse.Namespace(checkpoints=[str(checkpoint)], hashes=True)
+
+        self.assertEqual(0, self._run(cp._verify, args)[0])
+
+        # Corrupt a page in the store.
+        with open(store / "pages.bin", "r+b") as f:
+            f.seek(_PAGE + 1)
+            f.write(b"\xff")
+        result, out = self._run(cp._verify, args)
+        self.assertEqual(1, result)
+        self.assertIn("1 pages do not match", out)
+
+        # A truncated dense image.
+        dense = self._checkpoint("dense", _memory())
+        image = dense / "board.physmem.store0.pmem"
+        with gzip.open(image, "wb") as f:
+            f.write(_memory().tobytes()[: 10 * _PAGE])
+        args = argparse.Namespace(checkpoints=[str(dense)], hashes=False)
+        self.assertEqual(1, self._run(cp._verify, args)[0])
@@ -0,0 +1,139 @@
+# Copyright (c) 2026 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# code_formatter is a build tool rather than part of the m5 package
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "build_tools"))
+
+from code_formatter import code_formatter
+
+_TEMPLATES = [
+    ("plain text, nothing to substitute", (), {}),
+    ("cost: $$5 and $$$name", (), {"name": "x"}),
+    ("$name ${name}suffix", (), {"name": "value"}),
+    ("$0, ${1} and $0", ("a", "b"), {}),
+    (
+        "sum: ${{a + b}}, join: ${{', '.join(items)}}",
+        (),
+        {
+            "a": 1,
+            "b": 2,
+            "items": ["x", "y"],
+        },
+    ),
+    ("${{ {'k': v}['k'] }}", (), {"v": 3}),
+    (
+        """
+{
+    $body
+}
+""",
+        (),
+        {"body": "first();\nsecond();\n"},
+    ),
+    (
+        """
+void f()
+{
+    ${{body}}
+    $$done
+}
+""",
+        (),
+        {"body": "one();"},
+    ),
+]
+
+
+class CodeFormatterTestSuite(unittest.TestCase):
+    """Tests that format strings compiled by code_formatter are substituted
+    exactly as they are by the uncompiled path."""
+
+    def _format(self, compiled, template, args, kwargs, indent=0):
+        f = code_formatter()
+        f.indent(indent)
+        if compiled:
+            f(template, *args, **kwargs)
+        else:
+            with mock.patch.object(
+                code_formatter, "_compile", return_value=None
+            ):
+                f(template, *args, **kwargs)
+        return str(f)
+
+    def test_compiled_matches_fallback(self) -> None:
+        for template, args, kwargs in _TEMPLATES:
+            for indent in (0, 1, 2):
+                with self.subTest(template=template, indent=indent):
+                    self.assertEqual(
+                        self._format(False, template, args, kwargs, indent),
+                        self._format(True, template, args, kwargs, indent),
+                    )
+
+    def test_expected_output(self) -> None:
+        self.assertEqual(
+            "cost: $5 and $x\n",
+            self._format(True, "cost: $$5 and $$$name", (), {"name": "x"}),
+        )
+        self.assertEqual(
+            "{\n    first();\n    second();\n}\n",
+            self._format(
+                True,
+                "{\n    $body\n}",
+                (),
+                {"body": "first();\nsecond();"},
+            ),
+        )
+        self.assertEqual(
+            "    sum: 3\n",
+            self._format(True, "sum: ${{a + b}}", (), {"a": 1, "b": 2}, 1),
+        )
+
+    def test_compiled_cached(self) -> None:
+        template = "cached: ${{a * 2}}"
+        self.assertEqual(
+            "cached: 4\n", self._format(True, template, (), {"a": 2})
+        )
+        self.assertIn(template, code_formatter._templates)
+        self.assertEqual(
+            "cached: 6\n", self._format(True, template, (), {"a": 3})
+        )
+
+    def test_invalid_format(self) -> None:
+        for compiled in (True, False):
+            with self.subTest(compiled=compiled):
+                with self.assertRaises(ValueError):
+                    self._format(compiled, "a\n$ b", (), {})
+
+    def test_missing_positional(self) -> None:
+        for compiled in (True, False):
+            with self.subTest(compiled=compiled):
+                with self.assertRaises((ValueError, IndexError)):
+                    self._format(compiled, "$0 $1", ("only",), {})
@@ -0,0 +1,172 @@
+# Copyright (c) 2026 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import importlib.util
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+# The result cache is part of the testlib tests rather than a package.
+_tests_dir = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(_tests_dir.parent / "ext"))
+_spec = importlib.util.spec_from_file_location(
+    "gem5_result_cache", _tests_dir / "gem5" / "result_cache.py"
+)
+result_cache = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(result_cache)
+
+
+class ResultCacheTestSuite(unittest.TestCase):
+    """Tests for the keys and entries of the gem5 test result cache."""
+
+    def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmpdir.cleanup)
+        self.base = Path(self._tmpdir.name)
+        self.cache = result_cache.ResultCache(str(self.base / "cache"))
+        self.gem5 = self._write("gem5.opt", "binary")
+        self.config = self._write("config.py", "print('config')")
+
+        patcher = mock.patch.object(
+            result_cache, "config", SimpleNamespace(base_dir=str(self.base))
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = mock.patch.dict(os.environ)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        for var in result_cache._resource_env_vars:
+            os.environ.pop(var, None)
+
+    def _write(self, name, contents):
+        path = self.base / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(contents)
+        return str(path)
+
+    def _key(self, gem5_args=(), config_args=()):
+        return self.cache.key(
+            self.gem5, self.config, list(gem5_args), list(config_args)
+        )
+
+    def _resource_log(self, *resources):
+        return self._write(
+            "resources.jsonl",
+            "".join(json.dumps(resource) + "\n" for resource in resources),
+        )
+
+    def test_key_is_stable(self):
+        key = self._key(config_args=["--cpu", "timing"])
+        self.assertIsNotNone(key)
+        self.assertEqual(key, self._key(config_args=["--cpu", "timing"]))
+        self.assertNotEqual(key, self._key(config_args=["--cpu", "atomic"]))
+        self.assertNotEqual(key, self._key(gem5_args=["--cpu", "timing"]))
+
+    def test_key_depends_on_file_contents(self):
+        binary = self._write("test.bin", "one")
+        key = self._key(config_args=[binary])
+        self._write("test.bin", "two")
+        self.assertNotEqual(key, self._key(config_args=[binary]))
+        self._write("config.py", "print('changed')")
+        self.assertNotEqual(key, self._key(config_args=[binary]))
+
+    def test_key_of_directory_is_its_path(self):
+        resource_dir = self.base / "resources"
+        resource_dir.mkdir()
+        key = self._key(config_args=[str(resource_dir)])
+        self._write("resources/downloaded", "resource")
+        self.assertEqual(key, self._key(config_args=[str(resource_dir)]))
+
+    def test_output_path_is_uncacheable(self):
+        output = str(self.base / "checkpoint")
+        self.assertIsNone(self._key(config_args=[output]))
+
+    def test_key_depends_on_resource_md5(self):
+        resource = {"id": "x", "resource_version": "1.0.0", "md5sum": "a"}
+        resource_json = self._write("resources.json", json.dumps([resource]))
+        os.environ["GEM5_RESOURCE_JSON"] = resource_json
+        key = self._key()
+
+        # Fields which don't identify the resource's files are ignored.
+        resource["description"] = "changed"
+        self._write("resources.json", json.dumps([resource]))
+        self.assertEqual(key, self._key())
+
+        resource["md5sum"] = "b"
+        self._write("resources.json", json.dumps([resource]))
+        self.assertNotEqual(key, self._key())
+
+    def test_store_and_restore(self):
+        key = self._key()
+        outdir = self._write("out/stats.txt", "stats")
+        outdir = os.path.dirname(outdir)
+        restored = self.base / "restored"
+
+        self.assertFalse(self.cache.restore(key, str(restored)))
+        self.assertTrue(self.cache.store(key, outdir))
+        self.assertTrue(self.cache.store(key, outdir))
+        self.assertTrue(self.cache.restore(key, str(restored)))
+        self.assertEqual((restored / "stats.txt").read_text(), "stats")
+        self.assertEqual(
+            os.listdir(os.path.dirname(self.cache.entry_path(key))), [key]
+        )
+
+    def test_store_without_resources(self):
+        key = self._key()
+        outdir = os.path.dirname(self._write("out/stats.txt", "stats"))
+        self.assertTrue(self.cache.store(key, outdir, self._resource_log()))
+        self.assertTrue(os.path.isdir(self.cache.entry_path(key)))
+
+    def test_store_rejects_remote_resources(self):
+        key = self._key()
+        outdir = os.path.dirname(self._write("out/stats.txt", "stats"))
+        log = self._resource_log(
+            {"id": "x", "resource_version": "2.0.0", "md5sum": "a"}
+        )
+        self.assertFalse(self.cache.store(key, outdir, log))
+        self.assertFalse(os.path.exists(self.cache.entry_path(key)))
+
+    def test_store_rejects_unreadable_log(self):
+        key = self._key()
+        outdir = os.path.dirname(self._write("out/stats.txt", "stats"))
+        log = str(self.base / "missing.jsonl")
+        self.assertFalse(self.cache.store(key, outdir, log))
+
+    def test_store_accepts_local_resources(self):
+        resource = {"id": "x", "resource_version": "1.0.0", "md5sum": "a"}
+        os.environ["GEM5_RESOURCE_JSON"] = self._write(
+            "resources.json", json.dumps([resource])
+        )
+        key = self._key()
+        outdir = os.path.dirname(self._write("out/stats.txt", "stats"))
+        log = self._resource_log(resource)
+        self.assertTrue(self.cache.store(key, outdir, log))
+        self.assertTrue(os.path.isdir(self.cache.entry_path(key)))
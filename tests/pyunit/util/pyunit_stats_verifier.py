@@ -0,0 +1,348 @@
+# Copyright (c) 2026 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import importlib.util
+import io
+import json
+import math
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# The verifiers are part of the testlib tests rather than a package.
+_tests_dir = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(_tests_dir.parent / "ext"))
+_spec = importlib.util.spec_from_file_location(
+    "gem5_verifier", _tests_dir / "gem5" / "verifier.py"
+)
+verifier = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(verifier)
+
+_json_document = """{
+    "system": {
+        "name": "sys\\"tem",
+        "cpu": {"numCycles": {"value": 12345, "unit": "Cycle"},
+                "ipc": {"value": 1.5e-3}, "idle": {"value": -2.25E+2}},
+        "mem": [1, 2.0, [3, {"value": NaN}], -Infinity],
+        "empty": {}, "none": null, "flag": true,
+        "op_class::IntAlu": 42
+    }
+}"""
+
+_json_expected = [
+    ("system.cpu.numCycles.value", 12345.0),
+    ("system.cpu.ipc.value", 1.5e-3),
+    ("system.cpu.idle.value", -225.0),
+    ("system.mem.0", 1.0),
+    ("system.mem.1", 2.0),
+    ("system.mem.2.0", 3.0),
+    ("system.mem.2.1.value", math.nan),
+    ("system.mem.3", -math.inf),
+    ("system.op_class::IntAlu", 42.0),
+]
+
+_text_document = """
+---------- Begin Simulation Statistics ----------
+simSeconds                                   0.001000  # Simulated (Second)
+system.cpu.numCycles                             1000  # Cycles (Cycle)
+system.cpu.op_class::IntAlu                 10   50.00%   50.00% # Op class
+system.cpu.ipc                                    nan  # IPC
+system.cpu.name                                  text  # Not a number
+---------- End Simulation Statistics   ----------
+
+---------- Begin Simulation Statistics ----------
+system.cpu.numCycles                             2000  # Cycles (Cycle)
+---------- End Simulation Statistics   ----------
+"""
+
+
+class _Reader(io.StringIO):
+    """A stream which returns at most ``limit`` characters per read, to
+    check tokens split between reads."""
+
+    name = "<test>"
+
+    def __init__(self, text, limit):
+        super().__init__(text)
+        self.limit = limit
+
+    def read(self, size=-1):
+        return super().read(self.limit)
+
+
+def _assert_stats_equal(test, expected, actual):
+    test.assertEqual([name for name, _ in expected], [n for n, _ in actual])
+    for (name, value), (_, other) in zip(expected, actual):
+        if math.isnan(value):
+            test.assertTrue(math.isnan(other), name)
+        else:
+            test.assertEqual(value, other, name)
+
+
+class JSONStatsReaderTestSuite(unittest.TestCase):
+    """Tests the incremental reading of JSON stats files."""
+
+    def test_tokens_independent_of_chunk_size(self) -> None:
+        expected = list(
+            verifier._json_tokens(io.StringIO(_json_document), 1 << 20)
+        )
+        for chunk_size in (1, 2, 3, 5, 7, 64, 65):
+            with self.subTest(chunk_size=chunk_size):
+                self.assertEqual(
+                    expected,
+                    list(
+                        verifier._json_tokens(
+                            io.StringIO(_json_document), chunk_size
+                        )
+                    ),
+                )
+
+    def test_short_reads(self) -> None:
+        # Reads may return fewer characters than requested.
+        for limit in (1, 2, 3):
+            with self.subTest(limit=limit):
+                _assert_stats_equal(
+                    self,
+                    _json_expected,
+                    list(verifier._json_stats(_Reader(_json_document, limit))),
+                )
+
+    def test_numbers_not_split(self) -> None:
+        # A number at the end of a chunk is only a token once it's known to
+        # have ended.
+        document = "[" + " " * 100 + "1.5e3, 12345678]"
+        for chunk_size in range(1, 8):
+            with self.subTest(chunk_size=chunk_size):
+                tokens = verifier._json_tokens(
+                    io.StringIO(document), chunk_size
+                )
+                numbers = [
+                    token
+                    for kind, token in tokens
+                    if kind == verifier._json_number
+                ]
+                self.assertEqual(["1.5e3", "12345678"], numbers)
+
+    def test_stat_names(self) -> None:
+        _assert_stats_equal(
+            self,
+            _json_expected,
+            list(verifier._json_stats(io.StringIO(_json_document))),
+        )
+
+    def test_escaped_keys(self) -> None:
+        document = json.dumps({'a"b': {"c\\d": 1}})
+        self.assertEqual(
+            [('a"b.c\\d', 1.0)],
+            list(verifier._json_stats(io.StringIO(document))),
+        )
+
+    def test_invalid(self) -> None:
+        with self.assertRaises(ValueError):
+            list(verifier._json_stats(_Reader('{"a": 1, ~}', 4)))
+
+
+class TextStatsReaderTestSuite(unittest.TestCase):
+    """Tests the reading of text stats files."""
+
+    def test_stats(self) -> None:
+        stats = list(verifier._text_stats(io.StringIO(_text_document)))
+
+        self.assertEqual(
+            [
+                (0, "simSeconds"),
+                (0, "system.cpu.numCycles"),
+                (0, "system.cpu.op_class::IntAlu"),
+                (0, "system.cpu.ipc"),
+                (1, "system.cpu.numCycles"),
+            ],
+            [(dump, name) for dump, name, _ in stats],
+        )
+        self.assertEqual(10.0, stats[2][2])
+        self.assertTrue(math.isnan(stats[3][2]))
+        self.assertEqual(2000.0, stats[4][2])
+
+
+class MatchStatsToleranceTestSuite(unittest.TestCase):
+    """Tests the comparison of stats files by MatchStatsTolerance."""
+
+    def setUp(self) -> None:
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmpdir.cleanup)
+
+    def _write(self, name, content):
+        path = os.path.join(self._tmpdir.name, name)
+        with open(path, "w") as f:
+            if isinstance(content, str):
+                f.write(content)
+            else:
+                json.dump(content, f)
+        return path
+
+    def _compare(self, reference, test, **kwargs):
+        suffix = ".txt" if isinstance(reference, str) else ".json"
+        return verifier.MatchStatsTolerance(
+            self._write("reference" + suffix, reference), **kwargs
+        ).compare(
+            os.path.join(self._tmpdir.name, "reference" + suffix),
+            self._write("test" + suffix, test),
+        )
+
+    def test_tolerance(self) -> None:
+        reference = {"a": 100.0, "b": 0.0}
+        test = {"a": 104.0, "b": 0.5}
+
+        self.assertEqual(2, len(self._compare(reference, test)))
+        self.assertEqual(
+            [], self._compare(reference, test, rel_tol=0.05, abs_tol=1.0)
+        )
+        mismatches = self._compare(
+            reference,
+            test,
+            rel_tol=0.05,
+            abs_tol=1.0,
+            tolerances={"a": (0, 0)},
+        )
+        self.assertEqual(1, len(mismatches))
+        self.assertTrue(mismatches[0].startswith("a: expected 100.0"))
+
+    def test_selected_stats(self) -> None:
+        reference = {"cpu": {"op::a": 1, "op::b": 2}, "other": 3}
+        test = {"cpu": {"op::a": 1, "op::b": 2}, "other": 4}
+
+        self.assertEqual([], self._compare(reference, test, stats=["cpu.*"]))
+        self.assertEqual(1, len(self._compare(reference, test)))
+
+    def test_order_independent(self) -> None:
+        reference = {str(i): i for i in range(50)}
+        test = {str(i): i for i in reversed(range(50))}
+
+        self.assertEqual([], self._compare(reference, test))
+
+    def test_missing_and_extra(self) -> None:
+        mismatches = self._compare({"a": 1, "b": 2}, {"a": 1, "c": 3})
+
+        self.assertEqual(["b: expected 2.0, but it is missing"], mismatches)
+
+    def test_max_mismatches(self) -> None:
+        reference = {str(i): i for i in range(20)}
+        test = {str(i): -i - 1 for i in range(20)}
+
+        self.assertEqual(
+            3, len(self._compare(reference, test, max_mismatches=3))
+        )
+
+    def test_text_dumps(self) -> None:
+        test = _text_document.replace("2000", "2001")
+
+        self.assertEqual([], self._compare(_text_document, _text_document))
+        self.assertEqual(
+            ["system.cpu.numCycles (dump 1): expected 2000.0, got 2001.0"],
+            self._compare(_text_document, test),
+        )
+
+
+_trusted_json = {
+    "simInsts": {"value": 12345, "unit": "Count", "type": "Scalar"},
+    "system": {"name": "system", "ipc": {"value": 1.5, "unit": "Ratio"}},
+}
+
+
+class MatchJSONStatsTestSuite(unittest.TestCase):
+    """Tests MatchJSONStats, which requires every top-level item of the
+    trusted stats to be equal in the test stats."""
+
+    def setUp(self) -> None:
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmpdir.cleanup)
+        self.truth = os.path.join(self._tmpdir.name, "trusted.json")
+        with open(self.truth, "w") as f:
+            json.dump(_trusted_json, f)
+
+    def _verifier(self, test_stats):
+        test = os.path.join(self._tmpdir.name, "test.json")
+        with open(test, "w") as f:
+            json.dump(test_stats, f)
+        return verifier.MatchJSONStats(self.truth, test)
+
+    def _compare(self, match):
+        with open(match.truth_name) as trusted_file:
+            with open(match.test_name) as test_file:
+                return match._compare_stats(trusted_file, test_file)
+
+    def _changed(self, change):
+        test_stats = json.loads(json.dumps(_trusted_json))
+        change(test_stats)
+        return self._verifier(test_stats)
+
+    def test_matching_stats_pass(self) -> None:
+        # The same stats, with extra stats in the test output.
+        match = self._changed(lambda stats: stats.update(extra=7))
+
+        self.assertEqual([], self._compare(match))
+        match.test(None)
+
+    def test_different_value_fails(self) -> None:
+        def change(stats):
+            stats["system"]["ipc"]["value"] = 1.25
+
+        match = self._changed(change)
+
+        diffs = self._compare(match)
+        self.assertEqual(1, len(diffs))
+        self.assertTrue(diffs[0].startswith("system: "))
+        with self.assertRaises(Exception):
+            match.test(None)
+
+    def test_different_unit_fails(self) -> None:
+        def change(stats):
+            stats["simInsts"]["unit"] = "Cycle"
+
+        match = self._changed(change)
+
+        self.assertEqual(
+            [
+                "simInsts: trusted_value: "
+                "{'value': 12345, 'unit': 'Count', 'type': 'Scalar'}, "
+                "test_value: "
+                "{'value': 12345, 'unit': 'Cycle', 'type': 'Scalar'}"
+            ],
+            self._compare(match),
+        )
+        with self.assertRaises(Exception):
+            match.test(None)
+
+    def test_missing_item_fails(self) -> None:
+        match = self._changed(lambda stats: stats.pop("system"))
+
+        self.assertEqual(
+            [f"system: trusted_value: {_trusted_json['system']}, missing"],
+            self._compare(match),
+        )
+        with self.assertRaises(Exception):
+            match.test(None)
@@ -0,0 +1,138 @@
+# Copyright (c) 2026 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import importlib.util
+import unittest
+from pathlib import Path
+
+# Load testlib's timing module on its own, as importing the testlib package
+# sets up the whole test framework.
+_spec = importlib.util.spec_from_file_location(
+    "testlib_timing",
+    Path(__file__).resolve().parents[3] / "ext" / "testlib" / "timing.py",
+)
+timing = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(timing)
+
+
+class _Suite:
+    """A stand-in for a testlib TestSuite."""
+
+    def __init__(self, uid):
+        self.uid = uid
+
+    def __repr__(self):
+        return f"_Suite({self.uid!r})"
+
+
+def _database(durations):
+    database = timing.TimingDatabase(None)
+    database.durations = dict(durations)
+    return database
+
+
+class TimingScheduleTestSuite(unittest.TestCase):
+    """Tests the ordering of suites by expected duration."""
+
+    def test_longest_first(self) -> None:
+        suites = [_Suite(uid) for uid in ("a", "b", "c")]
+        database = _database({"a": 1.0, "b": 3.0, "c": 2.0})
+
+        self.assertEqual(
+            ["b", "c", "a"],
+            [suite.uid for suite in timing.schedule(suites, database)],
+        )
+
+    def test_ties_ordered_by_uid(self) -> None:
+        suites = [_Suite(uid) for uid in ("c", "a", "b")]
+        database = _database({"a": 1.0, "b": 1.0, "c": 1.0})
+
+        self.assertEqual(
+            ["a", "b", "c"],
+            [suite.uid for suite in timing.schedule(suites, database)],
+        )
+
+    def test_unknown_suites_take_mean(self) -> None:
+        suites = [_Suite(uid) for uid in ("long", "new", "short")]
+        database = _database({"long": 5.0, "short": 1.0})
+
+        self.assertEqual(3.0, database.estimate("new"))
+        self.assertEqual(
+            ["long", "new", "short"],
+            [suite.uid for suite in timing.schedule(suites, database)],
+        )
+
+    def test_empty_database(self) -> None:
+        suites = [_Suite(uid) for uid in ("b", "a")]
+
+        self.assertEqual(
+            ["a", "b"],
+            [suite.uid for suite in timing.schedule(suites, _database({}))],
+        )
+
+
+class TimingShardTestSuite(unittest.TestCase):
+    """Tests the splitting of suites between shards."""
+
+    def setUp(self) -> None:
+        self.suites = [_Suite(f"tests/gem5/suite-{i}") for i in range(100)]
+
+    def test_shards_partition_suites(self) -> None:
+        for count in (1, 2, 3, 7):
+            with self.subTest(count=count):
+                shards = [
+                    timing.shard(self.suites, index, count)
+                    for index in range(1, count + 1)
+                ]
+                uids = [suite.uid for shard in shards for suite in shard]
+                self.assertEqual(len(self.suites), len(uids))
+                self.assertEqual(
+                    set(suite.uid for suite in self.suites), set(uids)
+                )
+
+    def test_single_shard(self) -> None:
+        self.assertEqual(self.suites, timing.shard(self.suites, 1, 1))
+
+    def test_shard_keeps_order(self) -> None:
+        selected = timing.shard(self.suites, 2, 4)
+        self.assertEqual(
+            [suite for suite in self.suites if suite in selected], selected
+        )
+
+    def test_independent_of_other_suites(self) -> None:
+        # A suite's shard doesn't depend on which other suites are run.
+        for suite in self.suites[:10]:
+            shard_of = [
+                index
+                for index in range(1, 5)
+                if suite in timing.shard(self.suites, index, 4)
+            ]
+            alone = [
+                index
+                for index in range(1, 5)
+                if timing.shard([suite], index, 4)
+            ]
+            self.assertEqual(shard_of, alone)
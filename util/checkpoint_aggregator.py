@@ -25,130 +25,207 @@
 # THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""
+Aggregate several (e.g., single-process SE mode) checkpoints into one
+checkpoint of a multi-process system.
+
+The CPUs of each checkpoint are renamed (``cpu`` becomes ``cpuN``) and the
+memory of each checkpoint, up to its ``pagePtr``, is placed after that of the
+previous checkpoints. The rest of the memory, up to ``--memory-size``, is
+zero.
+
+The memory images are read (and, for compressed output, compressed) by
+parallel worker processes. Uncompressed output is written in place by each
+worker and the zero-filled memory is left as a hole in a sparse file.
+Compressed output is written by each worker as a gzip member, and the
+members are then concatenated, which gem5 reads as one stream.
+"""
 
 import gzip
 import os
 import re
+import shutil
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from configparser import ConfigParser
 
+from checkpoint_pmem import open_image
+
+PAGE_SIZE = 1 << 12
+
+_MEMORY_SECTION = "system.physmem.store0"
+_MEMORY_FILE = "system.physmem.store0.pmem"
+
+# The size of the blocks of zeros written to fill compressed memory.
+_ZERO_BLOCK = 1 << 24
+
+_cpu_re = re.compile("cpu")
+_fdmap_re = re.compile("workload.FdMap256$")
+
 
 class myCP(ConfigParser):
     def __init__(self):
-        ConfigParser.__init__(self)
+        ConfigParser.__init__(self, interpolation=None)
 
     def optionxform(self, optionstr):
         return optionstr
 
 
-def aggregate(output_dir, cpts, no_compress, memory_size):
-    merged_config = None
-    page_ptr = 0
+def _copy_memory(cpt, range_size, pages, output, offset, compress):
+    """Copies the first ``pages`` pages of a checkpoint's memory to the
+    aggregated memory. Run in a worker process.
 
-    output_path = output_dir
-    if not os.path.isdir(output_path):
-        os.system("mkdir -p " + output_path)
+    :param output: The aggregated memory file if ``compress`` is false, in
+                   which case the pages are written at ``offset``. Otherwise
+                   a file to which the pages are written as a gzip member.
+    """
+    image = open_image(os.path.join(cpt, _MEMORY_FILE), range_size)
+    if compress:
+        with gzip.open(output, "wb", compresslevel=6) as f:
+            for _, chunk in image.chunks(num_pages=pages):
+                f.write(chunk)
+        return
 
-    agg_mem_file = open(output_path + "/system.physmem.store0.pmem", "wb+")
-    agg_config_file = open(output_path + "/m5.cpt", "wb+")
+    fd = os.open(output, os.O_WRONLY)
+    try:
+        for start, chunk in image.chunks(num_pages=pages):
+            # Zero chunks are left as holes in the file.
+            if chunk.any():
+                data = memoryview(chunk).cast("B")
+                position = offset + start * PAGE_SIZE
+                while data:
+                    written = os.pwrite(fd, data, position)
+                    data = data[written:]
+                    position += written
+    finally:
+        os.close(fd)
 
-    if not no_compress:
-        merged_mem = gzip.GzipFile(fileobj=agg_mem_file, mode="wb")
 
-    max_curtick = 0
+def _read_config(cpt):
+    config = myCP()
+    with open(os.path.join(cpt, "m5.cpt")) as f:
+        config.read_file(f)
+    return config
+
+
+def _write_sections(f, sections):
+    """Writes sections, a list of (name, {key: value}), in the m5.cpt
+    format.
+    """
+    f.write(
+        "".join(
+            f"[{name}]\n"
+            + "".join(f"{key}={value}\n" for key, value in items.items())
+            + "\n"
+            for name, items in sections
+        )
+    )
+
+
+def aggregate(output_dir, cpts, no_compress, memory_size, jobs=None):
     num_digits = len(str(len(cpts) - 1))
+    configs = [_read_config(cpt) for cpt in cpts]
+
+    # The pages of each checkpoint and where they are placed.
+    pages = [config.getint("system", "pagePtr") for config in configs]
+    page_offsets = [sum(pages[:i]) for i in range(len(pages))]
+    page_ptr = sum(pages)
+    for cpt, config, cpt_pages in zip(cpts, configs, pages):
+        range_size = config.getint(_MEMORY_SECTION, "range_size")
+        if cpt_pages * PAGE_SIZE > range_size:
+            raise ValueError(
+                f"'{cpt}' has a pagePtr of {cpt_pages}, but only "
+                f"{range_size // PAGE_SIZE} pages of memory."
+            )
 
-    for i, arg in enumerate(cpts):
-        print(arg)
-        merged_config = myCP()
-        config = myCP()
-        config.readfp(open(cpts[i] + "/m5.cpt"))
+    total_pages = page_ptr
+    if memory_size:
+        if memory_size < page_ptr * PAGE_SIZE:
+            raise ValueError(
+                f"The checkpoints use {page_ptr * PAGE_SIZE} bytes of "
+                f"memory, more than the memory size of {memory_size}."
+            )
+        total_pages = -(-memory_size // PAGE_SIZE)
 
+    os.makedirs(output_dir, exist_ok=True)
+    mem_path = os.path.join(output_dir, _MEMORY_FILE)
+
+    sections = []
+    max_curtick = 0
+    for i, config in enumerate(configs):
         for sec in config.sections():
-            if re.compile("cpu").search(sec):
-                newsec = re.sub("cpu", "cpu" + str(i).zfill(num_digits), sec)
-                merged_config.add_section(newsec)
-
-                items = config.items(sec)
-                for item in items:
-                    if item[0] == "paddr":
-                        merged_config.set(
-                            newsec, item[0], int(item[1]) + (page_ptr << 12)
-                        )
-                        continue
-                    merged_config.set(newsec, item[0], item[1])
-
-                if re.compile("workload.FdMap256$").search(sec):
-                    merged_config.set(newsec, "M5_pid", i)
-
-            elif sec == "system":
-                pass
+            if _cpu_re.search(sec):
+                items = dict(config.items(sec))
+                if "paddr" in items:
+                    items["paddr"] = int(items["paddr"]) + (
+                        page_offsets[i] * PAGE_SIZE
+                    )
+                if _fdmap_re.search(sec):
+                    items["M5_pid"] = i
+                sections.append(
+                    (_cpu_re.sub("cpu" + str(i).zfill(num_digits), sec), items)
+                )
             elif sec == "Globals":
-                tick = config.getint(sec, "curTick")
-                if tick > max_curtick:
-                    max_curtick = tick
-            else:
-                if i == len(cpts) - 1:
-                    merged_config.add_section(sec)
-                    for item in config.items(sec):
-                        merged_config.set(sec, item[0], item[1])
-
-        if i != len(cpts) - 1:
-            merged_config.write(agg_config_file)
-
-        ### memory stuff
-        pages = int(config.get("system", "pagePtr"))
-        page_ptr = page_ptr + pages
-        print("pages to be read: ", pages)
-
-        f = open(cpts[i] + "/system.physmem.store0.pmem", "rb")
-        gf = gzip.GzipFile(fileobj=f, mode="rb")
-
-        x = 0
-        while x < pages:
-            bytesRead = gf.read(1 << 12)
-            if not no_compress:
-                merged_mem.write(bytesRead)
-            else:
-                agg_mem_file.write(bytesRead)
-            x += 1
-
-        gf.close()
-        f.close()
-
-    merged_config.add_section("system")
-    merged_config.set("system", "pagePtr", page_ptr)
-    merged_config.set("system", "nextPID", len(cpts))
-
-    file_size = page_ptr * 4 * 1024
-    dummy_data = "".zfill(4096)
-    while file_size < memory_size:
-        if not no_compress:
-            merged_mem.write(dummy_data)
-        else:
-            agg_mem_file.write(dummy_data)
-        file_size += 4 * 1024
-        page_ptr += 1
+                max_curtick = max(max_curtick, config.getint(sec, "curTick"))
+            elif sec != "system" and i == len(cpts) - 1:
+                sections.append((sec, dict(config.items(sec))))
+
+    for name, items in sections:
+        if name == _MEMORY_SECTION:
+            items["range_size"] = total_pages * PAGE_SIZE
+    sections.append(("system", {"pagePtr": page_ptr, "nextPID": len(cpts)}))
+    sections.append(("Globals", {"curTick": max_curtick}))
+
+    compress = not no_compress
+    if compress:
+        parts = [f"{mem_path}.part{i}" for i in range(len(cpts))]
+    else:
+        # Sizing the file first leaves any memory not written as a hole.
+        with open(mem_path, "wb") as f:
+            f.truncate(total_pages * PAGE_SIZE)
+        parts = [mem_path] * len(cpts)
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = [
+            executor.submit(
+                _copy_memory,
+                cpt,
+                config.getint(_MEMORY_SECTION, "range_size"),
+                cpt_pages,
+                part,
+                offset * PAGE_SIZE,
+                compress,
+            )
+            for cpt, config, cpt_pages, part, offset in zip(
+                cpts, configs, pages, parts, page_offsets
+            )
+        ]
+        for cpt, cpt_pages, future in zip(cpts, pages, futures):
+            future.result()
+            print(f"{cpt}: {cpt_pages} pages")
+
+    if compress:
+        with open(mem_path, "wb") as f:
+            for part in parts:
+                with open(part, "rb") as p:
+                    shutil.copyfileobj(p, f, _ZERO_BLOCK)
+                os.remove(part)
+            fill = (total_pages - page_ptr) * PAGE_SIZE
+            if fill:
+                zeros = bytes(min(fill, _ZERO_BLOCK))
+                with gzip.GzipFile(fileobj=f, mode="wb") as gz:
+                    while fill:
+                        gz.write(zeros[: min(fill, len(zeros))])
+                        fill -= min(fill, len(zeros))
+
+    with open(os.path.join(output_dir, "m5.cpt"), "w") as f:
+        _write_sections(f, sections)
 
     print("WARNING: ")
     print(
         "Make sure the simulation using this checkpoint has at least ", end=" "
     )
-    print(page_ptr, "x 4K of memory")
-    merged_config.set(
-        "system.physmem.store0", "range_size", page_ptr * 4 * 1024
-    )
-
-    merged_config.add_section("Globals")
-    merged_config.set("Globals", "curTick", max_curtick)
-
-    merged_config.write(agg_config_file)
-
-    if not no_compress:
-        merged_mem.close()
-        agg_mem_file.close()
-    else:
-        agg_mem_file.close()
+    print(total_pages, "x 4K of memory")
 
 
 if __name__ == "__main__":
@@ -164,6 +241,14 @@ if __name__ == "__main__":
     parser.add_argument("-c", "--no-compress", action="store_true")
     parser.add_argument("--cpts", nargs="+")
     parser.add_argument("--memory-size", action="store", type=int)
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        action="store",
+        type=int,
+        help="The number of checkpoints to read at once. By default, the "
+        "number of host CPUs.",
+    )
 
     # Assume x86 ISA.  Any other ISAs would need extra stuff in this script
     # to appropriately parse their page tables and understand page sizes.
@@ -180,4 +265,5 @@ if __name__ == "__main__":
         options.cpts,
         options.no_compress,
         options.memory_size,
+        options.jobs,
     )
@@ -0,0 +1,677 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Tools for the memory images of gem5 checkpoints.
+
+A checkpoint holds one image per physical memory backing store (e.g.,
+``system.physmem.store0.pmem``), named in the ``filename`` entry of its
+``m5.cpt`` section. An image is either:
+
+* dense: the whole backing store, gzip compressed (or uncompressed). This is
+  the default written by gem5.
+* sparse: an index of the pages which are not all zero and their contents.
+  These are written by gem5 with ``m5.checkpoint(..., sparse_memory=True)``
+  and by this tool. The contents of the pages may be deduplicated into a
+  page store shared between checkpoints (e.g., the SimPoint checkpoints of
+  one workload), in which case the image only holds its index.
+
+gem5 restores both kinds of image. A sparse image which uses a page store
+refers to the store by its path relative to the image, so the store must be
+kept alongside the checkpoints.
+
+The format of a sparse image is documented in src/mem/physical.cc, which
+reads and writes them in gem5.
+
+A page store is a directory holding ``pages.bin``, the contents of each slot,
+and ``index.bin``, the 16-byte BLAKE2b digest of each slot.
+
+Usage:
+
+.. code-block:: sh
+
+    # Convert checkpoints to sparse images sharing a page store.
+    util/checkpoint_pmem.py convert --sparse --store cpts/pages cpts/cpt.*
+
+    # Convert a checkpoint back to dense images, e.g., for older gem5s.
+    util/checkpoint_pmem.py convert --dense -o cpt.dense cpt.sparse
+
+    # Compare the memory of two checkpoints.
+    util/checkpoint_pmem.py diff cpt.SimPoint0 cpt.SimPoint1
+
+    # Check that the memory images of checkpoints can be read.
+    util/checkpoint_pmem.py verify --hashes cpts/cpt.*
+
+The pages are processed in large chunks as numpy arrays. Sparse images and
+page stores are memory mapped, so only the pages in use are read.
+"""
+
+import argparse
+import configparser
+import fcntl
+import gzip
+import hashlib
+import mmap
+import os
+import shutil
+import struct
+import sys
+import tempfile
+from pathlib import Path
+from typing import (
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+import numpy as np
+
+MAGIC = b"GEM5SPM\0"
+VERSION = 1
+PAGE_SIZE = 4096
+
+# magic, version, page_size, num_pages, count, store_len
+_HEADER = struct.Struct("<8sIIQQI")
+
+_DIGEST_SIZE = 16
+
+# The number of pages processed at once.
+_CHUNK_PAGES = 4096
+
+
+def _align(value: int, align: int) -> int:
+    return (value + align - 1) // align * align
+
+
+def _digests(pages: np.ndarray) -> List[bytes]:
+    """Returns the digest of each page of a (pages, page_size) array."""
+    return [
+        hashlib.blake2b(page.data, digest_size=_DIGEST_SIZE).digest()
+        for page in pages
+    ]
+
+
+def _nonzero(pages: np.ndarray) -> np.ndarray:
+    """Returns a boolean array of whether each page is not all zero."""
+    return pages.view(np.uint64).any(axis=1)
+
+
+def _mmap(path: Path) -> Optional[mmap.mmap]:
+    """Memory maps a file read-only, or returns None if it is empty."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return None
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+class PageStore:
+    """A content-addressed store of pages, shared between sparse images."""
+
+    def __init__(self, directory: Path, page_size: int = PAGE_SIZE) -> None:
+        self._directory = Path(directory)
+        self._page_size = page_size
+        self._slots: Optional[Dict[bytes, int]] = None
+        self._data = None
+
+    def get_directory(self) -> Path:
+        return self._directory
+
+    def _pages_path(self) -> Path:
+        return self._directory / "pages.bin"
+
+    def _index_path(self) -> Path:
+        return self._directory / "index.bin"
+
+    def _load_digests(self) -> np.ndarray:
+        if not self._index_path().exists():
+            return np.empty((0, _DIGEST_SIZE), dtype=np.uint8)
+        raw = np.fromfile(self._index_path(), dtype=np.uint8)
+        return raw[: len(raw) - len(raw) % _DIGEST_SIZE].reshape(
+            -1, _DIGEST_SIZE
+        )
+
+    def __len__(self) -> int:
+        if not self._pages_path().exists():
+            return 0
+        return self._pages_path().stat().st_size // self._page_size
+
+    def add(self, pages: np.ndarray) -> np.ndarray:
+        """Adds pages to the store, returning the slot of each page. Pages
+        already in the store are not added again.
+
+        :param pages: A (pages, page_size) array of uint8.
+        """
+        self._directory.mkdir(parents=True, exist_ok=True)
+        slots = np.empty(len(pages), dtype=np.uint64)
+        with open(self._directory / "lock", "a") as lock:
+            # Other processes may add to the store concurrently.
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            count = len(self)
+            if self._slots is None or len(self._slots) != count:
+                digests = self._load_digests()[:count]
+                self._slots = {
+                    d.tobytes(): slot for slot, d in enumerate(digests)
+                }
+
+            new_pages = []
+            new_digests = []
+            for i, digest in enumerate(_digests(pages)):
+                slot = self._slots.get(digest)
+                if slot is None:
+                    slot = count + len(new_pages)
+                    self._slots[digest] = slot
+                    new_pages.append(i)
+                    new_digests.append(digest)
+                slots[i] = slot
+
+            if new_pages:
+                # The pages are written before their digests, so a digest
+                # is never present without its page.
+                with open(self._pages_path(), "ab") as f:
+                    f.truncate(count * self._page_size)
+                    f.write(pages[new_pages].tobytes())
+                with open(self._index_path(), "ab") as f:
+                    f.truncate(count * _DIGEST_SIZE)
+                    f.write(b"".join(new_digests))
+                self._data = None
+        return slots
+
+    def get_pages(self, slots: np.ndarray) -> np.ndarray:
+        """Returns the contents of the given slots as a (slots, page_size)
+        array.
+        """
+        if self._data is None or len(self._data) < len(self):
+            data = _mmap(self._pages_path())
+            self._data = (
+                np.frombuffer(data, dtype=np.uint8).reshape(
+                    -1, self._page_size
+                )
+                if data is not None
+                else np.empty((0, self._page_size), dtype=np.uint8)
+            )
+        return self._data[slots]
+
+    def verify(self, slots: np.ndarray) -> List[int]:
+        """Returns the slots, of those given, whose contents do not match
+        their digest.
+        """
+        digests = self._load_digests()
+        bad = []
+        slots = np.unique(slots)
+        for start in range(0, len(slots), _CHUNK_PAGES):
+            chunk = slots[start : start + _CHUNK_PAGES]
+            for slot, digest in zip(chunk, _digests(self.get_pages(chunk))):
+                if digests[slot].tobytes() != digest:
+                    bad.append(int(slot))
+        return bad
+
+
+class MemoryImage:
+    """A memory image, read in chunks of pages."""
+
+    def __init__(self, path: Path, size: int) -> None:
+        """
+        :param path: The path of the image.
+        :param size: The size of the backing store, in bytes.
+        """
+        self.path = Path(path)
+        self.size = size
+        self.page_size = PAGE_SIZE
+        self.num_pages = -(-size // PAGE_SIZE)
+
+    def chunks(
+        self, chunk_pages: int = _CHUNK_PAGES, num_pages: Optional[int] = None
+    ) -> Iterator[Tuple[int, np.ndarray]]:
+        """Yields the first page number and the contents, as a
+        (pages, page_size) array, of each chunk of the image in order.
+
+        :param num_pages: If set, only the first ``num_pages`` pages are
+                          read.
+        """
+        raise NotImplementedError
+
+    def _num_pages(self, num_pages: Optional[int]) -> int:
+        if num_pages is None:
+            return self.num_pages
+        if num_pages > self.num_pages:
+            raise ValueError(
+                f"'{self.path}' has {self.num_pages} pages, not {num_pages}."
+            )
+        return num_pages
+
+
+class DenseImage(MemoryImage):
+    """A dense (gzip compressed or uncompressed) memory image."""
+
+    def chunks(
+        self, chunk_pages: int = _CHUNK_PAGES, num_pages: Optional[int] = None
+    ):
+        num_pages = self._num_pages(num_pages)
+        # A partial last page is zero padded.
+        end = min(num_pages * self.page_size, self.size)
+        with open(self.path, "rb") as raw:
+            compressed = raw.read(2) == b"\x1f\x8b"
+            raw.seek(0)
+            f = gzip.GzipFile(fileobj=raw, mode="rb") if compressed else raw
+            for start in range(0, num_pages, chunk_pages):
+                count = min(chunk_pages, num_pages - start)
+                chunk = np.zeros((count, self.page_size), dtype=np.uint8)
+                # Read straight into the array.
+                view = memoryview(chunk).cast("B")
+                view = view[: end - start * self.page_size]
+                offset = 0
+                while offset < len(view):
+                    read = f.readinto(view[offset:])
+                    if not read:
+                        raise EOFError(
+                            f"'{self.path}' ends before the end of memory."
+                        )
+                    offset += read
+                yield start, chunk
+
+
+class SparseImage(MemoryImage):
+    """A sparse memory image."""
+
+    def __init__(self, path: Path, size: Optional[int] = None) -> None:
+        self._mmap = _mmap(Path(path))
+        if self._mmap is None or self._mmap[:8] != MAGIC:
+            raise ValueError(f"'{path}' is not a sparse memory image.")
+        (
+            _,
+            version,
+            page_size,
+            num_pages,
+            count,
+            store_len,
+        ) = _HEADER.unpack_from(self._mmap, 0)
+        if version != VERSION:
+            raise ValueError(
+                f"'{path}' has unsupported sparse image version {version}."
+            )
+        super().__init__(path, num_pages * page_size if size is None else size)
+        self.page_size = page_size
+        self.num_pages = -(-self.size // page_size)
+        if self.num_pages != num_pages:
+            raise ValueError(
+                f"'{path}' has {num_pages} pages, but the memory has "
+                f"{self.num_pages}."
+            )
+
+        store = self._mmap[_HEADER.size : _HEADER.size + store_len]
+        index = _align(_HEADER.size + store_len, 8)
+        self.pages = np.frombuffer(
+            self._mmap, dtype="<u8", count=count, offset=index
+        )
+        self.slots = np.frombuffer(
+            self._mmap, dtype="<u8", count=count, offset=index + 8 * count
+        )
+        self.store: Optional[PageStore] = None
+        if store:
+            self.store = PageStore(
+                self.path.parent / store.decode(), page_size
+            )
+            self._data = None
+        else:
+            data = _align(index + 16 * count, page_size)
+            self._data = np.frombuffer(
+                self._mmap, dtype=np.uint8, offset=data
+            )[: (len(self._mmap) - data) // page_size * page_size].reshape(
+                -1, page_size
+            )
+
+    def get_pages(self, slots: np.ndarray) -> np.ndarray:
+        if self.store is not None:
+            return self.store.get_pages(slots)
+        return self._data[slots]
+
+    def chunks(
+        self, chunk_pages: int = _CHUNK_PAGES, num_pages: Optional[int] = None
+    ):
+        num_pages = self._num_pages(num_pages)
+        for start in range(0, num_pages, chunk_pages):
+            count = min(chunk_pages, num_pages - start)
+            chunk = np.zeros((count, self.page_size), dtype=np.uint8)
+            lo, hi = np.searchsorted(self.pages, [start, start + count])
+            if hi > lo:
+                chunk[self.pages[lo:hi] - start] = self.get_pages(
+                    self.slots[lo:hi]
+                )
+            yield start, chunk
+
+    def check(self) -> List[str]:
+        """Returns the problems with the image's index."""
+        problems = []
+        if len(self.pages) and (
+            np.any(np.diff(self.pages.astype(np.int64)) <= 0)
+            or self.pages[-1] >= self.num_pages
+        ):
+            problems.append("the page numbers are not ascending and in range")
+        slots = len(self.store) if self.store else len(self._data)
+        if len(self.slots) and self.slots.max() >= slots:
+            problems.append(f"a slot is beyond the {slots} available")
+        return problems
+
+
+def open_image(path: Path, size: int) -> MemoryImage:
+    """Opens a dense or sparse memory image."""
+    with open(path, "rb") as f:
+        sparse = f.read(len(MAGIC)) == MAGIC
+    return SparseImage(path, size) if sparse else DenseImage(path, size)
+
+
+def write_sparse(
+    path: Path,
+    image: MemoryImage,
+    store: Optional[PageStore] = None,
+) -> None:
+    """Writes a memory image as a sparse image. Identical pages are stored
+    once.
+
+    :param store: If set, the pages are added to this store rather than
+                  written to the image.
+    """
+    page_size = image.page_size
+    pages = []
+    slots = []
+    data = tempfile.TemporaryFile(dir=Path(path).parent)
+    inline: Dict[bytes, int] = {}
+    for start, chunk in image.chunks():
+        nonzero = np.flatnonzero(_nonzero(chunk))
+        if not len(nonzero):
+            continue
+        pages.append(nonzero.astype(np.uint64) + start)
+        if store is not None:
+            slots.append(store.add(chunk[nonzero]))
+            continue
+        chunk_slots = np.empty(len(nonzero), dtype=np.uint64)
+        for i, digest in enumerate(_digests(chunk[nonzero])):
+            slot = inline.get(digest)
+            if slot is None:
+                slot = inline[digest] = len(inline)
+                data.write(chunk[nonzero[i]].tobytes())
+            chunk_slots[i] = slot
+        slots.append(chunk_slots)
+
+    pages = np.concatenate(pages) if pages else np.empty(0, np.uint64)
+    slots = np.concatenate(slots) if slots else np.empty(0, np.uint64)
+    store_path = (
+        os.path.relpath(store.get_directory(), Path(path).parent).encode()
+        if store is not None
+        else b""
+    )
+
+    with open(path, "wb") as f:
+        f.write(
+            _HEADER.pack(
+                MAGIC,
+                VERSION,
+                page_size,
+                image.num_pages,
+                len(pages),
+                len(store_path),
+            )
+        )
+        f.write(store_path)
+        f.write(b"\0" * (_align(f.tell(), 8) - f.tell()))
+        f.write(pages.astype("<u8").tobytes())
+        f.write(slots.astype("<u8").tobytes())
+        if store is None:
+            f.write(b"\0" * (_align(f.tell(), page_size) - f.tell()))
+            data.seek(0)
+            shutil.copyfileobj(data, f, 1 << 24)
+    data.close()
+
+
+def write_dense(path: Path, image: MemoryImage, level: int = -1) -> None:
+    """Writes a memory image as a dense image.
+
+    :param level: The gzip compression level. 0 writes the image
+                  uncompressed and -1 uses the default level.
+    """
+    with open(path, "wb") as raw:
+        if level:
+            # -1 is zlib's default level, as used by gem5.
+            f = gzip.GzipFile(
+                fileobj=raw, mode="wb", compresslevel=6 if level < 0 else level
+            )
+        else:
+            f = raw
+        remaining = image.size
+        for _, chunk in image.chunks():
+            data = memoryview(chunk).cast("B")[:remaining]
+            f.write(data)
+            remaining -= len(data)
+        if f is not raw:
+            f.close()
+
+
+def get_memory_images(checkpoint: Path) -> List[Tuple[Path, int]]:
+    """Returns the path and size of each memory image of a checkpoint."""
+    config = configparser.ConfigParser(interpolation=None, strict=False)
+    config.optionxform = str
+    config.read(Path(checkpoint) / "m5.cpt")
+    images = []
+    for section in config.sections():
+        if config.has_option(section, "filename") and config.has_option(
+            section, "range_size"
+        ):
+            images.append(
+                (
+                    Path(checkpoint) / config.get(section, "filename"),
+                    config.getint(section, "range_size"),
+                )
+            )
+    if not images:
+        raise ValueError(f"'{checkpoint}' has no memory images.")
+    return images
+
+
+def diff_images(a: MemoryImage, b: MemoryImage) -> np.ndarray:
+    """Returns the numbers of the pages which differ between two images."""
+    if a.num_pages != b.num_pages:
+        raise ValueError(f"'{a.path}' and '{b.path}' are of different sizes.")
+    if (
+        isinstance(a, SparseImage)
+        and isinstance(b, SparseImage)
+        and a.store is not None
+        and b.store is not None
+        and a.store.get_directory().resolve()
+        == b.store.get_directory().resolve()
+    ):
+        # Pages in the same store are equal if and only if they have the
+        # same slot, so only the indices need to be compared.
+        pages = np.union1d(a.pages, b.pages)
+        slots = []
+        for image in (a, b):
+            page_slots = np.full(len(pages), -1, dtype=np.int64)
+            page_slots[np.searchsorted(pages, image.pages)] = image.slots
+            slots.append(page_slots)
+        return pages[slots[0] != slots[1]]
+
+    differ = []
+    for (start, chunk_a), (_, chunk_b) in zip(a.chunks(), b.chunks()):
+        differ.append(np.flatnonzero((chunk_a != chunk_b).any(axis=1)) + start)
+    return np.concatenate(differ) if differ else np.empty(0, np.int64)
+
+
+def _page_ranges(pages: np.ndarray) -> List[Tuple[int, int]]:
+    """Returns the inclusive ranges of consecutive page numbers."""
+    if not len(pages):
+        return []
+    breaks = np.flatnonzero(np.diff(pages) != 1)
+    starts = np.concatenate(([0], breaks + 1))
+    ends = np.concatenate((breaks, [len(pages) - 1]))
+    return [(int(pages[s]), int(pages[e])) for s, e in zip(starts, ends)]
+
+
+def _convert(args) -> int:
+    store = PageStore(args.store) if args.store else None
+    for checkpoint in args.checkpoints:
+        checkpoint = Path(checkpoint)
+        output = checkpoint
+        if args.output:
+            output = Path(args.output)
+            if len(args.checkpoints) > 1:
+                output = output / checkpoint.name
+            shutil.copytree(
+                checkpoint,
+                output,
+                dirs_exist_ok=True,
+                ignore=shutil.ignore_patterns(
+                    *(p.name for p, _ in get_memory_images(checkpoint))
+                ),
+            )
+        for path, size in get_memory_images(checkpoint):
+            image = open_image(path, size)
+            target = output / path.name
+            tmp = target.with_name(target.name + ".tmp")
+            if args.dense:
+                write_dense(tmp, image, args.level)
+            else:
+                write_sparse(tmp, image, store)
+            os.replace(tmp, target)
+            print(f"{path} -> {target}")
+    return 0
+
+
+def _diff(args) -> int:
+    images_a = get_memory_images(Path(args.a))
+    images_b = get_memory_images(Path(args.b))
+    if len(images_a) != len(images_b):
+        print("The checkpoints have different numbers of memory images.")
+        return 1
+    differ = False
+    for (path_a, size_a), (path_b, size_b) in zip(images_a, images_b):
+        pages = diff_images(
+            open_image(path_a, size_a), open_image(path_b, size_b)
+        )
+        print(f"{path_a.name}: {len(pages)} pages differ")
+        for first, last in _page_ranges(pages)[: args.max_ranges]:
+            print(f"  {first * PAGE_SIZE:#x}-{(last + 1) * PAGE_SIZE - 1:#x}")
+        differ = differ or len(pages) > 0
+    return 1 if differ else 0
+
+
+def _verify(args) -> int:
+    failed = False
+    for checkpoint in args.checkpoints:
+        for path, size in get_memory_images(Path(checkpoint)):
+            problems = []
+            kind = "dense"
+            try:
+                image = open_image(path, size)
+                if isinstance(image, SparseImage):
+                    kind = "sparse"
+                    problems = image.check()
+                    if not problems and args.hashes and image.store:
+                        bad = image.store.verify(image.slots)
+                        if bad:
+                            problems.append(
+                                f"{len(bad)} pages do not match their "
+                                "digests in the page store"
+                            )
+                else:
+                    for _ in image.chunks():
+                        pass
+            except (OSError, ValueError, EOFError) as e:
+                problems.append(str(e))
+            if problems:
+                failed = True
+                print(f"{path}: FAILED: {'; '.join(problems)}")
+            else:
+                print(f"{path}: OK ({kind})")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Convert, compare and verify the memory images of gem5 "
+        "checkpoints."
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    convert = subparsers.add_parser(
+        "convert", help="Convert memory images to sparse or dense images."
+    )
+    kind = convert.add_mutually_exclusive_group(required=True)
+    kind.add_argument("--sparse", action="store_true")
+    kind.add_argument("--dense", action="store_true")
+    convert.add_argument(
+        "--store",
+        type=str,
+        help="The page store shared by the sparse images. If not set, each "
+        "sparse image holds its own pages.",
+    )
+    convert.add_argument(
+        "--level",
+        type=int,
+        default=-1,
+        help="The gzip compression level of dense images (0 for "
+        "uncompressed).",
+    )
+    convert.add_argument(
+        "-o",
+        "--output",
+        type=str,
+        help="Write the converted checkpoint(s) to this directory rather "
+        "than converting them in place.",
+    )
+    convert.add_argument("checkpoints", nargs="+")
+
+    diff = subparsers.add_parser(
+        "diff", help="List the pages which differ between two checkpoints."
+    )
+    diff.add_argument("a")
+    diff.add_argument("b")
+    diff.add_argument(
+        "--max-ranges",
+        type=int,
+        default=20,
+        help="The maximum number of differing address ranges to print.",
+    )
+
+    verify = subparsers.add_parser(
+        "verify", help="Check that memory images can be read."
+    )
+    verify.add_argument(
+        "--hashes",
+        action="store_true",
+        help="Also check the contents of pages in page stores.",
+    )
+    verify.add_argument("checkpoints", nargs="+")
+
+    args = parser.parse_args()
+    if args.command == "convert" and args.store and args.dense:
+        parser.error("--store is only used with --sparse.")
+    sys.exit(
+        {"convert": _convert, "diff": _diff, "verify": _verify}[args.command](
+            args
+        )
+    )
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Generate the zlib dictionary shared by the embedded Python modules.
+
+Embedded modules are marshalled code objects, which are largely made up of
+the names of variables, attributes and functions. Each module is compressed
+separately, so these names would otherwise be repeated in every compressed
+module. The dictionary lists the names used by the most modules, with the
+most common names last as zlib encodes those with the shortest distances.
+
+    util/gen_python_zdict.py [-n NAMES] > src/python/embedded_python.zdict
+"""
+
+import argparse
+import collections
+import os
+import sys
+import types
+
+gem5_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def code_names(code):
+    """All of the names and identifier-like strings in a code object."""
+    names = set(code.co_names + code.co_varnames + code.co_freevars)
+    names.add(code.co_name)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names |= code_names(const)
+        elif isinstance(const, str) and const.isidentifier():
+            names.add(const)
+    return names
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "-n",
+        "--names",
+        type=int,
+        default=1500,
+        help="Number of names in the dictionary (default: 1500)",
+    )
+    args = parser.parse_args()
+
+    counts = collections.Counter()
+    python_dir = os.path.join(gem5_root, "src", "python")
+    for root, dirs, files in os.walk(python_dir):
+        dirs.sort()
+        for name in sorted(files):
+            if not name.endswith(".py"):
+                continue
+            path = os.path.join(root, name)
+            with open(path) as f:
+                code = compile(f.read(), path, "exec")
+            counts.update(code_names(code))
+
+    # Sort by count, then name, so the output is deterministic
+    common = sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+    names = [name for name, _ in common[: args.names]]
+    sys.stdout.write("\n".join(reversed(names)) + "\n")
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Time the ISA parser on the in-tree ISA descriptions.
+
+Each parse is run in a fresh interpreter, as the parser only parses a given
+ISA description once per process. The generated files are written to a
+temporary directory.
+
+    util/isa_parser_bench.py [-n REPEAT] [ISA ...]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+gem5_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+isas = ["arm", "mips", "power", "riscv", "sparc", "x86"]
+
+
+def parse_once(isa, output_dir):
+    """Parse the description of an ISA in this process, returning the time
+    taken by parse_isa_desc."""
+    sys.path[0:0] = [
+        os.path.join(gem5_root, "src", "arch"),
+        os.path.join(gem5_root, "build_tools"),
+        os.path.join(gem5_root, "ext", "ply"),
+    ]
+    import isa_parser
+
+    desc = os.path.join(gem5_root, "src", "arch", isa, "isa", "main.isa")
+    parser = isa_parser.ISAParser(output_dir)
+    start = time.perf_counter()
+    parser.parse_isa_desc(desc)
+    return time.perf_counter() - start
+
+
+def parse(isa):
+    with tempfile.TemporaryDirectory() as output_dir:
+        output = subprocess.run(
+            [sys.executable, __file__, "--single", isa, output_dir],
+            cwd=gem5_root,
+            check=True,
+            stdout=subprocess.PIPE,
+            text=True,
+        ).stdout
+    # The parser may print warnings, the time is on the last line
+    return float(output.splitlines()[-1])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Time parse_isa_desc for the in-tree ISAs."
+    )
+    parser.add_argument(
+        "isas",
+        nargs="*",
+        default=isas,
+        metavar="ISA",
+        help=f"ISAs to parse, default all of: {', '.join(isas)}",
+    )
+    parser.add_argument(
+        "-n",
+        "--repeat",
+        type=int,
+        default=3,
+        help="Number of times each ISA is parsed (default: 3)",
+    )
+    parser.add_argument("--single", nargs=2, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.single:
+        # The ISA descriptions use paths relative to the gem5 root
+        os.chdir(gem5_root)
+        print(parse_once(*args.single))
+        sys.exit(0)
+
+    for isa in args.isas:
+        if isa not in isas:
+            parser.error(f"unknown ISA '{isa}', expected one of {isas}")
+
+    print(f"{'ISA':<8}{'min (s)':>10}{'mean (s)':>10}{'max (s)':>10}")
+    total = 0.0
+    for isa in args.isas:
+        times = [parse(isa) for _ in range(args.repeat)]
+        total += min(times)
+        print(
+            f"{isa:<8}{min(times):>10.3f}{sum(times) / len(times):>10.3f}"
+            f"{max(times):>10.3f}"
+        )
+    print(f"{'total':<8}{total:>10.3f}")